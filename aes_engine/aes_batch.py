@@ -0,0 +1,132 @@
+# aes_engine/aes_batch.py
+
+import numpy as np
+from .utils import gmul
+
+# Layout state tetap column-major seperti engine skalar: byte ke-k = state[r][c] dengan k = r + 4*c.
+# Indeks gather untuk ShiftRows: state[r][c] <- state[r][(c + r) % 4]
+SHIFT_ROWS = np.array([r + 4 * ((c + r) % 4) for c in range(4) for r in range(4)], dtype=np.intp)
+# Inverse ShiftRows: state[r][c] <- state[r][(c - r) % 4]
+INV_SHIFT_ROWS = np.array([r + 4 * ((c - r) % 4) for c in range(4) for r in range(4)], dtype=np.intp)
+# Rotasi baris dalam satu kolom: state[r][c] <- state[(r + k) % 4][c]
+ROTATE_1 = np.array([(r + 1) % 4 + 4 * c for c in range(4) for r in range(4)], dtype=np.intp)
+ROTATE_2 = np.array([(r + 2) % 4 + 4 * c for c in range(4) for r in range(4)], dtype=np.intp)
+
+def _mul_table(factor):
+    """Tabel perkalian GF(2^8) dengan konstanta `factor` untuk semua byte 0-255."""
+    return np.array([gmul(factor, x) for x in range(256)], dtype=np.uint8)
+
+MUL2 = _mul_table(0x02)
+MUL4 = _mul_table(0x04)
+
+
+def as_blocks(data):
+    """
+    Mengubah buffer (bytes, bytearray, memoryview, array NumPy) menjadi
+    array uint8 berbentuk (N, 16) tanpa menyalin jika memungkinkan.
+    """
+    if isinstance(data, np.ndarray):
+        arr = data.reshape(-1).view(np.uint8)
+    else:
+        arr = np.frombuffer(data, dtype=np.uint8)
+    if arr.size % 16 != 0:
+        raise ValueError("Panjang data harus kelipatan 16 byte.")
+    return arr.reshape(-1, 16)
+
+
+class AESBatch:
+    def __init__(self, engine):
+        """
+        Engine AES tervektorisasi (NumPy) yang memproses banyak blok sekaligus.
+        Memakai round key dan S-box dari engine skalar `AES`/`AESSbox44`,
+        sehingga hasilnya identik dengan `encrypt_block`/`decrypt_block`.
+
+        Semua operasi besar (take, bitwise_xor) ditulis ke buffer yang sudah
+        dialokasikan lewat parameter `out=`, sehingga NumPy melepas GIL selama
+        kernel berjalan dan beberapa thread bisa mengenkripsi secara paralel.
+        """
+        self.sbox = np.array(engine.sbox, dtype=np.uint8)
+        self.inv_sbox = np.array(engine.inv_sbox, dtype=np.uint8)
+        self.round_keys = np.array(engine.round_keys, dtype=np.uint8)  # (11, 16)
+
+    @staticmethod
+    def _prepare(blocks, out):
+        """Salin input ke buffer state (`out` jika diberikan) dan siapkan buffer kerja."""
+        src = as_blocks(blocks)
+        if out is None:
+            state = src.copy()
+        else:
+            state = as_blocks(out)
+            if state.shape != src.shape:
+                raise ValueError("Output buffer harus berukuran sama dengan input.")
+            if state.ctypes.data != src.ctypes.data:
+                np.copyto(state, src)
+        return state, np.empty_like(state), np.empty_like(state)
+
+    @staticmethod
+    def _mix_columns(state, tmp, tmp2):
+        """
+        MixColumns in-place pada `state`:
+        a_r' = a_r ^ (a0 ^ a1 ^ a2 ^ a3) ^ xtime(a_r ^ a_(r+1))
+        """
+        np.take(state, ROTATE_1, axis=1, out=tmp)
+        np.bitwise_xor(tmp, state, out=tmp)                 # a_r ^ a_(r+1)
+        np.take(MUL2, tmp, out=tmp2)                        # xtime(...)
+        cols = state.reshape(-1, 4, 4)
+        total = np.bitwise_xor.reduce(cols, axis=2, keepdims=True)
+        np.bitwise_xor(cols, total, out=cols)
+        np.bitwise_xor(state, tmp2, out=state)
+
+    @staticmethod
+    def _inv_mix_columns(state, tmp, tmp2):
+        """
+        InvMixColumns = MixColumns setelah pra-proses
+        a_r ^= xtime(xtime(a_r ^ a_(r+2))) (lihat "The Design of Rijndael", 4.1.3).
+        """
+        np.take(state, ROTATE_2, axis=1, out=tmp)
+        np.bitwise_xor(tmp, state, out=tmp)
+        np.take(MUL4, tmp, out=tmp2)
+        np.bitwise_xor(state, tmp2, out=state)
+        AESBatch._mix_columns(state, tmp, tmp2)
+
+    def encrypt_blocks(self, blocks, out=None):
+        """
+        Enkripsi banyak blok sekaligus.
+        :param blocks: buffer/array dengan panjang kelipatan 16 byte
+        :param out: buffer writable opsional (ukuran sama) untuk hasil; boleh sama dengan input
+        :return: array uint8 (N, 16) berisi ciphertext
+        """
+        state, tmp, tmp2 = self._prepare(blocks, out)
+        np.bitwise_xor(state, self.round_keys[0], out=state)
+
+        for round in range(1, 10):
+            # ShiftRows (gather indeks) lalu SubBytes (lookup tabel)
+            np.take(state, SHIFT_ROWS, axis=1, out=tmp)
+            np.take(self.sbox, tmp, out=state)
+            self._mix_columns(state, tmp, tmp2)
+            np.bitwise_xor(state, self.round_keys[round], out=state)
+
+        np.take(state, SHIFT_ROWS, axis=1, out=tmp)
+        np.take(self.sbox, tmp, out=state)
+        np.bitwise_xor(state, self.round_keys[10], out=state)
+        return state
+
+    def decrypt_blocks(self, blocks, out=None):
+        """
+        Dekripsi banyak blok sekaligus.
+        :param out: buffer writable opsional (ukuran sama) untuk hasil; boleh sama dengan input
+        :return: array uint8 (N, 16) berisi plaintext
+        """
+        state, tmp, tmp2 = self._prepare(blocks, out)
+        np.bitwise_xor(state, self.round_keys[10], out=state)
+        np.take(state, INV_SHIFT_ROWS, axis=1, out=tmp)
+        np.take(self.inv_sbox, tmp, out=state)
+
+        for round in range(9, 0, -1):
+            np.bitwise_xor(state, self.round_keys[round], out=state)
+            self._inv_mix_columns(state, tmp, tmp2)
+            np.take(state, INV_SHIFT_ROWS, axis=1, out=tmp)
+            np.take(self.inv_sbox, tmp, out=state)
+
+        np.bitwise_xor(state, self.round_keys[0], out=state)
+        return state
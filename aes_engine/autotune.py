@@ -0,0 +1,137 @@
+# aes_engine/autotune.py
+"""
+Autotune engine AES untuk mesin saat ini.
+
+Menjalankan microbenchmark singkat pada jalur scalar, batch, thread dan
+process, lalu menyimpan chunk size, jumlah worker, dan titik crossover
+terbaik ke file tuning (lihat aes_engine/tuning.py). AESModes (dan image
+pipeline yang memakainya) memuat file ini secara otomatis.
+
+Pemakaian:
+    python -m aes_engine.autotune [--output PATH] [--quick]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Memastikan Python bisa menemukan folder aes_engine saat dijalankan sebagai script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aes_engine.modes import AESModes
+from aes_engine.parallel import DEFAULT_CHUNK_BLOCKS, default_workers
+from aes_engine.tuning import load_tuning, save_tuning, tuning_path
+
+BENCH_KEY = b"autotune-key-123"
+# Nilai threshold jika sebuah jalur tidak pernah lebih cepat (praktis: tidak pernah dipilih)
+NEVER = 1 << 62
+
+
+def _best_time(func, repeat):
+    """Waktu terbaik (detik) dari beberapa kali percobaan."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _ecb_time(engine_mode, payload, repeat, workers=None, chunk_blocks=None):
+    cipher = AESModes(BENCH_KEY, engine_mode=engine_mode, workers=workers, chunk_blocks=chunk_blocks)
+    out = bytearray(cipher.padded_length(len(payload)))
+    return _best_time(lambda: cipher.encrypt_ecb_into(payload, out), repeat)
+
+
+def _crossover(sizes, slow_mode, fast_mode, repeat, **kwargs):
+    """Ukuran payload terkecil di mana `fast_mode` mengalahkan `slow_mode`."""
+    for size in sizes:
+        payload = os.urandom(size)
+        if _ecb_time(fast_mode, payload, repeat, **kwargs) < _ecb_time(slow_mode, payload, repeat, **kwargs):
+            return size
+    return NEVER
+
+
+def autotune(path=None, quick=False, verbose=True):
+    """
+    Menjalankan microbenchmark dan menyimpan hasilnya.
+    :param path: lokasi file tuning (default: lihat tuning_path())
+    :param quick: True = payload lebih kecil & tanpa benchmark multi-proses (cocok saat startup)
+    :return: dict konfigurasi yang disimpan
+    """
+    log = print if verbose else (lambda *args, **kwargs: None)
+    repeat = 2 if quick else 3
+    cores = default_workers()
+    log(f"Autotune AES engine ({cores} core)...")
+
+    # 1. Crossover scalar -> batch
+    batch_min = _crossover([16, 32, 64, 128, 256, 512, 1024], 'scalar', 'batch', repeat)
+    log(f" - batch_min_bytes   : {batch_min}")
+
+    # Threshold yang tidak diukur pada run ini tidak ditulis: nilai hasil run sebelumnya
+    # (misalnya process_min_bytes dari autotune lengkap) dipertahankan, atau jika belum
+    # pernah diukur, AESModes memakai DEFAULT_ENGINE_THRESHOLDS.
+    previous = load_tuning(path).get('thresholds', {})
+    config = {
+        'cpu_count': cores,
+        'chunk_blocks': DEFAULT_CHUNK_BLOCKS,
+        'workers': 1,
+        'thresholds': {'batch_min_bytes': batch_min},
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+    if cores > 1:
+        payload = os.urandom((1 if quick else 4) * 1024 * 1024)
+
+        # 2. Chunk size terbaik untuk thread pool
+        chunk_candidates = [256, 1024, 4096, 16384]
+        chunk_times = {c: _ecb_time('thread', payload, repeat, workers=cores, chunk_blocks=c)
+                       for c in chunk_candidates}
+        chunk_blocks = min(chunk_times, key=chunk_times.get)
+        log(f" - chunk_blocks      : {chunk_blocks}")
+
+        # 3. Jumlah worker terbaik
+        worker_candidates = sorted({w for w in (1, 2, 4, 8, 16, 32, 64, cores) if w <= cores})
+        worker_times = {w: _ecb_time('thread', payload, repeat, workers=w, chunk_blocks=chunk_blocks)
+                        for w in worker_candidates}
+        workers = min(worker_times, key=worker_times.get)
+        log(f" - workers           : {workers}")
+
+        config['chunk_blocks'] = chunk_blocks
+        config['workers'] = workers
+
+        # 4. Crossover batch -> thread
+        if workers > 1:
+            thread_min = _crossover([16 * 1024, 64 * 1024, 256 * 1024, 1024 * 1024],
+                                    'batch', 'thread', repeat, workers=workers, chunk_blocks=chunk_blocks)
+            config['thresholds']['thread_min_bytes'] = thread_min
+            log(f" - thread_min_bytes  : {thread_min}")
+
+            # 5. Crossover thread -> process (dilewati pada mode quick)
+            if not quick:
+                process_min = _crossover([8 * 1024 * 1024, 32 * 1024 * 1024],
+                                         'thread', 'process', 1, workers=workers, chunk_blocks=chunk_blocks)
+                config['thresholds']['process_min_bytes'] = process_min
+                log(f" - process_min_bytes : {process_min}")
+
+    for name in ('thread_min_bytes', 'process_min_bytes'):
+        if name not in config['thresholds'] and name in previous:
+            config['thresholds'][name] = previous[name]
+            log(f" - {name:<18}: {previous[name]} (dari tuning sebelumnya)")
+
+    saved = save_tuning(config, path)
+    log(f"Hasil tuning disimpan di {saved}")
+    return config
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Autotune chunk size, worker, dan threshold engine AES.")
+    parser.add_argument('--output', default=None, help=f"lokasi file tuning (default: {tuning_path()})")
+    parser.add_argument('--quick', action='store_true', help="benchmark singkat tanpa jalur multi-proses")
+    args = parser.parse_args(argv)
+    autotune(path=args.output, quick=args.quick)
+
+
+if __name__ == '__main__':
+    main()
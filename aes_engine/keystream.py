@@ -0,0 +1,124 @@
+# aes_engine/keystream.py
+
+import threading
+import numpy as np
+
+BLOCK_SIZE = 16
+
+
+class OFBKeystream:
+    def __init__(self, engine, iv, buffer_blocks=1024, prefetch=True):
+        """
+        Keystream OFB dengan ring buffer yang diisi di muka.
+        Keystream OFB tidak bergantung pada data (O_i = E(O_(i-1)), O_0 = E(IV)),
+        sehingga bisa dihitung sebelum data datang. Saat data tiba, enkripsi
+        maupun dekripsi hanya tinggal satu operasi XOR.
+
+        :param engine: engine skalar `AES`/`AESSbox44`
+        :param iv: IV 16 bytes
+        :param buffer_blocks: kapasitas ring buffer (dalam blok 16 byte)
+        :param prefetch: True = thread latar belakang menjaga buffer tetap penuh;
+                         False = keystream dihitung saat dibutuhkan
+        """
+        if buffer_blocks < 1:
+            raise ValueError("buffer_blocks minimal 1.")
+        self.engine = engine
+        self.capacity = buffer_blocks * BLOCK_SIZE
+        self._ring = np.empty(self.capacity, dtype=np.uint8)
+        self._prev_block = bytes(iv)
+        self._read_pos = 0    # posisi absolut byte keystream yang sudah dipakai
+        self._write_pos = 0   # posisi absolut byte keystream yang sudah dihitung
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = None
+
+        if prefetch:
+            self._thread = threading.Thread(target=self._prefetch_loop, name="ofb-prefetch", daemon=True)
+            self._thread.start()
+
+    def _store_block(self, block):
+        """Menaruh satu blok keystream di ring buffer (lock harus dipegang)."""
+        self._prev_block = block
+        offset = self._write_pos % self.capacity
+        self._ring[offset : offset + BLOCK_SIZE] = np.frombuffer(block, dtype=np.uint8)
+        self._write_pos += BLOCK_SIZE
+
+    def _produce_block(self):
+        """Menghitung blok keystream berikutnya secara sinkron (lock harus dipegang)."""
+        self._store_block(self.engine.encrypt_block(self._prev_block))
+
+    def _free_space(self):
+        return self.capacity - (self._write_pos - self._read_pos)
+
+    def _prefetch_loop(self):
+        while True:
+            with self._cond:
+                while not self._closed and self._free_space() < BLOCK_SIZE:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                prev_block = self._prev_block
+
+            # Enkripsi blok dilakukan di luar lock agar konsumen tidak ikut menunggu
+            block = self.engine.encrypt_block(prev_block)
+
+            with self._cond:
+                # Buang hasil jika rantai sudah dilanjutkan oleh prefill()/close() sementara itu
+                if self._closed or self._prev_block is not prev_block or self._free_space() < BLOCK_SIZE:
+                    continue
+                self._store_block(block)
+                self._cond.notify_all()
+
+    def prefill(self):
+        """Mengisi ring buffer sampai penuh secara sinkron (misalnya sebelum koneksi dibuka)."""
+        with self._cond:
+            while self._free_space() >= BLOCK_SIZE:
+                self._produce_block()
+            self._cond.notify_all()
+
+    def _take(self, length):
+        """Mengambil `length` byte keystream berikutnya (bisa lebih besar dari kapasitas buffer)."""
+        out = np.empty(length, dtype=np.uint8)
+        done = 0
+        with self._cond:
+            while done < length:
+                available = self._write_pos - self._read_pos
+                if available == 0:
+                    if self._thread is None or self._closed:
+                        self._produce_block()
+                    else:
+                        self._cond.wait()
+                    continue
+
+                offset = self._read_pos % self.capacity
+                count = min(length - done, available, self.capacity - offset)
+                out[done : done + count] = self._ring[offset : offset + count]
+                self._read_pos += count
+                done += count
+                self._cond.notify_all()
+        return out
+
+    def xor(self, data):
+        """
+        XOR data dengan keystream berikutnya (enkripsi = dekripsi untuk OFB).
+        Bisa dipanggil berulang untuk potongan stream dengan panjang bebas.
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        src = np.frombuffer(data, dtype=np.uint8)
+        return (src ^ self._take(src.size)).tobytes()
+
+    def close(self):
+        """Menghentikan thread prefetch."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,20 +1,95 @@
 # aes_engine/modes.py
 
 import os
+import numpy as np
 from .aes_standard import AES
 from .aes_sbox import AESSbox44
+from .aes_batch import AESBatch, as_blocks
+from .parallel import (
+    run_blocks_threaded, run_blocks_multiprocess, get_process_pool, default_workers, DEFAULT_CHUNK_BLOCKS
+)
+from .tuning import load_tuning
+from .keystream import OFBKeystream
+
+BLOCK_SIZE = 16
+ENGINE_MODES = ('auto', 'scalar', 'batch', 'thread', 'process')
+# Operasi yang rantainya berurutan (tiap blok butuh hasil blok sebelumnya): selalu skalar
+SEQUENTIAL_OPERATIONS = ('cbc_encrypt', 'cfb_encrypt', 'ofb')
+
+# Batas ukuran payload (byte) untuk dispatcher engine_mode='auto':
+#   < batch_min_bytes            -> scalar  (overhead NumPy lebih mahal dari beberapa blok)
+#   < thread_min_bytes atau 1 core -> batch
+#   < process_min_bytes          -> thread
+#   selebihnya                   -> process
+# Nilai hasil autotune (python -m aes_engine.autotune) dimuat otomatis dari file tuning,
+# dan bisa di-override per instance lewat parameter `thresholds`, termasuk per S-box
+# dengan sub-dict {'standard': {...}, 'sbox44': {...}}.
+DEFAULT_ENGINE_THRESHOLDS = {
+    'batch_min_bytes': 32,
+    'thread_min_bytes': 256 * 1024,
+    'process_min_bytes': 32 * 1024 * 1024,
+}
+XTS_POLY = 0x87  # Reduksi GF(2^128): x^128 + x^7 + x^2 + x + 1
+
+
+def _xts_tweaks(first_tweaks, blocks_per_sector):
+    """
+    Membangkitkan tweak semua blok untuk sekumpulan sektor sekaligus.
+    Tweak blok ke-j = T0 * alpha^j di GF(2^128) (little-endian, sesuai IEEE 1619).
+    Penggandaan dilakukan serentak untuk semua sektor (vektor per sektor).
+
+    :param first_tweaks: array uint8 (S, 16), hasil E_K2(nomor sektor)
+    :return: array uint8 (S, B, 16)
+    """
+    first_tweaks = np.ascontiguousarray(first_tweaks)
+    sectors = first_tweaks.shape[0]
+    words = np.empty((sectors, blocks_per_sector, 2), dtype='<u8')
+    lo = first_tweaks.view('<u8')[:, 0].copy()
+    hi = first_tweaks.view('<u8')[:, 1].copy()
+    one, shift = np.uint64(1), np.uint64(63)
+    for j in range(blocks_per_sector):
+        words[:, j, 0] = lo
+        words[:, j, 1] = hi
+        carry = hi >> shift
+        hi = (hi << one) | (lo >> shift)
+        lo = (lo << one) ^ (carry * np.uint64(XTS_POLY))
+    return words.view(np.uint8).reshape(sectors, blocks_per_sector, 16)
+
+
+def _xts_worker(key, tweak_key, use_sbox44, data, sector_size, first_sector, decrypt):
+    """Fungsi worker (level modul agar bisa di-pickle) untuk satu rentang sektor XTS."""
+    cipher = AESModes(key, use_sbox44=use_sbox44, engine_mode='batch')
+    return cipher._xts_crypt(data, tweak_key, sector_size, first_sector, decrypt).tobytes()
 
 class AESModes:
-    def __init__(self, key, use_sbox44=False):
+    def __init__(self, key, use_sbox44=False, engine_mode='auto', workers=None, thresholds=None,
+                 chunk_blocks=None):
         """
-        Wrapper untuk menangani Mode Operasi (ECB/CBC) dan Padding.
+        Wrapper untuk menangani Mode Operasi (ECB/CBC/CFB/OFB/XTS) dan Padding.
         :param key: Kunci (bytes atau string)
         :param use_sbox44: Boolean, jika True pakai S-box custom.
+        :param engine_mode: 'auto' (dipilih per panggilan oleh `select_engine`),
+                            'scalar' (encrypt_block per blok), 'batch' (NumPy tervektorisasi),
+                            'thread' (batch dibagi ke thread pool, GIL dilepas NumPy) atau
+                            'process' (batch dibagi ke process pool).
+                            Hanya berlaku untuk operasi yang bisa diparalelkan
+                            (ECB, dekripsi CBC/CFB, XTS); enkripsi CBC/CFB dan OFB selalu berurutan.
+        :param workers: jumlah thread/proses untuk mode paralel
+                        (None = hasil autotune, atau semua core)
+        :param thresholds: dict override untuk DEFAULT_ENGINE_THRESHOLDS
+        :param chunk_blocks: ukuran potongan (blok) per tugas thread (None = hasil autotune)
         """
+        if engine_mode not in ENGINE_MODES:
+            raise ValueError(f"engine_mode harus salah satu dari {ENGINE_MODES}")
+        tuning = load_tuning()
+        self.engine_mode = engine_mode
+        self.workers = workers or tuning.get('workers')
+        self.chunk_blocks = chunk_blocks or tuning.get('chunk_blocks') or DEFAULT_CHUNK_BLOCKS
+
         # Konversi key ke bytes jika inputnya string
         if isinstance(key, str):
             key = key.encode('utf-8')
-            
+
         # Pastikan key 16 bytes (simple fix: potong atau padding nol)
         if len(key) > 16:
             key = key[:16]
@@ -22,109 +97,410 @@ class AESModes:
             key = key.ljust(16, b'\0')
 
         self.key = key
-        
+        self.use_sbox44 = use_sbox44
+
         # Pilih Engine: Standar atau Sbox44
         if use_sbox44:
             self.engine = AESSbox44(key)
         else:
             self.engine = AES(key)
 
+        # Engine tervektorisasi (NumPy) dengan round key & S-box yang sama
+        self.batch_engine = AESBatch(self.engine)
+
+        # Threshold dispatcher: default, hasil autotune, override umum, lalu override khusus S-box ini
+        self.thresholds = dict(DEFAULT_ENGINE_THRESHOLDS)
+        self.thresholds.update(tuning.get('thresholds', {}))
+        if thresholds:
+            sbox_name = 'sbox44' if use_sbox44 else 'standard'
+            self.thresholds.update({k: v for k, v in thresholds.items() if k in DEFAULT_ENGINE_THRESHOLDS})
+            self.thresholds.update(thresholds.get(sbox_name, {}))
+
+    # --- DISPATCHER ENGINE ---
+    def select_engine(self, nbytes, operation='ecb'):
+        """
+        Memilih implementasi untuk satu panggilan berdasarkan ukuran payload,
+        jenis operasi, S-box (lewat threshold per S-box) dan jumlah core.
+        :param nbytes: ukuran payload dalam byte
+        :param operation: 'ecb', 'cbc_encrypt', 'cbc_decrypt', 'cfb_encrypt',
+                          'cfb_decrypt', 'ofb' atau 'xts'
+        :return: 'scalar', 'batch', 'thread' atau 'process'
+        """
+        if operation in SEQUENTIAL_OPERATIONS:
+            return 'scalar'
+        if self.engine_mode != 'auto':
+            return self.engine_mode
+
+        cores = self.workers or default_workers()
+        if nbytes < self.thresholds['batch_min_bytes']:
+            return 'scalar'
+        if cores <= 1 or nbytes < self.thresholds['thread_min_bytes']:
+            return 'batch'
+        if nbytes < self.thresholds['process_min_bytes']:
+            return 'thread'
+        return 'process'
+
+    # --- BUFFER HELPERS ---
+    @staticmethod
+    def _as_view(buffer):
+        """
+        Bungkus buffer (bytes, bytearray, mmap, array NumPy, str) sebagai
+        memoryview 1 dimensi berformat byte tanpa menyalin isinya.
+        """
+        if isinstance(buffer, str):
+            buffer = buffer.encode('utf-8')
+        view = memoryview(buffer)
+        if view.format != 'B' or view.ndim != 1:
+            view = view.cast('B')
+        return view
+
+    @staticmethod
+    def padded_length(length):
+        """Panjang ciphertext (ECB/CBC) untuk plaintext sepanjang `length` byte."""
+        return length + BLOCK_SIZE - (length % BLOCK_SIZE)
+
     # --- PADDING (PKCS7) ---
-    def _pad(self, data):
-        """Menambahkan padding agar panjang data kelipatan 16 byte."""
-        block_size = 16
-        padding_len = block_size - (len(data) % block_size)
-        padding = bytes([padding_len] * padding_len)
-        return data + padding
-
-    def _unpad(self, data):
-        """Menghapus padding setelah dekripsi."""
-        padding_len = data[-1]
+    def _pad_block(self, tail):
+        """
+        Membentuk blok terakhir (16 byte) dari sisa data yang kurang dari satu blok.
+        Hanya blok scratch kecil ini yang disalin, bukan seluruh input.
+        """
+        padding_len = BLOCK_SIZE - len(tail)
+        return bytes(tail) + bytes([padding_len] * padding_len)
+
+    def _unpadded_length(self, data, length):
+        """Menghitung panjang data setelah padding dihapus."""
+        if length == 0:
+            return 0
+        padding_len = data[length - 1]
         # Validasi padding
         if padding_len < 1 or padding_len > 16:
             # Jika padding rusak, kembalikan raw data (untuk debug)
-            return data
-        return data[:-padding_len]
+            return length
+        return length - padding_len
+
+    def _run_blocks(self, blocks, out=None, decrypt=False, engine='batch'):
+        """
+        Menjalankan engine batch pada banyak blok: langsung, lewat thread pool,
+        atau lewat process pool. 'scalar' diperlakukan sebagai 'batch' di sini.
+        """
+        if engine == 'process':
+            return run_blocks_multiprocess(self.key, self.use_sbox44, blocks, out,
+                                           decrypt=decrypt, workers=self.workers)
+        if decrypt:
+            kernel = self.batch_engine.decrypt_blocks
+        else:
+            kernel = self.batch_engine.encrypt_blocks
+        if engine == 'thread':
+            return run_blocks_threaded(kernel, blocks, out, self.workers, self.chunk_blocks)
+        return kernel(blocks, out=out)
+
+    def _check_output(self, out, required):
+        dst = self._as_view(out)
+        if dst.readonly:
+            raise TypeError("Output buffer harus writable (bytearray, mmap, atau array NumPy).")
+        if len(dst) < required:
+            raise ValueError(f"Output buffer terlalu kecil: butuh {required} byte, tersedia {len(dst)}.")
+        return dst
 
     # --- ECB MODE ---
-    def encrypt_ecb(self, plaintext):
-        if isinstance(plaintext, str):
-            plaintext = plaintext.encode('utf-8')
-            
-        padded_text = self._pad(plaintext)
-        ciphertext = b""
-        
+    def encrypt_ecb_into(self, plaintext, out):
+        """
+        Encrypt ECB langsung ke buffer `out` milik pemanggil.
+        :param plaintext: buffer input (bytes, bytearray, memoryview, mmap, array NumPy, str)
+        :param out: buffer writable minimal `padded_length(len(plaintext))` byte
+        :return: jumlah byte ciphertext yang ditulis
+        """
+        src = self._as_view(plaintext)
+        total = self.padded_length(len(src))
+        dst = self._check_output(out, total)
+        full = len(src) - (len(src) % BLOCK_SIZE)
+
+        engine = self.select_engine(total, 'ecb')
+
         # Potong per 16 byte dan enkripsi independen
-        for i in range(0, len(padded_text), 16):
-            block = padded_text[i : i+16]
-            ciphertext += self.engine.encrypt_block(block)
-            
-        return ciphertext
+        if engine == 'scalar':
+            for i in range(0, full, BLOCK_SIZE):
+                dst[i : i+16] = self.engine.encrypt_block(src[i : i+16])
+            dst[full : full+16] = self.engine.encrypt_block(self._pad_block(src[full:]))
+        else:
+            # Salin data + blok padding ke buffer output, lalu enkripsi in-place dalam satu pass
+            dst[:full] = src[:full]
+            dst[full : full+16] = self._pad_block(src[full:])
+            self._run_blocks(dst[:total], dst[:total], engine=engine)
+        return total
 
-    def decrypt_ecb(self, ciphertext):
-        if len(ciphertext) % 16 != 0:
+    def decrypt_ecb_into(self, ciphertext, out):
+        """
+        Decrypt ECB langsung ke buffer `out` (boleh sama dengan buffer input).
+        Byte padding ikut tertulis di `out`; nilai kembalian adalah panjang
+        plaintext setelah padding dihapus.
+        """
+        src = self._as_view(ciphertext)
+        if len(src) % 16 != 0:
             raise ValueError("Ciphertext length must be multiple of 16.")
-            
-        decrypted_data = b""
-        for i in range(0, len(ciphertext), 16):
-            block = ciphertext[i : i+16]
-            decrypted_data += self.engine.decrypt_block(block)
-            
-        return self._unpad(decrypted_data)
+        dst = self._check_output(out, len(src))
+
+        engine = self.select_engine(len(src), 'ecb')
+
+        if engine == 'scalar':
+            for i in range(0, len(src), BLOCK_SIZE):
+                dst[i : i+16] = self.engine.decrypt_block(src[i : i+16])
+        elif len(src):
+            self._run_blocks(src, dst[:len(src)], decrypt=True, engine=engine)
+
+        return self._unpadded_length(dst, len(src))
+
+    def encrypt_ecb(self, plaintext):
+        src = self._as_view(plaintext)
+        ciphertext = bytearray(self.padded_length(len(src)))
+        self.encrypt_ecb_into(src, ciphertext)
+        return bytes(ciphertext)
+
+    def decrypt_ecb(self, ciphertext):
+        decrypted_data = bytearray(len(ciphertext))
+        length = self.decrypt_ecb_into(ciphertext, decrypted_data)
+        return bytes(decrypted_data[:length])
 
     # --- CBC MODE ---
-    def encrypt_cbc(self, plaintext, iv):
-        """
-        Encrypt dengan CBC Mode.
-        Butuh IV (Initialization Vector) 16 bytes.
-        """
-        if isinstance(plaintext, str):
-            plaintext = plaintext.encode('utf-8')
+    def _check_iv(self, iv):
         if isinstance(iv, str):
             iv = iv.encode('utf-8')
-            
         if len(iv) != 16:
             raise ValueError("IV must be 16 bytes.")
+        return bytes(iv)
 
-        padded_text = self._pad(plaintext)
-        ciphertext = b""
+    def encrypt_cbc_into(self, plaintext, out, iv):
+        """
+        Encrypt CBC langsung ke buffer `out` milik pemanggil.
+        :return: jumlah byte ciphertext yang ditulis
+        """
+        iv = self._check_iv(iv)
+        src = self._as_view(plaintext)
+        total = self.padded_length(len(src))
+        dst = self._check_output(out, total)
+        full = len(src) - (len(src) % BLOCK_SIZE)
         prev_block = iv # Blok sebelumnya dimulai dengan IV
-        
-        for i in range(0, len(padded_text), 16):
-            curr_block = padded_text[i : i+16]
-            
-            # XOR dengan blok ciphertext sebelumnya (atau IV)
+
+        for i in range(0, total, BLOCK_SIZE):
+            curr_block = src[i : i+16] if i < full else self._pad_block(src[full:])
+
+            # XOR dengan blok ciphertext sebelumnya (atau IV), lalu enkripsi
             xor_block = bytes([b ^ p for b, p in zip(curr_block, prev_block)])
-            
-            # Enkripsi hasil XOR
             encrypted_block = self.engine.encrypt_block(xor_block)
-            
-            ciphertext += encrypted_block
+
+            dst[i : i+16] = encrypted_block
             prev_block = encrypted_block # Update prev_block
-            
-        return ciphertext
 
-    def decrypt_cbc(self, ciphertext, iv):
-        if isinstance(iv, str):
-            iv = iv.encode('utf-8')
-        if len(ciphertext) % 16 != 0:
-            raise ValueError("Ciphertext length must be multiple of 16.")
-        if len(iv) != 16:
-            raise ValueError("IV must be 16 bytes.")
+        return total
 
-        decrypted_data = b""
+    def decrypt_cbc_into(self, ciphertext, out, iv):
+        """
+        Decrypt CBC langsung ke buffer `out` (boleh sama dengan buffer input).
+        :return: panjang plaintext setelah padding dihapus
+        """
+        iv = self._check_iv(iv)
+        src = self._as_view(ciphertext)
+        if len(src) % 16 != 0:
+            raise ValueError("Ciphertext length must be multiple of 16.")
+        dst = self._check_output(out, len(src))
+        engine = self.select_engine(len(src), 'cbc_decrypt')
+        if engine != 'scalar' and len(src):
+            return self._decrypt_cbc_batch(src, dst[:len(src)], iv, engine)
         prev_block = iv
-        
-        for i in range(0, len(ciphertext), 16):
-            curr_block = ciphertext[i : i+16]
-            
-            # Decrypt blok sekarang
+
+        for i in range(0, len(src), BLOCK_SIZE):
+            # Simpan ciphertext asli sebelum (mungkin) tertimpa output in-place
+            curr_block = bytes(src[i : i+16])
+
+            # Decrypt blok sekarang, lalu XOR dengan ciphertext sebelumnya (atau IV)
             decrypted_block_raw = self.engine.decrypt_block(curr_block)
-            
-            # XOR dengan ciphertext sebelumnya (atau IV) untuk dapat plaintext
-            plaintext_block = bytes([b ^ p for b, p in zip(decrypted_block_raw, prev_block)])
-            
-            decrypted_data += plaintext_block
-            prev_block = curr_block # Simpan ciphertext asli untuk iterasi berikutnya
-            
-        return self._unpad(decrypted_data)
\ No newline at end of file
+            dst[i : i+16] = bytes([b ^ p for b, p in zip(decrypted_block_raw, prev_block)])
+
+            prev_block = curr_block
+
+        return self._unpadded_length(dst, len(src))
+
+    def _decrypt_cbc_batch(self, src, dst, iv, engine):
+        """
+        Dekripsi CBC tervektorisasi: semua blok didekripsi sekaligus,
+        lalu di-XOR dengan blok ciphertext sebelumnya (atau IV).
+        """
+        src_blocks = as_blocks(src)
+        dst_blocks = as_blocks(dst)
+        if np.shares_memory(src_blocks, dst_blocks):
+            # In-place: simpan rantai ciphertext sebelum tertimpa
+            chain = src_blocks[:-1].copy()
+        else:
+            chain = src_blocks[:-1]
+
+        self._run_blocks(src_blocks, dst_blocks, decrypt=True, engine=engine)
+        dst_blocks[0] ^= np.frombuffer(iv, dtype=np.uint8)
+        dst_blocks[1:] ^= chain
+        return self._unpadded_length(dst, len(src))
+
+    def encrypt_cbc(self, plaintext, iv):
+        """
+        Encrypt dengan CBC Mode.
+        Butuh IV (Initialization Vector) 16 bytes.
+        """
+        src = self._as_view(plaintext)
+        ciphertext = bytearray(self.padded_length(len(src)))
+        self.encrypt_cbc_into(src, ciphertext, iv)
+        return bytes(ciphertext)
+
+    def decrypt_cbc(self, ciphertext, iv):
+        decrypted_data = bytearray(len(ciphertext))
+        length = self.decrypt_cbc_into(ciphertext, decrypted_data, iv)
+        return bytes(decrypted_data[:length])
+
+    # --- CFB MODE (segmen 128-bit, tanpa padding) ---
+    def encrypt_cfb(self, plaintext, iv):
+        """
+        Encrypt dengan CFB Mode (CFB-128).
+        Mode stream: panjang ciphertext sama dengan plaintext, tanpa padding.
+        Enkripsi berurutan karena setiap blok butuh ciphertext blok sebelumnya.
+        """
+        iv = self._check_iv(iv)
+        src = self._as_view(plaintext)
+        ciphertext = bytearray(len(src))
+        prev_block = iv
+
+        for i in range(0, len(src), BLOCK_SIZE):
+            keystream = self.engine.encrypt_block(prev_block)
+            curr_block = src[i : i+16]
+            encrypted_block = bytes([b ^ k for b, k in zip(curr_block, keystream)])
+            ciphertext[i : i+len(encrypted_block)] = encrypted_block
+            prev_block = encrypted_block
+
+        return bytes(ciphertext)
+
+    def decrypt_cfb(self, ciphertext, iv):
+        """
+        Decrypt CFB-128. Semua input keystream (IV dan blok ciphertext) sudah
+        diketahui, jadi seluruh blok dienkripsi dalam satu pass batch.
+        """
+        iv = self._check_iv(iv)
+        src = self._as_view(ciphertext)
+        if len(src) == 0:
+            return b""
+
+        # Input keystream: IV, C_0, ..., C_(n-2) (blok terakhir boleh tidak penuh)
+        num_blocks = -(-len(src) // BLOCK_SIZE)
+        feedback = np.empty((num_blocks, 16), dtype=np.uint8)
+        feedback[0] = np.frombuffer(iv, dtype=np.uint8)
+        feedback[1:] = np.frombuffer(src[: (num_blocks - 1) * 16], dtype=np.uint8).reshape(-1, 16)
+
+        keystream = self._run_blocks(feedback, feedback, engine=self.select_engine(len(src), 'cfb_decrypt'))
+        data = np.frombuffer(src, dtype=np.uint8)
+        return (data ^ keystream.reshape(-1)[: len(src)]).tobytes()
+
+    # --- OFB MODE (tanpa padding) ---
+    def ofb_keystream(self, iv, buffer_blocks=1024, prefetch=True):
+        """
+        Membuat keystream OFB yang dihitung di muka ke dalam ring buffer.
+        Cocok untuk stream/socket: panggil `.xor(data)` setiap potongan data tiba,
+        sehingga jalur kritis hanya berisi operasi XOR.
+        :return: OFBKeystream (tutup dengan `.close()` atau gunakan `with`)
+        """
+        iv = self._check_iv(iv)
+        return OFBKeystream(self.engine, iv, buffer_blocks=buffer_blocks, prefetch=prefetch)
+
+    def encrypt_ofb(self, plaintext, iv):
+        """
+        Encrypt dengan OFB Mode. Keystream tidak bergantung pada data,
+        sehingga enkripsi dan dekripsi adalah operasi yang sama.
+        """
+        src = self._as_view(plaintext)
+        keystream = self.ofb_keystream(iv, buffer_blocks=max(1, -(-len(src) // BLOCK_SIZE)), prefetch=False)
+        return keystream.xor(src)
+
+    def decrypt_ofb(self, ciphertext, iv):
+        return self.encrypt_ofb(ciphertext, iv)
+
+    # --- XTS MODE (IEEE 1619, data unit = sektor) ---
+    def _check_tweak_key(self, tweak_key):
+        if isinstance(tweak_key, str):
+            tweak_key = tweak_key.encode('utf-8')
+        if len(tweak_key) != 16:
+            raise ValueError("Tweak key must be 16 bytes.")
+        if bytes(tweak_key) == self.key:
+            raise ValueError("Tweak key must differ from the data key.")
+        return bytes(tweak_key)
+
+    def _xts_crypt(self, data, tweak_key, sector_size, first_sector, decrypt):
+        """
+        Inti XTS: semua blok dari semua sektor diproses dalam satu pass tervektorisasi.
+        :return: array uint8 (S, B, 16)
+        """
+        blocks = as_blocks(self._as_view(data))
+        blocks_per_sector = sector_size // BLOCK_SIZE
+        sectors = blocks.reshape(-1, blocks_per_sector, 16)
+
+        # T0 = E_K2(nomor sektor sebagai 16 byte little-endian), untuk semua sektor sekaligus
+        sector_numbers = np.zeros((sectors.shape[0], 2), dtype='<u8')
+        sector_numbers[:, 0] = np.arange(first_sector, first_sector + sectors.shape[0], dtype=np.uint64)
+        tweak_engine = AESBatch(type(self.engine)(tweak_key))
+        first_tweaks = tweak_engine.encrypt_blocks(sector_numbers.view(np.uint8))
+        tweaks = _xts_tweaks(first_tweaks, blocks_per_sector)
+
+        # C = E_K1(P xor T) xor T  (dekripsi: P = D_K1(C xor T) xor T)
+        processed = sectors ^ tweaks
+        engine = self.select_engine(processed.nbytes, 'xts')
+        self._run_blocks(processed, processed, decrypt=decrypt, engine=engine)
+        processed ^= tweaks
+        return processed
+
+    def _xts_sectors(self, data, tweak_key, sector_size, first_sector, workers, decrypt):
+        tweak_key = self._check_tweak_key(tweak_key)
+        src = self._as_view(data)
+        if sector_size < BLOCK_SIZE or sector_size % BLOCK_SIZE != 0:
+            raise ValueError("Sector size must be a positive multiple of 16 bytes.")
+        if len(src) % sector_size != 0:
+            raise ValueError("Data length must be a multiple of the sector size.")
+
+        total_sectors = len(src) // sector_size
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, total_sectors))
+        if workers == 1:
+            return self._xts_crypt(src, tweak_key, sector_size, first_sector, decrypt).tobytes()
+
+        # Bagi rentang sektor ke beberapa proses; tiap sektor independen
+        per_worker = -(-total_sectors // workers)
+        pool = get_process_pool(workers)
+        futures = []
+        for start in range(0, total_sectors, per_worker):
+            end = min(start + per_worker, total_sectors)
+            chunk = src[start * sector_size : end * sector_size].tobytes()
+            futures.append(pool.submit(
+                _xts_worker, self.key, tweak_key, self.use_sbox44,
+                chunk, sector_size, first_sector + start, decrypt
+            ))
+        return b"".join(f.result() for f in futures)
+
+    def encrypt_xts(self, plaintext, tweak_key, sector_number):
+        """
+        Encrypt satu sektor (data unit) dengan XTS.
+        Panjang plaintext harus kelipatan 16 byte; tidak ada padding maupun IV yang disimpan.
+        :param tweak_key: kunci kedua (16 bytes) untuk enkripsi tweak, harus berbeda dari key
+        :param sector_number: nomor sektor (integer >= 0)
+        """
+        src = self._as_view(plaintext)
+        return self._xts_sectors(src, tweak_key, len(src), sector_number, 1, False)
+
+    def decrypt_xts(self, ciphertext, tweak_key, sector_number):
+        src = self._as_view(ciphertext)
+        return self._xts_sectors(src, tweak_key, len(src), sector_number, 1, True)
+
+    def encrypt_xts_sectors(self, data, tweak_key, sector_size=512, first_sector=0, workers=1):
+        """
+        Encrypt data yang terdiri dari banyak sektor berukuran tetap.
+        Sektor ke-k memakai nomor sektor `first_sector + k`, sehingga setiap sektor
+        dapat didekripsi secara acak (random access) dengan `decrypt_xts`.
+        :param workers: jumlah proses; None = semua core
+        """
+        return self._xts_sectors(data, tweak_key, sector_size, first_sector, workers, False)
+
+    def decrypt_xts_sectors(self, data, tweak_key, sector_size=512, first_sector=0, workers=1):
+        return self._xts_sectors(data, tweak_key, sector_size, first_sector, workers, True)
@@ -0,0 +1,138 @@
+# aes_engine/parallel.py
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import lru_cache
+import numpy as np
+from .aes_standard import AES
+from .aes_sbox import AESSbox44
+from .aes_batch import AESBatch, as_blocks
+
+# Ukuran potongan default per tugas thread: 4096 blok = 64 KiB (muat di cache L2)
+DEFAULT_CHUNK_BLOCKS = 4096
+# Potongan terkecil yang masih sepadan dengan overhead submit ke thread pool
+MIN_CHUNK_BLOCKS = 256
+# Potongan per tugas proses: 65536 blok = 1 MiB (overhead pickling relatif kecil)
+MULTIPROCESS_CHUNK_BLOCKS = 65536
+
+# Satu thread pool per jumlah worker. Pool tidak pernah di-shutdown selama proses hidup,
+# karena request lain bisa saja masih memegang dan memakai pool tersebut.
+_thread_pools = {}
+_pool_lock = threading.Lock()
+
+
+def default_workers():
+    """Jumlah worker default = jumlah core yang tersedia."""
+    return os.cpu_count() or 1
+
+
+def get_thread_pool(workers=None):
+    """
+    Thread pool bersama untuk kernel batch, satu per jumlah worker.
+    Dipakai bersama oleh semua request Flask sehingga jumlah thread tetap terbatas.
+    """
+    workers = workers or default_workers()
+    with _pool_lock:
+        pool = _thread_pools.get(workers)
+        if pool is None:
+            pool = _thread_pools[workers] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aes-batch")
+        return pool
+
+
+def run_blocks_threaded(kernel, blocks, out=None, workers=None, chunk_blocks=DEFAULT_CHUNK_BLOCKS):
+    """
+    Menjalankan kernel batch (`AESBatch.encrypt_blocks`/`decrypt_blocks`) pada
+    potongan-potongan buffer secara paralel dengan thread.
+    Kernel NumPy melepas GIL, jadi thread benar-benar berjalan bersamaan
+    tanpa overhead fork maupun pickling.
+
+    :param kernel: fungsi kernel(blocks, out=...) -> array (N, 16)
+    :param blocks: buffer input (kelipatan 16 byte)
+    :param out: buffer output opsional (ukuran sama, boleh sama dengan input)
+    :return: array uint8 (N, 16)
+    """
+    src = as_blocks(blocks)
+    dst = np.empty_like(src) if out is None else as_blocks(out)
+    if dst.shape != src.shape:
+        raise ValueError("Output buffer harus berukuran sama dengan input.")
+
+    workers = workers or default_workers()
+    total = src.shape[0]
+    # Potongan kecil agar muat di cache, tapi cukup banyak untuk membagi kerja ke semua worker
+    chunk = min(chunk_blocks, max(MIN_CHUNK_BLOCKS, -(-total // workers)))
+    if workers == 1 or total <= chunk:
+        return kernel(src, out=dst)
+
+    pool = get_thread_pool(workers)
+    futures = [
+        pool.submit(kernel, src[start : start + chunk], out=dst[start : start + chunk])
+        for start in range(0, total, chunk)
+    ]
+    for future in futures:
+        future.result()
+    return dst
+
+
+# --- MULTI-PROSES (payload sangat besar) ---
+# Process pool per ukuran; sama seperti thread pool, tidak pernah di-shutdown saat masih bisa dipakai
+_process_pools = {}
+
+
+def get_process_pool(workers=None):
+    """
+    Process pool persisten (dibuat sekali, dipakai ulang) untuk payload sangat besar.
+    Ukuran pool minimal default_workers(): permintaan dengan worker lebih sedikit (misalnya
+    XTS yang dibatasi jumlah sektor) memakai pool yang sama dan cukup mengirim tugas lebih
+    sedikit, sehingga tidak terbentuk banyak pool proses dengan ukuran berbeda.
+    """
+    size = max(workers or 1, default_workers())
+    with _pool_lock:
+        pool = _process_pools.get(size)
+        if pool is None:
+            pool = _process_pools[size] = ProcessPoolExecutor(max_workers=size)
+        return pool
+
+
+@lru_cache(maxsize=16)
+def _worker_engine(key, use_sbox44):
+    """Engine batch per proses worker, di-cache per (key, S-box) agar key schedule tidak diulang."""
+    engine = AESSbox44(key) if use_sbox44 else AES(key)
+    return AESBatch(engine)
+
+
+def _process_kernel(key, use_sbox44, decrypt, data):
+    """Fungsi worker (level modul agar bisa di-pickle): proses satu potongan blok."""
+    batch = _worker_engine(key, use_sbox44)
+    if decrypt:
+        return batch.decrypt_blocks(data).tobytes()
+    return batch.encrypt_blocks(data).tobytes()
+
+
+def run_blocks_multiprocess(key, use_sbox44, blocks, out=None, decrypt=False,
+                            workers=None, chunk_blocks=MULTIPROCESS_CHUNK_BLOCKS):
+    """
+    Membagi buffer ke beberapa proses worker (process pool persisten).
+    Worker membangun ulang engine dari (key, use_sbox44), sehingga yang
+    dikirim lewat pickle hanya potongan data.
+
+    :return: array uint8 (N, 16)
+    """
+    src = as_blocks(blocks)
+    dst = np.empty_like(src) if out is None else as_blocks(out)
+    if dst.shape != src.shape:
+        raise ValueError("Output buffer harus berukuran sama dengan input.")
+
+    workers = workers or default_workers()
+    total = src.shape[0]
+    chunk = min(chunk_blocks, max(MIN_CHUNK_BLOCKS, -(-total // workers)))
+
+    pool = get_process_pool(workers)
+    futures = [
+        (start, pool.submit(_process_kernel, key, use_sbox44, decrypt, src[start : start + chunk].tobytes()))
+        for start in range(0, total, chunk)
+    ]
+    for start, future in futures:
+        result = np.frombuffer(future.result(), dtype=np.uint8).reshape(-1, 16)
+        dst[start : start + result.shape[0]] = result
+    return dst
@@ -0,0 +1,58 @@
+# aes_engine/tuning.py
+
+import json
+import os
+import threading
+
+# Lokasi file hasil autotune. Bisa diganti lewat environment variable.
+TUNING_FILE_ENV = 'SBOX44_TUNING_FILE'
+DEFAULT_TUNING_FILE = os.path.join(os.path.expanduser('~'), '.sbox44_kripto', 'aes_tuning.json')
+TUNING_VERSION = 1
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def tuning_path(path=None):
+    """Path file tuning yang dipakai: argumen, environment variable, lalu default."""
+    return path or os.environ.get(TUNING_FILE_ENV) or DEFAULT_TUNING_FILE
+
+
+def load_tuning(path=None):
+    """
+    Memuat hasil autotune (chunk size, jumlah worker, threshold engine).
+    Mengembalikan dict kosong jika file belum ada, rusak, atau versinya berbeda,
+    sehingga AESModes tetap jalan dengan nilai default.
+    """
+    path = tuning_path(path)
+    with _cache_lock:
+        if path in _cache:
+            return _cache[path]
+        try:
+            with open(path, 'r') as f:
+                config = json.load(f)
+            if not isinstance(config, dict) or config.get('version') != TUNING_VERSION:
+                config = {}
+        except (OSError, ValueError):
+            config = {}
+        _cache[path] = config
+        return config
+
+
+def save_tuning(config, path=None):
+    """Menyimpan hasil autotune ke file JSON dan memperbarui cache."""
+    path = tuning_path(path)
+    config = dict(config, version=TUNING_VERSION)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # Tulis ke file sementara lalu rename agar pembaca tidak melihat file setengah jadi
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(config, f, indent=2)
+    os.replace(tmp_path, path)
+
+    with _cache_lock:
+        _cache[path] = config
+    return path
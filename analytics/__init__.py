@@ -1,28 +1,96 @@
 """Helper exports for analytics package."""
 
 from .nl import calc_nl_measure  # noqa: F401
-from .sac import calc_sac_measure  # noqa: F401
+from .sac import calc_sac_measure, calc_sac_report, calc_sac_report_batch  # noqa: F401
 from .bicnl import calc_bic_nl_measure  # noqa: F401
-from .bicsac import calc_bic_sac_measure  # noqa: F401
-from .lap import calc_lap_measure  # noqa: F401
+from .bicsac import calc_bic_sac_measure, calc_bic_sac_report  # noqa: F401
+from .lap import calc_lap_measure, build_lat  # noqa: F401
 from .dap import calc_dap_measure  # noqa: F401
 from .du import calc_du_measure  # noqa: F401
-from .ad import calc_ad_measure  # noqa: F401
+from .ad import calc_ad_measure, calc_ad_report  # noqa: F401
 from .to import calc_to_measure  # noqa: F401
-from .ci import calc_ci_measure  # noqa: F401
+from .ci import calc_ci_measure, calc_ci_report  # noqa: F401
 from .basic_props import check_sbox_basic_properties  # noqa: F401
+from .score import (  # noqa: F401
+    calculate_security_score, score_metrics, weighted_score, DEFAULT_SCORE_WEIGHTS, SCORE_TERMS,
+)
+from .ddt import build_ddt  # noqa: F401
+from .profile import SBoxProfile, as_profile  # noqa: F401
+from .affine import AffineSBox, AffineProfile, verify_affine  # noqa: F401
+from .cache import MetricCache, get_metric_cache, sbox_digest  # noqa: F401
+from .evaluate import evaluate_sbox  # noqa: F401
+from .warmup import warm_up_metrics, warmup_enabled  # noqa: F401
+from .executor import MetricExecutor, get_metric_executor  # noqa: F401
+from .batch import evaluate_batch  # noqa: F401
+from .incremental import MutableSBoxAnalysis  # noqa: F401
+from .gf2 import (  # noqa: F401
+    pack_matrix, unpack_matrix, gf2_rank, gf2_inverse, gf2_multiply, is_invertible,
+    gf2_rank_batch, gf2_inverse_batch, gf2_multiply_batch, is_invertible_batch,
+    random_invertible_matrices,
+)
+from .screening import (  # noqa: F401
+    is_bijective, du_at_most, dap_at_most, nl_at_least, bic_nl_at_least,
+    lap_at_most, ad_at_least, sac_between, screen_sbox,
+)
 
 __all__ = [
     "calc_nl_measure",
     "calc_sac_measure",
+    "calc_sac_report",
+    "calc_sac_report_batch",
     "calc_bic_nl_measure",
     "calc_bic_sac_measure",
+    "calc_bic_sac_report",
     "calc_lap_measure",
     "calc_dap_measure",
     "calc_to_measure",
     "calc_du_measure",
     "calc_ad_measure",
+    "calc_ad_report",
     "calc_ci_measure",
+    "calc_ci_report",
     "check_sbox_basic_properties",
+    "calculate_security_score",
+    "score_metrics",
+    "weighted_score",
+    "DEFAULT_SCORE_WEIGHTS",
+    "SCORE_TERMS",
+    "build_ddt",
+    "build_lat",
+    "SBoxProfile",
+    "as_profile",
+    "AffineSBox",
+    "AffineProfile",
+    "verify_affine",
+    "MetricCache",
+    "get_metric_cache",
+    "sbox_digest",
+    "evaluate_sbox",
+    "warm_up_metrics",
+    "warmup_enabled",
+    "MetricExecutor",
+    "get_metric_executor",
+    "evaluate_batch",
+    "MutableSBoxAnalysis",
+    "pack_matrix",
+    "unpack_matrix",
+    "gf2_rank",
+    "gf2_inverse",
+    "gf2_multiply",
+    "is_invertible",
+    "gf2_rank_batch",
+    "gf2_inverse_batch",
+    "gf2_multiply_batch",
+    "is_invertible_batch",
+    "random_invertible_matrices",
+    "is_bijective",
+    "du_at_most",
+    "dap_at_most",
+    "nl_at_least",
+    "bic_nl_at_least",
+    "lap_at_most",
+    "ad_at_least",
+    "sac_between",
+    "screen_sbox",
 ]
 
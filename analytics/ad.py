@@ -1,3 +1,11 @@
+import numpy as np
+
+from .nl import PARITY
+from .profile import as_profile
+
+# Hamming weight 0-255 (derajat monomial x^u adalah HW(u))
+HW_TABLE = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint8)
+
 def hamming_weight(n):
     """Menghitung jumlah bit '1' dalam angka biner."""
     return bin(n).count('1')
@@ -20,39 +28,69 @@ def mobius_transform(function_table):
         
     return anf
 
+def mobius_transform_batch(tables, inplace=False):
+    """
+    Fast Mobius Transform untuk banyak fungsi boolean sekaligus.
+    Setiap baris array (k, 2^n) berisi truth table 0/1 dan diubah menjadi ANF.
+
+    :param tables: array/list bentuk (k, 2^n) atau (2^n,)
+    :param inplace: True = menimpa `tables` (harus array NumPy uint8 yang bisa ditulis)
+    :return: array NumPy uint8 dengan bentuk yang sama
+    """
+    anf = tables if inplace else np.array(tables, dtype=np.uint8)
+    rows = anf.reshape(-1, anf.shape[-1])
+    k, size = rows.shape
+    if size & (size - 1):
+        raise ValueError("Panjang truth table harus pangkat 2.")
+
+    step = 1
+    while step < size:
+        # anf[j + step] ^= anf[j] untuk semua blok sekaligus
+        view = rows.reshape(k, size // (2 * step), 2, step)
+        view[:, :, 1, :] ^= view[:, :, 0, :]
+        step *= 2
+    return anf
+
+def component_truth_tables(sbox, masks=None):
+    """
+    Truth table 0/1 fungsi komponen S-box: f_b(x) = b . S(x).
+    :param masks: list mask output b (default: semua 0-255)
+    :return: array NumPy uint8 bentuk (len(masks), 256)
+    """
+    sbox = np.asarray(sbox, dtype=np.uint8)
+    masks = np.arange(256, dtype=np.uint8) if masks is None else np.asarray(masks, dtype=np.uint8)
+    return PARITY[masks[:, None] & sbox[None, :]]
+
+def anf_degrees(anf):
+    """Derajat aljabar setiap baris ANF (HW terbesar dari monomial yang koefisiennya 1)."""
+    return (anf * HW_TABLE[None, :]).max(axis=1)
+
+def calc_ad_report(sbox):
+    """
+    Laporan derajat aljabar atas seluruh 255 fungsi komponen tak-nol.
+    :return: dict berisi 'anf' (tabel ANF 255x256, baris ke-(b-1) = komponen b),
+             'degrees' (derajat tiap komponen), 'max_degree', 'min_degree',
+             dan 'distribution' ({derajat: jumlah komponen})
+    """
+    profile = as_profile(sbox)
+    anf = profile.anf[1:]
+    degrees = anf_degrees(anf)
+    values, counts = np.unique(degrees, return_counts=True)
+
+    return {
+        'anf': anf,
+        'degrees': degrees,
+        'max_degree': int(degrees.max()),
+        'min_degree': int(degrees.min()),
+        'distribution': {int(v): int(c) for v, c in zip(values, counts)},
+    }
+
 def calc_ad_measure(sbox):
     """
     Menghitung Algebraic Degree (AD).
-    Mencari derajat polinomial tertinggi dari 8 fungsi output S-box.
+    Mencari derajat polinomial tertinggi dari fungsi output S-box.
+    Derajat maksimum atas semua komponen sama dengan derajat maksimum 8 fungsi koordinat.
     Nilai optimal untuk S-box 8-bit adalah 7.
+    Menerima list S-box atau SBoxProfile.
     """
-    n = 8
-    size = 256
-    max_degree = 0
-
-    # Cek derajat untuk setiap bit output (0 sampai 7)
-    for bit in range(n):
-        # 1. Buat Truth Table untuk bit ke-i
-        truth_table = []
-        for x in range(size):
-            # Ambil bit ke-i dari output S-box
-            val = (sbox[x] >> bit) & 1
-            truth_table.append(val)
-            
-        # 2. Ubah ke bentuk ANF menggunakan Mobius Transform
-        anf_table = mobius_transform(truth_table)
-        
-        # 3. Cari derajat tertinggi
-        # Derajat adalah Hamming Weight terbesar dari index yang nilai ANF-nya 1
-        current_bit_max_degree = 0
-        for i in range(size):
-            if anf_table[i] == 1:
-                deg = hamming_weight(i)
-                if deg > current_bit_max_degree:
-                    current_bit_max_degree = deg
-        
-        # Update derajat maksimum global
-        if current_bit_max_degree > max_degree:
-            max_degree = current_bit_max_degree
-
-    return max_degree
\ No newline at end of file
+    return calc_ad_report(sbox)['max_degree']
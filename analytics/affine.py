@@ -0,0 +1,163 @@
+# analytics/affine.py
+
+from functools import cached_property, lru_cache
+
+import numpy as np
+
+from .nl import PARITY
+from .profile import SBoxProfile
+
+# Metrik yang invarian terhadap ekuivalensi affine S(x) = A . inv(x) XOR c
+AFFINE_INVARIANT_METRICS = ('nl', 'bic_nl', 'lap', 'dap', 'du', 'ad')
+
+
+def _gf_multiply(a, b):
+    """Perkalian GF(2^8) dengan polinomial AES x^8 + x^4 + x^3 + x + 1 (0x11B)."""
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        a <<= 1
+        if a & 0x100:
+            a ^= 0x11B
+        b >>= 1
+    return result
+
+
+@lru_cache(maxsize=1)
+def inverse_sbox():
+    """Tabel invers perkalian GF(2^8) (0 dipetakan ke 0) sebagai tuple 256 elemen."""
+    table = [0] * 256
+    for x in range(1, 256):
+        for y in range(1, 256):
+            if _gf_multiply(x, y) == 1:
+                table[x] = y
+                break
+    return tuple(table)
+
+
+@lru_cache(maxsize=1)
+def inverse_profile():
+    """SBoxProfile peta invers GF(2^8); tabelnya dihitung sekali per proses lalu dipermutasi."""
+    return SBoxProfile(inverse_sbox())
+
+
+def _row_masks(matrix):
+    """Baris matriks 8x8 sebagai bitmask: output bit i = parity(row_i & x) (bit 0 = LSB)."""
+    return np.array([sum(int(bit) << j for j, bit in enumerate(row)) for row in matrix], dtype=np.int64)
+
+
+def linear_map_table(matrix):
+    """L(v) = A . v untuk semua v 0-255 (konvensi bit sama dengan apply_affine_transformation)."""
+    values = np.arange(256)
+    table = np.zeros(256, dtype=np.int64)
+    for i, mask in enumerate(_row_masks(matrix)):
+        table |= PARITY[values & mask].astype(np.int64) << i
+    return table
+
+
+def transpose_map_table(matrix):
+    """L^T(b) untuk semua b: b . (A y) = (L^T b) . y, yaitu XOR baris A yang dipilih bit b."""
+    rows = _row_masks(matrix)
+    values = np.arange(256)
+    table = np.zeros(256, dtype=np.int64)
+    for i, mask in enumerate(rows):
+        table ^= ((values >> i) & 1) * mask
+    return table
+
+
+def verify_affine(sbox, matrix, constant):
+    """
+    Memeriksa bahwa sbox benar-benar S(x) = A . inv(x) XOR c dengan A invertible.
+    :return: True jika parameter konstruksi cocok dengan isi S-box
+    """
+    try:
+        if len(matrix) != 8 or any(len(row) != 8 for row in matrix):
+            return False
+        if any(bit not in (0, 1) for row in matrix for bit in row):
+            return False
+        constant = int(constant)
+        if not 0 <= constant <= 255 or len(sbox) != 256:
+            return False
+        table = linear_map_table(matrix)
+    except (TypeError, ValueError):
+        return False
+
+    # A invertible <=> L adalah permutasi
+    if len(np.unique(table)) != 256:
+        return False
+    expected = table[np.array(inverse_sbox())] ^ constant
+    return [int(v) for v in sbox] == expected.tolist()
+
+
+class AffineSBox(list):
+    def __init__(self, values, matrix, constant):
+        """
+        S-box hasil konstruksi S(x) = A . inv(x) XOR c yang membawa parameter konstruksinya.
+        Tetap berupa list biasa (bisa di-serialize ke JSON, dipakai engine AES, dst).
+
+        :param values: 256 nilai S-box
+        :param matrix: matriks affine A 8x8 (invertible)
+        :param constant: konstanta c (0-255)
+        """
+        super().__init__(values)
+        self.matrix = [list(row) for row in matrix]
+        self.constant = int(constant)
+
+
+class AffineProfile(SBoxProfile):
+    def __init__(self, sbox):
+        """
+        Profil S-box affine-ekuivalen dengan peta invers GF(2^8).
+        DDT, spektrum Walsh (LAT) dan ANF diturunkan dari tabel peta invers
+        dengan permutasi, bukan dihitung ulang:
+            DDT_S[dx][dy]  = DDT_inv[dx][L^-1 dy]
+            W_S[b][a]      = (-1)^(b . c) W_inv[L^T b][a]
+            ANF_S[b]       = ANF_inv[L^T b] (koefisien konstan XOR b . c)
+        Metrik invarian (AFFINE_INVARIANT_METRICS) dibaca langsung dari peta invers.
+
+        :param sbox: AffineSBox (parameter harus sudah diverifikasi, lihat verify_affine)
+        """
+        super().__init__(sbox)
+        self.matrix = sbox.matrix
+        self.constant = sbox.constant
+        self.source = sbox
+
+    @cached_property
+    def _maps(self):
+        linear = linear_map_table(self.matrix)
+        inverse_linear = np.empty_like(linear)
+        inverse_linear[linear] = np.arange(256)
+        transpose = transpose_map_table(self.matrix)
+        signs = 1 - 2 * PARITY[np.arange(256) & self.constant].astype(np.int64)
+        return inverse_linear, transpose, signs
+
+    @cached_property
+    def ddt(self):
+        inverse_linear, _, _ = self._maps
+        return inverse_profile().ddt[:, inverse_linear]
+
+    @cached_property
+    def walsh(self):
+        _, transpose, signs = self._maps
+        return signs[:, None] * inverse_profile().walsh[transpose]
+
+    @cached_property
+    def anf(self):
+        _, transpose, signs = self._maps
+        anf = inverse_profile().anf[transpose].copy()
+        anf[:, 0] ^= (signs < 0).astype(np.uint8)
+        return anf
+
+    @cached_property
+    def invariant_metrics(self):
+        """Nilai NL, BIC-NL, LAP, DAP, DU, AD (sama dengan peta invers GF(2^8))."""
+        return affine_invariant_metrics()
+
+
+@lru_cache(maxsize=1)
+def affine_invariant_metrics():
+    """Metrik invarian peta invers GF(2^8), dihitung sekali per proses."""
+    from .evaluate import METRIC_FUNCTIONS
+    profile = inverse_profile()
+    return {name: METRIC_FUNCTIONS[name](profile) for name in AFFINE_INVARIANT_METRICS}
@@ -0,0 +1,120 @@
+# analytics/batch.py
+
+import numpy as np
+
+from .ad import HW_TABLE, mobius_transform_batch
+from .ci import correlation_immunity_orders
+from .nl import PARITY, fwht_batch
+
+# Kolom hasil evaluasi batch
+BATCH_DTYPE = np.dtype([
+    ('is_bijective', np.bool_),
+    ('nl', np.int16),
+    ('sac', np.float64),
+    ('bic_nl', np.int16),
+    ('bic_sac', np.float64),
+    ('lap', np.float64),
+    ('dap', np.float64),
+    ('du', np.int16),
+    ('ad', np.int16),
+    ('ci', np.int16),
+])
+
+DEFAULT_SUB_BATCH = 64
+
+_SIZE = 256
+_X = np.arange(_SIZE)
+_COORDINATE_MASKS = np.array([1 << j for j in range(8)])
+_PAIR_MASKS = np.array([(1 << j) | (1 << k) for j in range(8) for k in range(j + 1, 8)])
+_PAIR_J, _PAIR_K = np.triu_indices(8, k=1)
+
+
+def _walsh_metrics(sboxes, out):
+    """NL, BIC-NL, LAP, dan CI dari spektrum Walsh semua komponen (B, 256, 256)."""
+    # Nilai Walsh selalu di [-256, 256], int16 cukup dan menghemat memori
+    parity = PARITY[np.arange(_SIZE, dtype=np.uint8)[None, :, None] & sboxes[:, None, :]]
+    walsh = fwht_batch((1 - 2 * parity.astype(np.int16)), inplace=True)
+    magnitude = np.abs(walsh)
+
+    out['nl'] = 128 - magnitude[:, _COORDINATE_MASKS].max(axis=(1, 2)) // 2
+    out['bic_nl'] = 128 - magnitude[:, _PAIR_MASKS].max(axis=(1, 2)) // 2
+    out['lap'] = (magnitude[:, 1:, 1:].max(axis=(1, 2)) // 2) / _SIZE
+
+    coordinates = walsh[:, _COORDINATE_MASKS].reshape(-1, _SIZE)
+    out['ci'] = correlation_immunity_orders(coordinates).reshape(-1, 8).min(axis=1)
+
+
+def _differential_metrics(sboxes, out):
+    """DU dan DAP dari DDT semua S-box sekaligus (satu bincount untuk seluruh sub-batch)."""
+    count = sboxes.shape[0]
+    delta_x = _X[:, None]
+    delta_y = sboxes[:, None, :] ^ sboxes[:, _X[None, :] ^ delta_x]           # (B, dx, x)
+    index = (np.arange(count)[:, None, None] * _SIZE + delta_x[None]) * _SIZE + delta_y
+    ddt = np.bincount(index.ravel(), minlength=count * _SIZE * _SIZE).reshape(count, _SIZE, _SIZE)
+
+    du = ddt[:, 1:].max(axis=(1, 2))
+    out['du'] = du
+    out['dap'] = du / _SIZE
+
+
+def _avalanche_metrics(sboxes, out):
+    """SAC dan BIC-SAC dari bit avalanche (B, 8, 256, 8)."""
+    flips = 1 << np.arange(8)
+    avalanche = sboxes[:, _X[None, :]] ^ sboxes[:, _X[None, :] ^ flips[:, None]]
+    bits = np.unpackbits(avalanche[..., None], axis=-1, bitorder='little')
+
+    out['sac'] = bits.mean(axis=(1, 2, 3))
+
+    # Korelasi Pearson semua pasangan bit output (lihat bicsac.bic_sac_correlations)
+    bits = bits.astype(np.int32)
+    ones = bits.sum(axis=2)
+    covariance = _SIZE * np.einsum('bixj,bixk->bijk', bits, bits) - ones[..., :, None] * ones[..., None, :]
+    variance = np.einsum('bijj->bij', covariance).astype(np.float64)
+    denominator = np.sqrt(variance[..., :, None] * variance[..., None, :])
+    correlation = np.zeros(covariance.shape, dtype=np.float64)
+    np.divide(covariance, denominator, out=correlation, where=denominator != 0)
+    out['bic_sac'] = np.abs(correlation[:, :, _PAIR_J, _PAIR_K]).mean(axis=(1, 2))
+
+
+def _algebraic_metrics(sboxes, out):
+    """AD = derajat maksimum 8 fungsi koordinat (sama dengan maksimum semua komponen)."""
+    tables = PARITY[_COORDINATE_MASKS.astype(np.uint8)[None, :, None] & sboxes[:, None, :]]
+    anf = mobius_transform_batch(tables, inplace=True)
+    out['ad'] = (anf * HW_TABLE).max(axis=(1, 2))
+
+
+def evaluate_batch(sboxes, sub_batch=DEFAULT_SUB_BATCH, as_dataframe=False):
+    """
+    Evaluasi banyak S-box sekaligus dengan kernel NumPy tervektorisasi.
+    Data diproses per sub-batch agar pemakaian memori tetap terbatas
+    (sekitar 2 MB per S-box dalam sub-batch).
+
+    :param sboxes: array/list bentuk (M, 256) dengan nilai 0-255
+    :param sub_batch: jumlah S-box per sub-batch
+    :param as_dataframe: True = kembalikan pandas DataFrame
+    :return: structured array NumPy (dtype BATCH_DTYPE) sepanjang M, atau DataFrame
+    """
+    sboxes = np.asarray(sboxes)
+    if sboxes.ndim != 2 or sboxes.shape[1] != _SIZE:
+        raise ValueError("sboxes harus berbentuk (M, 256).")
+    if sboxes.size and (sboxes.min() < 0 or sboxes.max() > 255):
+        raise ValueError("Nilai S-box harus di rentang 0-255.")
+    sboxes = sboxes.astype(np.uint8)
+    if sub_batch < 1:
+        raise ValueError("sub_batch minimal 1.")
+
+    result = np.zeros(sboxes.shape[0], dtype=BATCH_DTYPE)
+    for start in range(0, sboxes.shape[0], sub_batch):
+        chunk = sboxes[start : start + sub_batch]
+        out = result[start : start + chunk.shape[0]]
+
+        out['is_bijective'] = (np.sort(chunk, axis=1) == np.arange(_SIZE)).all(axis=1)
+        _walsh_metrics(chunk, out)
+        _differential_metrics(chunk, out)
+        _avalanche_metrics(chunk, out)
+        _algebraic_metrics(chunk, out)
+
+    if as_dataframe:
+        import pandas as pd
+        return pd.DataFrame(result)
+    return result
@@ -0,0 +1,171 @@
+# analytics/cache.py
+
+import hashlib
+import io
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+# Versi implementasi metrik. Naikkan setiap kali hasil salah satu metrik berubah,
+# sehingga entri lama di cache otomatis diabaikan.
+METRICS_VERSION = 2
+
+# Lokasi file cache. Bisa diganti lewat environment variable.
+METRIC_CACHE_ENV = 'SBOX44_METRIC_CACHE'
+DEFAULT_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.sbox44_kripto', 'metrics_cache.sqlite')
+# Setelah operasi disk gagal, disk dilewati selama sekian detik lalu dicoba lagi
+DISK_RETRY_SECONDS = 30.0
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS metrics (
+           digest TEXT NOT NULL, version INTEGER NOT NULL, payload TEXT NOT NULL, created REAL NOT NULL,
+           PRIMARY KEY (digest, version))""",
+    """CREATE TABLE IF NOT EXISTS tables (
+           digest TEXT NOT NULL, version INTEGER NOT NULL, name TEXT NOT NULL, data BLOB NOT NULL,
+           PRIMARY KEY (digest, version, name))""",
+)
+
+
+def sbox_digest(sbox):
+    """SHA-256 (hex) dari isi S-box, dipakai sebagai kunci cache."""
+    values = np.asarray([int(v) for v in sbox], dtype=np.int64)
+    return hashlib.sha256(values.tobytes()).hexdigest()
+
+
+class MetricCache:
+    def __init__(self, path=None, memory_size=256, version=METRICS_VERSION):
+        """
+        Cache hasil evaluasi S-box berbasis isi (content-addressed).
+        Lapisan memori (LRU) di depan file SQLite; kunci = (SHA-256 S-box, versi metrik).
+        Jika file tidak bisa dibuka/ditulis, operasi itu dilewati (cache tetap jalan di memori)
+        dan disk dicoba lagi setelah DISK_RETRY_SECONDS.
+
+        :param path: lokasi file SQLite (default: env SBOX44_METRIC_CACHE, lalu ~/.sbox44_kripto)
+        :param memory_size: jumlah entri maksimum di lapisan memori
+        :param version: versi implementasi metrik (entri versi lain diabaikan)
+        """
+        self.path = path or os.environ.get(METRIC_CACHE_ENV) or DEFAULT_CACHE_FILE
+        self.memory_size = memory_size
+        self.version = version
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_retry_at = 0.0
+
+    # --- SQLite ---
+    def _connect(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        return conn
+
+    def _disk(self, operation):
+        """
+        Menjalankan operasi SQLite; mengembalikan None jika gagal.
+        Kegagalan hanya melewati operasi ini: disk dilewati sementara (DISK_RETRY_SECONDS)
+        agar error yang berulang tidak memperlambat setiap request, lalu dicoba lagi.
+        """
+        if time.monotonic() < self._disk_retry_at:
+            return None
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    return operation(conn)
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Cache metrik di %s gagal diakses (%s); dicoba lagi dalam %.0f detik.",
+                           self.path, e, DISK_RETRY_SECONDS)
+            self._disk_retry_at = time.monotonic() + DISK_RETRY_SECONDS
+            return None
+
+    # --- Lapisan memori ---
+    def _remember(self, digest, metrics):
+        self._memory[digest] = metrics
+        self._memory.move_to_end(digest)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    # --- API ---
+    def get(self, sbox=None, digest=None):
+        """Hasil metrik yang tersimpan untuk S-box (atau digest-nya), None jika belum ada."""
+        digest = digest or sbox_digest(sbox)
+        with self._lock:
+            if digest in self._memory:
+                self._memory.move_to_end(digest)
+                return dict(self._memory[digest])
+
+            row = self._disk(lambda conn: conn.execute(
+                "SELECT payload FROM metrics WHERE digest = ? AND version = ?",
+                (digest, self.version)).fetchone())
+            if row is None:
+                return None
+            metrics = json.loads(row[0])
+            self._remember(digest, metrics)
+            return dict(metrics)
+
+    def put(self, sbox, metrics, digest=None):
+        """Menyimpan hasil metrik (dict yang bisa di-serialize ke JSON)."""
+        digest = digest or sbox_digest(sbox)
+        payload = json.dumps(metrics)
+        with self._lock:
+            self._remember(digest, json.loads(payload))
+            self._disk(lambda conn: conn.execute(
+                "INSERT OR REPLACE INTO metrics (digest, version, payload, created) VALUES (?, ?, ?, ?)",
+                (digest, self.version, payload, time.time())))
+
+    def get_table(self, sbox, name, digest=None):
+        """Tabel besar yang tersimpan (misalnya 'ddt', 'lat') sebagai array NumPy, None jika belum ada."""
+        digest = digest or sbox_digest(sbox)
+        with self._lock:
+            row = self._disk(lambda conn: conn.execute(
+                "SELECT data FROM tables WHERE digest = ? AND version = ? AND name = ?",
+                (digest, self.version, name)).fetchone())
+        if row is None:
+            return None
+        return np.load(io.BytesIO(row[0]), allow_pickle=False)
+
+    def put_table(self, sbox, name, table, digest=None):
+        """Menyimpan tabel besar (array NumPy) untuk S-box."""
+        digest = digest or sbox_digest(sbox)
+        buffer = io.BytesIO()
+        np.save(buffer, np.asarray(table), allow_pickle=False)
+        with self._lock:
+            self._disk(lambda conn: conn.execute(
+                "INSERT OR REPLACE INTO tables (digest, version, name, data) VALUES (?, ?, ?, ?)",
+                (digest, self.version, name, buffer.getvalue())))
+
+    def clear(self, all_versions=False):
+        """Menghapus entri versi ini (atau semua versi) dari memori dan disk."""
+        with self._lock:
+            self._memory.clear()
+            if all_versions:
+                self._disk(lambda conn: (conn.execute("DELETE FROM metrics"), conn.execute("DELETE FROM tables")))
+            else:
+                self._disk(lambda conn: (
+                    conn.execute("DELETE FROM metrics WHERE version = ?", (self.version,)),
+                    conn.execute("DELETE FROM tables WHERE version = ?", (self.version,))))
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_metric_cache():
+    """Cache metrik bersama untuk seluruh proses (dibuat saat pertama kali dipakai)."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = MetricCache()
+        return _default_cache
@@ -1,6 +1,77 @@
 # analytics/ci.py
 
-from .nl import fwht, get_bit
+from functools import lru_cache
+
+import numpy as np
+
+from .nl import fwht
+from .profile import as_profile
+
+@lru_cache(maxsize=None)
+def weight_classes(n):
+    """Indeks mask per kelas Hamming weight untuk n bit: hasil[w] = semua mask u dengan HW(u) = w."""
+    if n < 1:
+        raise ValueError("n minimal 1.")
+    weights = np.array([bin(u).count('1') for u in range(1 << n)])
+    return tuple(np.flatnonzero(weights == w) for w in range(n + 1))
+
+
+# Kelas Hamming weight untuk fungsi 8-bit (ukuran S-box aplikasi)
+WEIGHT_CLASSES = weight_classes(8)
+
+def correlation_immunity_orders(walsh, n=8):
+    """
+    Correlation immunity order untuk banyak fungsi sekaligus.
+    Order m terbesar sehingga W(u) = 0 untuk semua mask u dengan 1 <= HW(u) <= m.
+
+    :param walsh: spektrum Walsh bentuk (k, 2^n) (urutan koefisien natural)
+    :return: array int bentuk (k,)
+    """
+    nonzero = np.asarray(walsh).reshape(-1, 1 << n) != 0
+    classes = weight_classes(n)
+
+    # correlated[:, w-1] = True jika ada koefisien tak-nol di kelas weight w
+    correlated = np.stack(
+        [nonzero[:, classes[w]].any(axis=1) for w in range(1, n + 1)], axis=1
+    )
+
+    # Order = (weight pertama yang berkorelasi) - 1, atau n jika tidak ada
+    return np.where(correlated.any(axis=1), correlated.argmax(axis=1), n)
+
+def resiliency_orders(walsh, n=8):
+    """
+    Resiliency order: correlation immunity order untuk fungsi seimbang (W(0) = 0),
+    -1 untuk fungsi yang tidak seimbang.
+    """
+    walsh = np.asarray(walsh).reshape(-1, 1 << n)
+    return np.where(walsh[:, 0] == 0, correlation_immunity_orders(walsh, n), -1)
+
+def calc_ci_report(sbox):
+    """
+    Laporan correlation immunity dan resiliency dari satu spektrum Walsh batch.
+    :return: dict berisi 'ci_coordinates' / 'resiliency_coordinates' (8 fungsi koordinat),
+             'ci_components' / 'resiliency_components' (255 komponen tak-nol, indeks b-1),
+             'ci_order' (minimum koordinat, sama dengan calc_ci_measure),
+             'ci_order_components' dan 'resiliency_order' (minimum semua komponen)
+    """
+    n = 8
+    walsh = as_profile(sbox).walsh[1:]
+    ci_components = correlation_immunity_orders(walsh, n)
+    resiliency_components = resiliency_orders(walsh, n)
+
+    # Komponen b = 1 << bit ada di baris (1 << bit) - 1
+    coordinates = [(1 << bit) - 1 for bit in range(n)]
+    ci_coordinates = ci_components[coordinates]
+
+    return {
+        'ci_coordinates': ci_coordinates,
+        'resiliency_coordinates': resiliency_components[coordinates],
+        'ci_components': ci_components,
+        'resiliency_components': resiliency_components,
+        'ci_order': int(ci_coordinates.min()),
+        'ci_order_components': int(ci_components.min()),
+        'resiliency_order': int(resiliency_components.min()),
+    }
 
 def calc_ci_measure(sbox):
     """
@@ -14,28 +85,9 @@ def calc_ci_measure(sbox):
     
     Return: order correlation immunity (integer, 0-8)
     Semakin tinggi order, semakin baik.
+    Menerima list S-box atau SBoxProfile (spektrum Walsh dipakai bersama NL).
     """
-    n = 8
-    size = 256
-    
-    # Untuk setiap bit output (0-7), kita cek correlation immunity-nya
-    min_order = n  # Inisialisasi dengan nilai maksimum
-    
-    for output_bit in range(n):
-        # Buat truth table untuk bit output ke-i
-        truth_table = []
-        for x in range(size):
-            val = get_bit(sbox[x], output_bit)
-            truth_table.append(val)
-        
-        # Cek correlation immunity order untuk fungsi ini
-        order = check_correlation_immunity_order(truth_table, n)
-        
-        # Ambil order minimum di antara semua bit output
-        if order < min_order:
-            min_order = order
-    
-    return min_order
+    return calc_ci_report(sbox)['ci_order']
 
 
 def check_correlation_immunity_order(truth_table, n):
@@ -50,31 +102,14 @@ def check_correlation_immunity_order(truth_table, n):
     Jika Walsh coefficient untuk mask dengan Hamming weight <= m adalah 0,
     maka fungsi adalah m-th order correlation immune.
     """
-    size = len(truth_table)
-    
     # Konversi truth table ke bentuk {-1, +1} untuk Walsh transform
     f = [(-1) ** val for val in truth_table]
     
     # Hitung Walsh transform
     walsh = fwht(f)
-    
-    # Cek mulai dari order tertinggi ke terendah
-    for order in range(n, -1, -1):
-        is_immune = True
-        
-        # Cek semua mask dengan Hamming weight <= order
-        # (kecuali mask 0 yang selalu menghasilkan nilai konstan)
-        for mask in range(1, size):
-            hw = bin(mask).count('1')
-            if hw <= order:
-                # Jika Walsh coefficient tidak nol, ada korelasi
-                # (dalam konteks ini, kita cek apakah ada bias signifikan)
-                if abs(walsh[mask]) > 0:
-                    is_immune = False
-                    break
-        
-        if is_immune:
-            return order
-    
-    return 0
+    return correlation_immunity_order_from_walsh(walsh, n)
+
 
+def correlation_immunity_order_from_walsh(walsh, n):
+    """Correlation immunity order dari spektrum Walsh satu fungsi (lihat correlation_immunity_orders)."""
+    return int(correlation_immunity_orders(walsh, n)[0])
@@ -0,0 +1,25 @@
+# analytics/ddt.py
+
+import numpy as np
+
+def build_ddt(sbox):
+    """
+    Membangun Difference Distribution Table (DDT) 256x256 secara vektor.
+    ddt[delta_x][delta_y] = #{x : S(x) XOR S(x XOR delta_x) = delta_y}
+
+    Dipakai bersama oleh DAP, DU, dan metrik diferensial lainnya.
+    :param sbox: list/array 256 elemen
+    :return: array NumPy uint16 bentuk (256, 256) (nilai maksimum 256 di baris 0)
+    """
+    size = 256
+    sbox = np.asarray(sbox, dtype=np.uint8)
+    x = np.arange(size, dtype=np.uint16)
+
+    # Outer XOR: baris = delta_x, kolom = x
+    delta_x = x[:, None]
+    delta_y = sbox[x][None, :] ^ sbox[x[None, :] ^ delta_x]
+
+    # Hitung pasangan (delta_x, delta_y) sekaligus dengan bincount
+    index = delta_x * size + delta_y
+    counts = np.bincount(index.ravel(), minlength=size * size)
+    return counts.reshape(size, size).astype(np.uint16)
@@ -1,3 +1,5 @@
+from .profile import as_profile
+
 def calc_du_measure(sbox):
     """
     Menghitung Differential Uniformity (DU).
@@ -6,29 +8,12 @@ def calc_du_measure(sbox):
     
     Semakin KECIL nilai DU, semakin tahan terhadap Differential Cryptanalysis.
     Untuk S-box 8-bit yang baik, target DU biasanya 4 (seperti AES).
+    Menerima list S-box atau SBoxProfile (DDT dipakai bersama dengan DAP).
     """
-    size = 256
-    # Buat tabel DDT 256x256 diisi 0
-    ddt = [[0] * size for _ in range(size)]
-    
-    # Isi DDT
-    # Kita iterasi semua kemungkinan input (x) dan perbedaan input (delta_x)
-    for x in range(size):
-        for delta_x in range(1, size): # delta_x tidak boleh 0
-            y1 = sbox[x]
-            y2 = sbox[x ^ delta_x] # Input kedua adalah x XOR delta_x
-            
-            delta_y = y1 ^ y2 # Perbedaan output
-            
-            ddt[delta_x][delta_y] += 1
-            
-    # Cari nilai maksimum di seluruh tabel
-    max_count = 0
-    
-    for delta_x in range(1, size):
-        for delta_y in range(size):
-            if ddt[delta_x][delta_y] > max_count:
-                max_count = ddt[delta_x][delta_y]
-                
+    ddt = as_profile(sbox).ddt
+
+    # Cari nilai maksimum di seluruh tabel (baris delta_x = 0 diabaikan)
+    max_count = int(ddt[1:].max())
+
     # Hasilnya adalah integer (Contoh: 4, 6, 8, dst)
     return max_count
\ No newline at end of file
@@ -0,0 +1,108 @@
+# analytics/evaluate.py
+
+import threading
+
+from .ad import calc_ad_measure
+from .basic_props import check_sbox_basic_properties
+from .bicnl import calc_bic_nl_measure
+from .bicsac import calc_bic_sac_measure
+from .cache import get_metric_cache, sbox_digest
+from .ci import calc_ci_measure
+from .dap import calc_dap_measure
+from .du import calc_du_measure
+from .lap import calc_lap_measure
+from .nl import calc_nl_measure
+from .affine import AffineProfile, AffineSBox
+from .profile import SBoxProfile, as_profile
+from .sac import calc_sac_measure
+from .to import calc_to_measure
+
+# Nama metrik (sama dengan field JSON di API) -> fungsi perhitungannya
+METRIC_FUNCTIONS = {
+    'nl': calc_nl_measure,
+    'sac': calc_sac_measure,
+    'bic_nl': calc_bic_nl_measure,
+    'bic_sac': calc_bic_sac_measure,
+    'lap': calc_lap_measure,
+    'dap': calc_dap_measure,
+    'du': calc_du_measure,
+    'ad': calc_ad_measure,
+    'to': calc_to_measure,
+    'ci': calc_ci_measure,
+}
+
+# Lock per digest agar S-box yang sedang dihitung (misalnya oleh warm-up) tidak dihitung dua kali
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def compute_metrics(sbox):
+    """
+    Menghitung properti dasar dan semua metrik S-box dengan satu SBoxProfile.
+    Untuk AffineSBox, metrik invarian dibaca langsung dari peta invers GF(2^8).
+    :return: (dict metrik, SBoxProfile yang dipakai)
+    """
+    metrics = dict(check_sbox_basic_properties(sbox))
+    profile = as_profile(sbox)
+    invariants = profile.invariant_metrics if isinstance(profile, AffineProfile) else {}
+    for name, func in METRIC_FUNCTIONS.items():
+        metrics[name] = invariants[name] if name in invariants else func(profile)
+    return metrics, profile
+
+
+def evaluate_sbox(sbox, cache=None, store_tables=False, executor=None):
+    """
+    Evaluasi lengkap S-box (properti dasar + 10 metrik) dengan cache berbasis isi.
+    S-box yang pernah dievaluasi hanya butuh satu lookup.
+
+    :param sbox: list 256 elemen atau SBoxProfile
+    :param cache: MetricCache yang dipakai (None = cache bersama, False = tanpa cache)
+    :param store_tables: True = ikut menyimpan DDT dan LAT ke cache
+    :param executor: MetricExecutor opsional untuk menghitung metrik secara paralel
+                     (tabel tidak ikut disimpan karena dihitung di proses worker)
+    :return: dict dengan keys is_bijective, is_balanced, is_valid, bijective_message,
+             balanced_message, nl, sac, bic_nl, bic_sac, lap, dap, du, ad, to, ci
+    """
+    if isinstance(sbox, AffineProfile):
+        sbox = sbox.source
+    elif isinstance(sbox, SBoxProfile):
+        sbox = sbox.sbox
+
+    def compute():
+        # AffineSBox sudah murah dihitung di proses ini (tabel diturunkan dengan permutasi)
+        if executor is not None and not isinstance(sbox, AffineSBox):
+            return executor.evaluate(sbox)[0], None
+        return compute_metrics(sbox)
+
+    if cache is False:
+        return compute()[0]
+    if cache is None:
+        cache = get_metric_cache()
+
+    digest = sbox_digest(sbox)
+    metrics = cache.get(digest=digest)
+    if metrics is not None:
+        return metrics
+
+    # Entri [lock, jumlah pemakai]: dihapus oleh pemakai terakhir, sehingga thread yang
+    # masih menunggu lock lama tidak membuat thread baru mendapat lock lain (hitung ganda)
+    with _inflight_lock:
+        entry = _inflight.setdefault(digest, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            # Bisa saja sudah selesai dihitung thread lain selama menunggu lock
+            metrics = cache.get(digest=digest)
+            if metrics is None:
+                metrics, profile = compute()
+                cache.put(sbox, metrics, digest=digest)
+                if store_tables and profile is not None:
+                    cache.put_table(sbox, 'ddt', profile.ddt, digest=digest)
+                    cache.put_table(sbox, 'lat', profile.lat, digest=digest)
+    finally:
+        # Selalu dilepas, juga saat compute() atau cache.put gagal
+        with _inflight_lock:
+            entry[1] -= 1
+            if entry[1] == 0 and _inflight.get(digest) is entry:
+                del _inflight[digest]
+    return metrics
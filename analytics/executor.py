@@ -0,0 +1,133 @@
+# analytics/executor.py
+
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .affine import AffineProfile, AffineSBox
+from .basic_props import check_sbox_basic_properties
+from .evaluate import METRIC_FUNCTIONS
+from .profile import SBoxProfile, as_profile
+
+# Kelompok metrik yang memakai tabel perantara yang sama; satu kelompok = satu tugas worker
+METRIC_GROUPS = (
+    ('nl', 'bic_nl', 'ci', 'lap'),   # spektrum Walsh / LAT
+    ('dap', 'du'),                   # DDT
+    ('sac', 'bic_sac'),              # vektor avalanche
+    ('ad',),                         # ANF
+    ('to',),                         # Transparency Order
+)
+
+# Satu pool per jumlah worker; tidak pernah di-shutdown selama pemanggil lain masih bisa memakainya
+_pools = {}
+_pool_lock = threading.Lock()
+
+
+def get_metric_process_pool(workers):
+    """Process pool persisten untuk evaluasi metrik (dibuat sekali per ukuran, dipakai ulang)."""
+    with _pool_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = ProcessPoolExecutor(max_workers=workers)
+        return pool
+
+
+def _run_group(sbox, names, profile=None):
+    """
+    Fungsi worker (level modul agar bisa di-pickle): hitung satu kelompok metrik.
+    :return: dict nama -> (nilai, durasi detik)
+    """
+    profile = profile or SBoxProfile(sbox)
+    invariants = profile.invariant_metrics if isinstance(profile, AffineProfile) else {}
+    results = {}
+    for name in names:
+        start = time.perf_counter()
+        value = invariants[name] if name in invariants else METRIC_FUNCTIONS[name](profile)
+        results[name] = (value, time.perf_counter() - start)
+    return results
+
+
+def default_pool_workers():
+    """Jumlah worker pool yang wajar: min(jumlah kelompok metrik, jumlah core)."""
+    return min(len(METRIC_GROUPS), os.cpu_count() or 1)
+
+
+class MetricExecutor:
+    def __init__(self, workers=None):
+        """
+        Evaluasi metrik S-box per kelompok (METRIC_GROUPS) dengan catatan waktu per metrik.
+        Secara default dihitung langsung di proses ini: setelah optimasi tabel bersama,
+        satu S-box hanya butuh puluhan ms sehingga overhead pickling ke process pool
+        justru membuatnya lebih lambat. Dengan workers > 1 setiap kelompok dikirim ke
+        satu worker process pool persisten (berguna bila banyak S-box dievaluasi bersamaan).
+        Bisa dipakai bersama oleh Flask maupun Streamlit (lihat get_metric_executor).
+
+        :param workers: jumlah proses (default: 1 = tanpa pool);
+                        gunakan default_pool_workers() untuk satu worker per kelompok
+        """
+        self.workers = workers or 1
+
+    def _groups(self, metrics):
+        if metrics is None:
+            return METRIC_GROUPS
+        wanted = set(metrics)
+        unknown = wanted - set(METRIC_FUNCTIONS)
+        if unknown:
+            raise ValueError(f"Metrik tidak dikenal: {sorted(unknown)}")
+        groups = [tuple(name for name in group if name in wanted) for group in METRIC_GROUPS]
+        return [group for group in groups if group]
+
+    def evaluate(self, sbox, metrics=None):
+        """
+        Menghitung properti dasar dan metrik S-box.
+        :param sbox: list 256 elemen atau SBoxProfile
+        :param metrics: daftar nama metrik (default: semua, lihat METRIC_FUNCTIONS)
+        :return: (dict hasil seperti evaluate_sbox, dict waktu per metrik dalam ms)
+        """
+        if isinstance(sbox, AffineProfile):
+            sbox = sbox.source
+        elif isinstance(sbox, SBoxProfile):
+            sbox = sbox.sbox
+        groups = self._groups(metrics)
+
+        start = time.perf_counter()
+        result = dict(check_sbox_basic_properties(sbox))
+
+        if isinstance(sbox, AffineSBox):
+            # Tabel diturunkan dari peta invers dengan permutasi: lebih murah di proses ini
+            profile = as_profile(sbox)
+            outputs = [_run_group(sbox, group, profile) for group in groups]
+        elif self.workers <= 1:
+            sbox = [int(v) for v in sbox]
+            outputs = [_run_group(sbox, group) for group in groups]
+        else:
+            sbox = [int(v) for v in sbox]
+            pool = get_metric_process_pool(self.workers)
+            futures = [pool.submit(_run_group, sbox, group) for group in groups]
+            outputs = [future.result() for future in futures]
+
+        timings = {}
+        for output in outputs:
+            for name, (value, seconds) in output.items():
+                result[name] = value
+                timings[name] = seconds * 1000
+        timings['total'] = (time.perf_counter() - start) * 1000
+
+        # Urutan key mengikuti METRIC_FUNCTIONS
+        ordered = {key: result[key] for key in result if key not in METRIC_FUNCTIONS}
+        ordered.update((name, result[name]) for name in METRIC_FUNCTIONS if name in result)
+        return ordered, timings
+
+
+_default_executor = None
+_default_executor_lock = threading.Lock()
+
+
+def get_metric_executor():
+    """Executor metrik bersama untuk seluruh proses (evaluasi di proses ini, lihat MetricExecutor)."""
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = MetricExecutor()
+        return _default_executor
@@ -0,0 +1,222 @@
+# analytics/explore.py
+"""
+Eksplorasi menyeluruh matriks affine circulant.
+
+Semua baris pertama 8-bit dibangkitkan menjadi matriks circulant (Row[i] =
+RightCircularShift(Row[i-1]), sama dengan generate_affine_matrix_from_first_row),
+yang tidak invertible dibuang, lalu setiap matriks dipasangkan dengan semua
+konstanta 0-255. S-box S(x) = A . inv(x) XOR c dievaluasi per matriks di process
+pool (satu tugas = 256 S-box lewat evaluate_batch), hasil ditulis ke file JSON Lines
+begitu sebuah matriks selesai, dan akhirnya diurutkan berdasarkan skor keamanan.
+
+Pemakaian:
+    python -m analytics.explore [--output PATH] [--workers N] [--top N]
+                                [--weights nl=0.3,sac=0.3,bic_nl=0.2,bic_sac=0.2] [--resume]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+# Memastikan Python bisa menemukan folder analytics saat dijalankan sebagai script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics.affine import inverse_sbox, linear_map_table
+from analytics.batch import BATCH_DTYPE, evaluate_batch
+from analytics.gf2 import is_invertible, pack_matrix
+from analytics.score import SCORE_TERMS, score_metrics, weighted_score
+
+DEFAULT_OUTPUT = 'circulant_exploration.jsonl'
+# Kolom metrik yang disimpan per S-box (semua kolom evaluate_batch kecuali is_bijective)
+RESULT_FIELDS = tuple(name for name in BATCH_DTYPE.names if name != 'is_bijective')
+
+
+def row_bits(value):
+    """Baris pertama sebagai list 8 bit, bit paling kiri = MSB (contoh 0x8F -> [1,0,0,0,1,1,1,1])."""
+    return [(value >> (7 - j)) & 1 for j in range(8)]
+
+
+def circulant_matrix(first_row):
+    """Matriks 8x8 circulant: Row[0] = first_row, Row[i] = RightCircularShift(Row[i-1])."""
+    first_row = list(first_row)
+    return [first_row[-i:] + first_row[:-i] if i else list(first_row) for i in range(8)]
+
+
+def invertible_circulant_rows():
+    """Semua baris pertama (0-255) yang menghasilkan matriks circulant invertible."""
+    return [value for value in range(256) if is_invertible(pack_matrix(circulant_matrix(row_bits(value))))]
+
+
+def circulant_sboxes(first_row, constants=range(256)):
+    """
+    Semua S-box A . inv(x) XOR c untuk satu matriks circulant.
+    :return: array (len(constants), 256)
+    """
+    linear = linear_map_table(circulant_matrix(row_bits(first_row)))
+    base = linear[np.array(inverse_sbox())]
+    return base[None, :] ^ np.asarray(list(constants), dtype=np.int64)[:, None]
+
+
+def _explore_matrix(first_row, constants, weights):
+    """Fungsi worker (level modul agar bisa di-pickle): evaluasi semua konstanta untuk satu matriks."""
+    results = evaluate_batch(circulant_sboxes(first_row, constants))
+    records = []
+    for constant, row in zip(constants, results):
+        record = {'first_row': ''.join(map(str, row_bits(first_row))), 'constant': int(constant)}
+        record.update((name, row[name].item()) for name in RESULT_FIELDS)
+        # Tanpa bobot: skor keamanan aplikasi; dengan bobot: hanya metrik yang diberi bobot (sama dengan search.py)
+        record['score'] = score_metrics(record) if weights is None else weighted_score(record, weights)
+        records.append(record)
+    return first_row, records
+
+
+def _load_completed(path, per_row):
+    """Baris pertama yang sudah lengkap di file hasil (untuk resume) beserta record-nya."""
+    grouped = {}
+    try:
+        with open(path, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                grouped.setdefault(int(record['first_row'], 2), []).append(record)
+    except FileNotFoundError:
+        return {}
+    return {row: records for row, records in grouped.items() if len(records) == per_row}
+
+
+def rank_results(records, top=None):
+    """Urutkan record dari skor tertinggi (seri: baris pertama lalu konstanta terkecil)."""
+    ranked = sorted(records, key=lambda r: (-r['score'], r['first_row'], r['constant']))
+    return ranked if top is None else ranked[:top]
+
+
+def explore_circulant(output=DEFAULT_OUTPUT, weights=None, workers=None, constants=range(256),
+                      top=20, resume=False, progress=None):
+    """
+    Menjelajahi semua matriks circulant invertible x semua konstanta.
+
+    File yang ditulis:
+        <output>                : satu record JSON per S-box, ditambahkan per matriks yang selesai
+        <output>.progress.json  : jumlah matriks selesai / total dan waktu berjalan
+        <output>.ranking.json   : `top` S-box terbaik (beserta isi S-box, key "sbox")
+
+    :param output: lokasi file hasil JSON Lines
+    :param weights: bobot skor per metrik (nl, sac, bic_nl, bic_sac, du, lap; lihat SCORE_TERMS),
+                    menggantikan bobot default; None = calculate_security_score
+    :param workers: jumlah proses (default: jumlah core); 1 = tanpa pool
+    :param constants: konstanta yang dicoba (default: 0-255)
+    :param top: jumlah S-box terbaik di ranking
+    :param resume: True = lewati matriks yang sudah lengkap di file hasil
+    :param progress: callback(done, total) opsional
+    :return: dict berisi 'total_matrices', 'total_sboxes', 'elapsed_s', 'ranking'
+    """
+    if weights is not None:
+        # TO tidak dihitung oleh evaluate_batch, jadi tidak bisa diberi bobot di sini
+        unknown = set(weights) - (set(SCORE_TERMS) & set(RESULT_FIELDS))
+        if unknown:
+            raise ValueError(f"Bobot tidak dikenal: {sorted(unknown)}")
+        if not any(weights.values()):
+            raise ValueError("Minimal satu bobot harus tidak nol.")
+    constants = [int(c) for c in constants]
+    if any(not 0 <= c <= 255 for c in constants):
+        raise ValueError("Konstanta harus di rentang 0-255.")
+    workers = workers or os.cpu_count() or 1
+
+    rows = invertible_circulant_rows()
+    completed = _load_completed(output, len(constants)) if resume else {}
+    records = [record for row in rows if row in completed for record in completed[row]]
+    pending = [row for row in rows if row not in completed]
+
+    start = time.perf_counter()
+    progress_path = output + '.progress.json'
+
+    def report(done):
+        with open(progress_path, 'w') as f:
+            json.dump({'done': done, 'total': len(rows),
+                       'elapsed_s': round(time.perf_counter() - start, 3)}, f)
+        if progress:
+            progress(done, len(rows))
+
+    # Tulis ulang hanya matriks yang lengkap (membuang sisa run yang terputus)
+    with open(output, 'w') as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+
+        done = len(rows) - len(pending)
+        report(done)
+
+        def consume(matrix_records):
+            nonlocal done
+            for record in matrix_records:
+                f.write(json.dumps(record) + '\n')
+            f.flush()
+            records.extend(matrix_records)
+            done += 1
+            report(done)
+
+        if workers <= 1:
+            for row in pending:
+                consume(_explore_matrix(row, constants, weights)[1])
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_explore_matrix, row, constants, weights) for row in pending]
+                for future in as_completed(futures):
+                    consume(future.result()[1])
+
+    ranking = rank_results(records, top)
+    for record in ranking:
+        sbox = circulant_sboxes(int(record['first_row'], 2), [record['constant']])[0]
+        record['sbox'] = sbox.tolist()
+    with open(output + '.ranking.json', 'w') as f:
+        json.dump(ranking, f, indent=2)
+
+    return {
+        'total_matrices': len(rows),
+        'total_sboxes': len(records),
+        'elapsed_s': time.perf_counter() - start,
+        'ranking': ranking,
+    }
+
+
+def _parse_weights(text):
+    """'nl=0.4,sac=0.2' -> {'nl': 0.4, 'sac': 0.2}"""
+    if not text:
+        return None
+    weights = {}
+    for item in text.split(','):
+        name, _, value = item.partition('=')
+        weights[name.strip()] = float(value)
+    return weights
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Eksplorasi semua matriks affine circulant dan konstanta.")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help=f"file hasil JSON Lines (default: {DEFAULT_OUTPUT})")
+    parser.add_argument('--workers', type=int, default=None, help="jumlah proses (default: jumlah core)")
+    parser.add_argument('--top', type=int, default=20, help="jumlah S-box terbaik yang ditampilkan")
+    parser.add_argument('--weights', default=None, help="bobot skor (menggantikan default), contoh nl=0.4,sac=0.2,du=0.2,lap=0.2")
+    parser.add_argument('--resume', action='store_true', help="lanjutkan dari file hasil yang sudah ada")
+    args = parser.parse_args(argv)
+
+    def progress(done, total):
+        print(f"\r{done}/{total} matriks", end='', flush=True)
+
+    result = explore_circulant(output=args.output, weights=_parse_weights(args.weights), workers=args.workers,
+                               top=args.top, resume=args.resume, progress=progress)
+    print(f"\n{result['total_sboxes']} S-box dari {result['total_matrices']} matriks "
+          f"dievaluasi dalam {result['elapsed_s']:.1f} detik")
+    for rank, record in enumerate(result['ranking'], 1):
+        print(f"{rank:3d}. baris={record['first_row']} c=0x{record['constant']:02X} "
+              f"skor={record['score']:.4f} NL={record['nl']} SAC={record['sac']:.5f} "
+              f"BIC-NL={record['bic_nl']} BIC-SAC={record['bic_sac']:.5f}")
+
+
+if __name__ == '__main__':
+    main()
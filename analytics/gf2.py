@@ -0,0 +1,208 @@
+# analytics/gf2.py
+"""
+Matriks biner 8x8 atas GF(2) dalam bentuk bit-packed.
+
+Baris i disimpan sebagai bitmask 8-bit (kolom j = bit j, konvensi sama dengan
+apply_affine_transformation: output bit i = parity(baris_i & x)), dan matriks
+utuh sebagai integer 64-bit: packed = sum(baris_i << (8 * i)).
+Operasi baris menjadi XOR satu byte, sehingga eliminasi Gauss cukup 8 langkah.
+Versi batch memproses array uint64 (M,) sekaligus dengan NumPy.
+"""
+
+import numpy as np
+
+from .nl import PARITY
+
+_N = 8
+_ROW_SHIFTS = np.arange(0, 64, 8, dtype=np.uint64)
+IDENTITY = sum(1 << (9 * i) for i in range(_N))
+# Batas kandidat per putaran sampler (menjaga memori tetap terbatas)
+_SAMPLE_CHUNK = 1 << 20
+
+
+def pack_matrix(matrix):
+    """Matriks 8x8 (list of list 0/1) -> integer 64-bit."""
+    if len(matrix) != _N or any(len(row) != _N for row in matrix):
+        raise ValueError("Matriks harus berukuran 8x8.")
+    packed = 0
+    for i, row in enumerate(matrix):
+        for j, bit in enumerate(row):
+            if bit not in (0, 1):
+                raise ValueError(f"Elemen di baris {i+1}, kolom {j+1} harus 0 atau 1")
+            packed |= int(bit) << (8 * i + j)
+    return packed
+
+
+def unpack_matrix(packed):
+    """Integer 64-bit -> matriks 8x8 (list of list 0/1)."""
+    return [[(int(packed) >> (8 * i + j)) & 1 for j in range(_N)] for i in range(_N)]
+
+
+def matrix_rows(packed):
+    """8 bitmask baris dari matriks packed."""
+    return [(int(packed) >> (8 * i)) & 0xFF for i in range(_N)]
+
+
+def _from_rows(rows):
+    return sum(row << (8 * i) for i, row in enumerate(rows))
+
+
+def gf2_apply(packed, x):
+    """y = A . x untuk satu byte x."""
+    return sum(int(PARITY[row & x]) << i for i, row in enumerate(matrix_rows(packed)))
+
+
+def gf2_multiply(a, b):
+    """Perkalian matriks A . B (baris i hasil = XOR baris B yang dipilih bit baris i A)."""
+    rows_b = matrix_rows(b)
+    result = []
+    for row in matrix_rows(a):
+        value = 0
+        for j in range(_N):
+            if (row >> j) & 1:
+                value ^= rows_b[j]
+        result.append(value)
+    return _from_rows(result)
+
+
+def gf2_transpose(packed):
+    """Transpose matriks packed."""
+    rows = matrix_rows(packed)
+    return _from_rows([sum(((rows[i] >> j) & 1) << i for i in range(_N)) for j in range(_N)])
+
+
+def gf2_rank(packed):
+    """Rank matriks atas GF(2) dengan eliminasi Gauss berbasis XOR."""
+    rows = matrix_rows(packed)
+    rank = 0
+    for col in range(_N):
+        bit = 1 << col
+        pivot = next((r for r in range(rank, _N) if rows[r] & bit), None)
+        if pivot is None:
+            continue
+        rows[rank], rows[pivot] = rows[pivot], rows[rank]
+        for r in range(rank + 1, _N):
+            if rows[r] & bit:
+                rows[r] ^= rows[rank]
+        rank += 1
+    return rank
+
+
+def is_invertible(packed):
+    """True jika matriks invertible (determinan mod 2 = 1)."""
+    return gf2_rank(packed) == _N
+
+
+def gf2_inverse(packed):
+    """
+    Invers matriks dengan eliminasi Gauss-Jordan pada [A | I] (16 bit per baris).
+    :raises ValueError: jika matriks singular
+    """
+    rows = [row | (1 << (_N + i)) for i, row in enumerate(matrix_rows(packed))]
+    for col in range(_N):
+        bit = 1 << col
+        pivot = next((r for r in range(col, _N) if rows[r] & bit), None)
+        if pivot is None:
+            raise ValueError("Matriks singular (tidak invertible).")
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        for r in range(_N):
+            if r != col and rows[r] & bit:
+                rows[r] ^= rows[col]
+    return _from_rows([row >> _N for row in rows])
+
+
+# --- Versi batch (array uint64) ---
+
+def unpack_rows_batch(packed):
+    """Array packed (M,) -> array baris (M, 8) uint8."""
+    packed = np.asarray(packed, dtype=np.uint64)
+    return ((packed[:, None] >> _ROW_SHIFTS) & np.uint64(0xFF)).astype(np.uint8)
+
+
+def pack_rows_batch(rows):
+    """Array baris (M, 8) -> array packed (M,) uint64."""
+    return (np.asarray(rows).astype(np.uint64) << _ROW_SHIFTS).sum(axis=1, dtype=np.uint64)
+
+
+def _gauss_jordan_batch(rows):
+    """
+    Eliminasi Gauss-Jordan untuk banyak matriks sekaligus; pivot dipindah ke baris `rank`.
+    :param rows: array (M, 8) uint16 (bit 0-7 = matriks, bit 8-15 = matriks augmentasi)
+    :return: rank (M,) -- `rows` diubah in-place
+    """
+    count = rows.shape[0]
+    index = np.arange(count)
+    positions = np.arange(_N)[None, :]
+    rank = np.zeros(count, dtype=np.int64)
+    for col in range(_N):
+        has_bit = ((rows >> col) & 1).astype(bool)
+        eligible = has_bit & (positions >= rank[:, None])
+        found = eligible.any(axis=1)
+        pivot = eligible.argmax(axis=1)
+
+        # Tukar baris pivot ke posisi rank
+        hit, target, source = index[found], rank[found], pivot[found]
+        swapped = rows[hit, source].copy()
+        rows[hit, source] = rows[hit, target]
+        rows[hit, target] = swapped
+
+        # Eliminasi kolom `col` dari semua baris lain (atas dan bawah)
+        pivot_rows = rows[index, np.minimum(rank, _N - 1)]
+        has_bit = ((rows >> col) & 1).astype(bool)
+        has_bit[hit, target] = False
+        has_bit &= found[:, None]
+        rows ^= np.where(has_bit, pivot_rows[:, None], 0).astype(rows.dtype)
+        rank += found
+    return rank
+
+
+def gf2_rank_batch(packed):
+    """Rank banyak matriks packed sekaligus: array (M,) -> rank (M,)."""
+    rows = unpack_rows_batch(packed).astype(np.uint16)
+    return _gauss_jordan_batch(rows)
+
+
+def is_invertible_batch(packed):
+    """Mask boolean (M,) matriks yang invertible."""
+    return gf2_rank_batch(packed) == _N
+
+
+def gf2_inverse_batch(packed):
+    """
+    Invers banyak matriks sekaligus.
+    :return: (inverse, valid) -- inverse (M,) uint64 (0 untuk matriks singular), valid mask (M,)
+    """
+    rows = unpack_rows_batch(packed).astype(np.uint16) | (np.uint16(1) << np.arange(_N, 2 * _N, dtype=np.uint16))
+    valid = _gauss_jordan_batch(rows) == _N
+    inverse = pack_rows_batch(rows >> _N)
+    inverse[~valid] = 0
+    return inverse, valid
+
+
+def gf2_multiply_batch(a, b):
+    """Perkalian A . B elemen demi elemen untuk dua array packed (M,)."""
+    rows_a = unpack_rows_batch(a)
+    rows_b = unpack_rows_batch(b)
+    result = np.zeros_like(rows_a)
+    for j in range(_N):
+        selected = ((rows_a >> j) & 1).astype(bool)
+        result ^= np.where(selected, rows_b[:, j, None], 0).astype(np.uint8)
+    return pack_rows_batch(result)
+
+
+def random_invertible_matrices(count, rng=None):
+    """
+    Sampel seragam matriks invertible 8x8 (rejection sampling: ~29% matriks acak invertible).
+    :param count: jumlah matriks
+    :param rng: numpy Generator atau seed (default: acak)
+    :return: array (count,) uint64 matriks packed
+    """
+    rng = np.random.default_rng(rng)
+    chunks = []
+    remaining = count
+    while remaining > 0:
+        candidates = rng.integers(0, 1 << 64, size=min(max(64, remaining * 4), _SAMPLE_CHUNK), dtype=np.uint64)
+        accepted = candidates[is_invertible_batch(candidates)][:remaining]
+        chunks.append(accepted)
+        remaining -= accepted.size
+    return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.uint64)
@@ -0,0 +1,248 @@
+# analytics/incremental.py
+
+import numpy as np
+
+from .ddt import build_ddt
+from .nl import PARITY, component_functions, fwht_batch
+from .to import HW
+
+_SIZE = 256
+_N = 8
+_COORDINATE_MASKS = [1 << j for j in range(_N)]
+_PAIR_MASKS = [(1 << j) | (1 << k) for j in range(_N) for k in range(j + 1, _N)]
+_PAIR_J, _PAIR_K = np.triu_indices(_N, k=1)
+_MASKS = np.arange(1, _SIZE)
+# HW(y) XOR b untuk setiap nilai HW 0-8 dan mask output b != 0
+_LEAK = np.arange(_N + 1)[:, None] ^ _MASKS[None, :]
+_CHARACTER = 1 - 2 * PARITY[np.arange(_SIZE)[:, None] & np.arange(_SIZE)[None, :]].astype(np.int32)
+
+
+class MutableSBoxAnalysis:
+    def __init__(self, sbox):
+        """
+        Analisis S-box yang bisa diubah dengan menukar dua output (swap) dan
+        diperbarui secara inkremental, untuk hill-climbing / simulated annealing.
+
+        Setelah swap(i, j):
+            - DDT   : hanya pasangan yang melibatkan x in {i, j, i^dx, j^dx} yang diperbarui
+            - Walsh : perubahan berupa matriks rank-1 pada blok 128x128 (b . (S(i)^S(j)) = 1,
+                      a . (i^j) = 1)
+            - SAC   : hanya 4 input per bit input yang dihitung ulang (begitu juga jumlah
+                      pasangan bit untuk BIC-SAC)
+            - TO    : hanya x in {i, j, i^a, j^a} per mask a (tabel dibuat saat TO pertama dibaca)
+        Histogram nilai DDT dan |Walsh| disimpan sehingga DU, DAP, LAP (dan NL dari
+        8 baris koordinat) bisa dibaca tanpa memindai ulang seluruh tabel.
+
+        :param sbox: list/array 256 elemen
+        """
+        self._sbox = np.array([int(v) for v in sbox], dtype=np.int64)
+        if self._sbox.shape != (_SIZE,) or self._sbox.min() < 0 or self._sbox.max() >= _SIZE:
+            raise ValueError("S-box harus berisi 256 nilai 0-255.")
+        self._history = []
+
+        # DDT + histogram nilai entri (baris delta_x = 0 tidak dihitung)
+        self._ddt = build_ddt(self._sbox).astype(np.int32)
+        self._ddt_hist = np.bincount(self._ddt[1:].ravel(), minlength=_SIZE + 1)
+
+        # Spektrum Walsh semua komponen: walsh[b][a] + histogram |W| untuk a, b >= 1
+        self._walsh = fwht_batch(component_functions(self._sbox), inplace=True).astype(np.int32)
+        self._walsh_hist = np.bincount(np.abs(self._walsh[1:, 1:]).ravel(), minlength=_SIZE + 1)
+
+        # Avalanche: aval[e][x] = S(x) XOR S(x XOR (1 << e)) dan jumlah bit yang berubah per (e, j)
+        x = np.arange(_SIZE)
+        self._avalanche = np.array([self._sbox[x] ^ self._sbox[x ^ (1 << e)] for e in range(_N)])
+        self._sac_counts = np.array([
+            [int(((self._avalanche[e] >> j) & 1).sum()) for j in range(_N)] for e in range(_N)
+        ])
+        # pair_counts[e][j][k] = jumlah x di mana bit j dan k sama-sama berubah (untuk BIC-SAC)
+        bits = ((self._avalanche[:, :, None] >> np.arange(_N)) & 1).astype(np.int64)
+        self._pair_counts = np.einsum('exj,exk->ejk', bits, bits)
+
+        # Tabel TO (definisi Berta) dibuat lazily: total[a-1][b-1], lihat to._berta_to
+        self._to_total = None
+
+    # --- Pembaruan inkremental ---
+    def _update_ddt(self, i, j, old):
+        new = self._sbox
+        delta_x = np.arange(_SIZE)
+        candidates = np.stack([np.full(_SIZE, i), np.full(_SIZE, j), i ^ delta_x, j ^ delta_x])
+        valid = np.ones(candidates.shape, dtype=bool)
+        # x = i^dx / j^dx sama dengan i atau j saat dx = 0 atau dx = i^j
+        valid[2:, (delta_x == 0) | (delta_x == (i ^ j))] = False
+
+        xs = candidates[valid]
+        dxs = np.broadcast_to(delta_x, candidates.shape)[valid]
+        removed = dxs * _SIZE + (old[xs] ^ old[xs ^ dxs])
+        added = dxs * _SIZE + (new[xs] ^ new[xs ^ dxs])
+
+        cells, inverse = np.unique(np.concatenate([removed, added]), return_inverse=True)
+        weights = np.concatenate([-np.ones(removed.size), np.ones(added.size)])
+        change = np.bincount(inverse, weights=weights).astype(np.int32)
+
+        flat = self._ddt.reshape(-1)
+        before = flat[cells]
+        after = before + change
+        flat[cells] = after
+
+        counted = cells >= _SIZE
+        self._ddt_hist -= np.bincount(before[counted], minlength=_SIZE + 1)
+        self._ddt_hist += np.bincount(after[counted], minlength=_SIZE + 1)
+
+    def _update_walsh(self, i, j, y_i, y_j):
+        # delta W_b(a) = (sigma_b(S'(i)) - sigma_b(S(i))) * (chi_a(i) - chi_a(j)), S'(i) = S(j)
+        output_term = _CHARACTER[:, y_j] - _CHARACTER[:, y_i]
+        input_term = _CHARACTER[:, i] - _CHARACTER[:, j]
+        rows = np.flatnonzero(output_term)
+        cols = np.flatnonzero(input_term)
+        if rows.size == 0 or cols.size == 0:
+            return
+
+        block = self._walsh[np.ix_(rows, cols)]
+        updated = block + output_term[rows, None] * input_term[None, cols]
+        self._walsh[np.ix_(rows, cols)] = updated
+
+        # Histogram hanya untuk a, b >= 1 (b = 0 tidak pernah berubah, a = 0 disaring)
+        counted = cols >= 1
+        self._walsh_hist -= np.bincount(np.abs(block[:, counted]).ravel(), minlength=_SIZE + 1)
+        self._walsh_hist += np.bincount(np.abs(updated[:, counted]).ravel(), minlength=_SIZE + 1)
+
+    def _update_avalanche(self, i, j):
+        sbox = self._sbox
+        for e in range(_N):
+            xs = np.unique([i, j, i ^ (1 << e), j ^ (1 << e)])
+            old_bits = (self._avalanche[e, xs, None] >> np.arange(_N)) & 1
+            self._avalanche[e, xs] = sbox[xs] ^ sbox[xs ^ (1 << e)]
+            new_bits = (self._avalanche[e, xs, None] >> np.arange(_N)) & 1
+            self._sac_counts[e] += (new_bits - old_bits).sum(axis=0)
+            self._pair_counts[e] += new_bits.T @ new_bits - old_bits.T @ old_bits
+
+    def _update_to(self, i, j, old):
+        # Hanya selisih HW(S(x^a)) - HW(S(x)) dengan x in {i, j, i^a, j^a} dan leakage di x in {i, j} yang berubah
+        new = self._sbox
+        xs = np.stack([np.full(_MASKS.size, i), np.full(_MASKS.size, j), i ^ _MASKS, j ^ _MASKS])
+        valid = np.ones(xs.shape, dtype=bool)
+        valid[2:, _MASKS == (i ^ j)] = False
+        xs = np.where(valid, xs, 0)
+
+        # Kelompokkan per nilai HW(S(x)): perubahan = C (a x 9) @ _LEAK (9 x b)
+        rows = np.broadcast_to(np.arange(_MASKS.size), xs.shape)
+        weights = np.zeros((_MASKS.size, _N + 1), dtype=np.int64)
+        for sbox, sign in ((new, 1), (old, -1)):
+            diff = (HW[sbox[xs ^ _MASKS]] - HW[sbox[xs]]) * valid
+            np.add.at(weights, (rows, HW[sbox[xs]]), sign * diff)
+        self._to_total += weights @ _LEAK
+
+    def _apply_swap(self, i, j):
+        y_i, y_j = int(self._sbox[i]), int(self._sbox[j])
+        if y_i == y_j:
+            return
+        old = self._sbox.copy()
+        self._sbox[i], self._sbox[j] = y_j, y_i
+        self._update_ddt(i, j, old)
+        self._update_walsh(i, j, y_i, y_j)
+        self._update_avalanche(i, j)
+        if self._to_total is not None:
+            self._update_to(i, j, old)
+
+    def swap(self, i, j):
+        """Menukar output S(i) dan S(j), lalu memperbarui semua tabel secara inkremental."""
+        i, j = int(i), int(j)
+        if not (0 <= i < _SIZE and 0 <= j < _SIZE) or i == j:
+            raise ValueError("Indeks swap harus dua nilai berbeda di rentang 0-255.")
+        self._apply_swap(i, j)
+        self._history.append((i, j))
+
+    def undo(self):
+        """Membatalkan swap terakhir (swap adalah involusi, jadi cukup ditukar lagi)."""
+        if not self._history:
+            raise IndexError("Tidak ada swap untuk dibatalkan.")
+        i, j = self._history.pop()
+        self._apply_swap(i, j)
+
+    # --- Nilai saat ini ---
+    @property
+    def sbox(self):
+        """S-box saat ini sebagai list."""
+        return self._sbox.tolist()
+
+    @property
+    def history(self):
+        """Daftar swap (i, j) yang belum dibatalkan."""
+        return list(self._history)
+
+    @property
+    def ddt(self):
+        """DDT saat ini (view read-only)."""
+        view = self._ddt.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def walsh(self):
+        """Spektrum Walsh saat ini, walsh[b][a] (view read-only)."""
+        view = self._walsh.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def lat(self):
+        """LAT saat ini: lat[a][b] = W_b(a) / 2."""
+        return self._walsh.T // 2
+
+    @property
+    def du(self):
+        """Differential Uniformity: entri DDT terbesar (delta_x != 0), dari histogram."""
+        return int(np.flatnonzero(self._ddt_hist).max())
+
+    @property
+    def dap(self):
+        return self.du / _SIZE
+
+    @property
+    def lap(self):
+        """LAP = max |LAT[a][b]| / 256 untuk a, b != 0, dari histogram |Walsh|."""
+        return (int(np.flatnonzero(self._walsh_hist).max()) // 2) / _SIZE
+
+    @property
+    def nl(self):
+        """Non-Linearity minimum 8 fungsi koordinat (sama dengan calc_nl_measure)."""
+        max_walsh = int(np.abs(self._walsh[_COORDINATE_MASKS]).max())
+        return (1 << (_N - 1)) - max_walsh // 2
+
+    @property
+    def sac_matrix(self):
+        """Matriks SAC 8x8 saat ini."""
+        return self._sac_counts / _SIZE
+
+    @property
+    def sac(self):
+        """Rata-rata SAC (sama dengan calc_sac_measure)."""
+        return int(self._sac_counts.sum()) / (_SIZE * _N * _N)
+
+    @property
+    def bic_nl(self):
+        """BIC-NL: Non-Linearity minimum dari 28 komponen pasangan bit output."""
+        max_walsh = int(np.abs(self._walsh[_PAIR_MASKS]).max())
+        return (1 << (_N - 1)) - max_walsh // 2
+
+    @property
+    def bic_sac(self):
+        """BIC-SAC dari jumlah bit dan pasangan bit avalanche (sama dengan calc_bic_sac_measure)."""
+        ones = self._sac_counts
+        covariance = _SIZE * self._pair_counts - ones[:, :, None] * ones[:, None, :]
+        variance = np.einsum('ejj->ej', covariance)
+        denominator = np.sqrt((variance[:, :, None] * variance[:, None, :]).astype(np.float64))
+        correlation = np.zeros(covariance.shape, dtype=np.float64)
+        np.divide(covariance, denominator, out=correlation, where=denominator != 0)
+        pairs = np.abs(correlation[:, _PAIR_J, _PAIR_K])
+        return sum(pairs.ravel().tolist()) / pairs.size
+
+    @property
+    def to(self):
+        """Transparency Order (definisi Berta, sama dengan calc_to_measure); tabel dibuat saat pertama dibaca."""
+        if self._to_total is None:
+            hw_y = HW[self._sbox]
+            hw_diff = HW[self._sbox[np.arange(_SIZE)[None, :] ^ _MASKS[:, None]]] - hw_y[None, :]
+            leak = hw_y[None, :] ^ _MASKS[:, None]
+            self._to_total = hw_diff @ leak.T
+        return float(np.abs(self._to_total).max() / 256.0)
@@ -1,42 +1,42 @@
 # analytics/lap.py
 
+import numpy as np
+
+from .nl import component_functions, fwht_batch
+from .profile import as_profile
+
+def lat_from_walsh(walsh):
+    """
+    Linear Approximation Table dari spektrum Walsh semua fungsi komponen.
+    lat[a][b] = #{x : a.x = b.S(x)} - 128 = W_b(a) / 2
+    :param walsh: array (256, 256) dengan walsh[b][a] = W_b(a)
+    :return: array NumPy int16 bentuk (256, 256), baris = mask input a, kolom = mask output b
+    """
+    return (np.asarray(walsh).T // 2).astype(np.int16)
+
+def build_lat(sbox):
+    """
+    Membangun Linear Approximation Table (LAT) lengkap 256x256.
+    Spektrum Walsh 256 fungsi komponen dihitung dengan satu FWHT batch,
+    lalu dibagi dua (lihat lat_from_walsh).
+    """
+    return lat_from_walsh(fwht_batch(component_functions(sbox), inplace=True))
+
 def calc_lap_measure(sbox):
     """
     Menghitung Linear Approximation Probability (LAP) maksimum.
-    Membuat Linear Approximation Table (LAT) dan mencari bias terbesar.
+    Membaca Linear Approximation Table (LAT) dari profil dan mencari bias terbesar.
+    Menerima list S-box atau SBoxProfile.
     """
-    n = 8
     size = 256
-    max_bias = 0
-    
+    lat = as_profile(sbox).lat
+
     # a adalah mask input, b adalah mask output
-    # Kita iterasi semua kemungkinan kombinasi linear (kecuali 0)
-    # Note: Algoritma ini O(2^2n), agak berat tapi akurat untuk 8-bit.
-    
-    for a in range(1, size):
-        for b in range(1, size):
-            match_count = 0
-            
-            for x in range(size):
-                y = sbox[x]
-                
-                # Hitung dot product (parity bit)
-                # input_parity = a • x
-                # output_parity = b • y
-                
-                input_parity = bin(x & a).count('1') % 2
-                output_parity = bin(y & b).count('1') % 2
-                
-                if input_parity == output_parity:
-                    match_count += 1
-            
-            # Hitung bias: |match_count - half_size| / size
-            # Kita cari bias absolut terbesar
-            bias = abs(match_count - (size / 2))
-            if bias > max_bias:
-                max_bias = bias
+    # Kita cek semua kemungkinan kombinasi linear (kecuali 0)
+    # Bias = |match_count - half_size|, entry LAT sudah berupa match_count - half_size
+    max_bias = int(np.abs(lat[1:, 1:]).max())
 
     # Kembalikan probabilitas maksimum (Bias / Size)
     # Atau bisa juga dikali 2 untuk representasi bias standar (maks 0.5)
     # Di sini kita return probabilitas deviasi-nya.
-    return max_bias / size
\ No newline at end of file
+    return max_bias / size
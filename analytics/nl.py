@@ -1,16 +1,67 @@
 # analytics/nl.py
 
+import numpy as np
+
+from .profile import as_profile
+
+# Paritas (jumlah bit 1 mod 2) untuk setiap nilai 0-255
+PARITY = (np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1) & 1).astype(np.uint8)
+
+def fwht_batch(values, inplace=False):
+    """
+    Fast Walsh-Hadamard Transform iteratif untuk banyak fungsi sekaligus.
+    Setiap baris array (k, 2^n) ditransformasi secara independen, dengan urutan
+    koefisien natural: hasil[i][u] = sum_x values[i][x] * (-1)^(u . x).
+
+    :param values: array/list bentuk (k, 2^n) atau (2^n,), biasanya berisi +1/-1
+    :param inplace: True = menimpa `values` (harus array NumPy int yang bisa ditulis)
+    :return: array NumPy dengan bentuk yang sama
+    """
+    if inplace:
+        a = values
+    else:
+        a = np.array(values)
+        if a.dtype.kind in 'biu':
+            a = a.astype(np.int64)
+
+    rows = a.reshape(-1, a.shape[-1])
+    k, size = rows.shape
+    if size & (size - 1):
+        raise ValueError("Panjang fungsi harus pangkat 2.")
+
+    tmp = np.empty((k, size // 2), dtype=a.dtype)
+    h = 1
+    while h < size:
+        # Butterfly (x, y) -> (x + y, x - y) untuk semua pasangan berjarak h
+        view = rows.reshape(k, size // (2 * h), 2, h)
+        x = view[:, :, 0, :]
+        y = view[:, :, 1, :]
+        t = tmp.reshape(k, size // (2 * h), h)
+        np.subtract(x, y, out=t)
+        x += y
+        y[...] = t
+        h *= 2
+    return a
+
 def fwht(a):
     """
     Fast Walsh-Hadamard Transform.
     Digunakan untuk menghitung korelasi fungsi boolean.
+    (Versi list untuk kompatibilitas, memakai fwht_batch.)
+    """
+    return fwht_batch(a).tolist()
+
+def component_functions(sbox, masks=None):
+    """
+    Fungsi komponen S-box dalam bentuk +1/-1: f_b(x) = (-1)^(b . S(x)).
+    :param sbox: list/array 256 elemen
+    :param masks: list mask output b (default: semua 0-255)
+    :return: array int64 bentuk (len(masks), 256)
     """
-    n = len(a)
-    if n == 1:
-        return a
-    a_left = fwht(a[::2])
-    a_right = fwht(a[1::2])
-    return [x + y for x, y in zip(a_left, a_right)] + [x - y for x, y in zip(a_left, a_right)]
+    sbox = np.asarray(sbox, dtype=np.uint8)
+    masks = np.arange(256, dtype=np.uint8) if masks is None else np.asarray(masks, dtype=np.uint8)
+    parity = PARITY[masks[:, None] & sbox[None, :]]
+    return 1 - 2 * parity.astype(np.int64)
 
 def get_bit(value, n):
     """Mengambil bit ke-n dari sebuah integer."""
@@ -20,37 +71,26 @@ def calc_nl_measure(sbox):
     """
     Menghitung nilai Non-Linearity (NL) dari S-box.
     NL mengukur jarak terpendek ke fungsi affine.
+    Menerima list S-box atau SBoxProfile (spektrum Walsh dipakai ulang).
     """
-    min_nl = 256  # Inisialisasi dengan nilai besar
+    profile = as_profile(sbox)
     n = 8         # AES S-box 8-bit
-    length = 1 << n # 2^8 = 256
 
     # S-box memiliki 8 output bits. Kita harus cek NL untuk setiap kombinasi output.
     # Namun, standar minimal adalah mengecek 8 fungsi koordinat boolean.
-    
     results = []
 
     # Cek untuk setiap bit output (0 sampai 7)
     for bit in range(8):
-        # Buat tabel kebenaran (Truth Table) untuk bit ke-i
-        f = [0] * length
-        for x in range(length):
-            # Sinyal fungsi boolean: 1 -> -1, 0 -> 1 (Standar Walsh)
-            bit_val = get_bit(sbox[x], bit)
-            f[x] = (-1) ** bit_val
-
-        # Hitung spektrum Walsh
-        walsh_spectrum = fwht(f)
+        # Spektrum Walsh fungsi koordinat bit ke-i (dari profil)
+        walsh_spectrum = profile.walsh_spectrum(1 << bit)
 
         # Cari nilai absolut maksimum di spektrum
-        max_walsh = 0
-        for w in walsh_spectrum:
-            if abs(w) > max_walsh:
-                max_walsh = abs(w)
+        max_walsh = int(np.abs(walsh_spectrum).max())
 
         # Rumus NL = 2^(n-1) - 1/2 * max_walsh
         nl = (1 << (n - 1)) - (max_walsh // 2)
         results.append(nl)
 
     # Nilai NL dari S-box adalah nilai minimum dari semua komponennya
-    return min(results)
\ No newline at end of file
+    return min(results)
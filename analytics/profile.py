@@ -0,0 +1,113 @@
+# analytics/profile.py
+
+from functools import cached_property
+
+import numpy as np
+
+from .ddt import build_ddt
+
+
+class SBoxProfile:
+    def __init__(self, sbox):
+        """
+        Profil analisis sebuah S-box 8-bit.
+        Tabel-tabel perantara (DDT, LAT/spektrum Walsh, ANF, vektor avalanche)
+        dihitung saat pertama kali dibutuhkan lalu disimpan, sehingga beberapa
+        metrik yang memakai tabel yang sama tidak menghitung ulang.
+
+        Semua fungsi calc_* menerima list S-box maupun SBoxProfile:
+            profile = SBoxProfile(sbox)
+            nl = calc_nl_measure(profile)
+            du = calc_du_measure(profile)   # DDT dipakai ulang oleh DAP/DU
+        """
+        if isinstance(sbox, SBoxProfile):
+            sbox = sbox.sbox
+        self.sbox = [int(v) for v in sbox]
+        self.n = 8
+        self.size = 256
+
+    # --- Differential ---
+    @cached_property
+    def ddt(self):
+        """
+        Difference Distribution Table 256x256.
+        Baris = perbedaan input (delta_x), kolom = perbedaan output (delta_y).
+        Berupa array NumPy uint16 (lihat analytics/ddt.py).
+        """
+        return build_ddt(self.sbox)
+
+    # --- Linear ---
+    @cached_property
+    def walsh(self):
+        """
+        Spektrum Walsh semua 256 fungsi komponen dalam satu array (256, 256):
+        walsh[b][a] = sum_x (-1)^(b . S(x) XOR a . x), dihitung dengan satu FWHT batch.
+        """
+        from .nl import component_functions, fwht_batch
+        return fwht_batch(component_functions(self.sbox), inplace=True)
+
+    def walsh_spectrum(self, output_mask):
+        """
+        Spektrum Walsh dari fungsi komponen f(x) = output_mask • S(x).
+        Fungsi koordinat bit ke-i memakai output_mask = 1 << i,
+        XOR pasangan bit (j, k) memakai output_mask = (1 << j) | (1 << k).
+        """
+        return self.walsh[output_mask]
+
+    @cached_property
+    def lat(self):
+        """
+        Linear Approximation Table 256x256: lat[a][b] = #{x : a•x = b•S(x)} - 128.
+        a = mask input, b = mask output. Diturunkan dari spektrum Walsh (array int16).
+        """
+        from .lap import lat_from_walsh
+        return lat_from_walsh(self.walsh)
+
+    # --- Aljabar ---
+    @cached_property
+    def anf(self):
+        """
+        ANF (hasil Mobius Transform) semua 256 fungsi komponen b . S(x).
+        Array NumPy uint8 bentuk (256, 256), baris = mask output b.
+        """
+        from .ad import component_truth_tables, mobius_transform_batch
+        return mobius_transform_batch(component_truth_tables(self.sbox), inplace=True)
+
+    @cached_property
+    def anf_coordinates(self):
+        """ANF dari 8 fungsi koordinat output (baris anf untuk mask 1 << bit)."""
+        return self.anf[[1 << bit for bit in range(self.n)]]
+
+    # --- Avalanche ---
+    @cached_property
+    def avalanche(self):
+        """
+        avalanche[i][x] = S(x) XOR S(x XOR (1 << i)) untuk setiap bit input i.
+        Array NumPy uint8 bentuk (8, 256).
+        """
+        sbox = np.asarray(self.sbox, dtype=np.uint8)
+        x = np.arange(self.size)
+        flips = 1 << np.arange(self.n)
+        return sbox[x[None, :]] ^ sbox[x[None, :] ^ flips[:, None]]
+
+    @cached_property
+    def avalanche_bits(self):
+        """
+        avalanche_bits[i][x][j] = bit ke-j dari avalanche[i][x].
+        Array NumPy uint8 bentuk (8, 256, 8).
+        """
+        return np.unpackbits(self.avalanche[:, :, None], axis=2, bitorder='little')
+
+
+def as_profile(sbox):
+    """
+    Mengembalikan SBoxProfile untuk sbox (dipakai ulang jika sudah berupa profil).
+    AffineSBox (hasil generator affine) mendapat AffineProfile yang tabelnya
+    diturunkan dari peta invers GF(2^8).
+    """
+    if isinstance(sbox, SBoxProfile):
+        return sbox
+    from .affine import AffineProfile, AffineSBox
+    if isinstance(sbox, AffineSBox):
+        return AffineProfile(sbox)
+    return SBoxProfile(sbox)
@@ -1,5 +1,9 @@
 # analytics/sac.py
 
+import numpy as np
+
+from .profile import as_profile
+
 def hamming_weight(n):
     """Menghitung jumlah angka 1 dalam biner (popcount)."""
     c = 0
@@ -8,41 +12,69 @@ def hamming_weight(n):
         n &= n - 1
     return c
 
+def sac_matrix(sbox):
+    """
+    Matriks SAC 8x8: sac[i][j] = peluang bit output j berubah saat bit input i di-flip.
+    Menerima list S-box atau SBoxProfile.
+    :return: array NumPy float64 bentuk (8, 8)
+    """
+    return as_profile(sbox).avalanche_bits.mean(axis=1)
+
+def sac_matrix_batch(sboxes):
+    """
+    Matriks SAC untuk banyak S-box sekaligus.
+    :param sboxes: array/list bentuk (M, 256)
+    :return: array NumPy float64 bentuk (M, 8, 8)
+    """
+    sboxes = np.asarray(sboxes, dtype=np.uint8)
+    if sboxes.ndim != 2 or sboxes.shape[1] != 256:
+        raise ValueError("sboxes harus berbentuk (M, 256).")
+    x = np.arange(256)
+    flips = 1 << np.arange(8)
+
+    # Tabel perbedaan flip untuk semua bit input: (M, 8, 256)
+    avalanche = sboxes[:, x[None, :]] ^ sboxes[:, x[None, :] ^ flips[:, None]]
+    bits = np.unpackbits(avalanche[..., None], axis=-1, bitorder='little')   # (M, 8, 256, 8)
+    return bits.mean(axis=2)
+
+def _sac_summary(matrix):
+    """Ringkasan statistik matriks SAC (satu atau batch, dua sumbu terakhir)."""
+    deviation = np.abs(matrix - 0.5)
+    return {
+        'mean': matrix.mean(axis=(-2, -1)),
+        'min': matrix.min(axis=(-2, -1)),
+        'max': matrix.max(axis=(-2, -1)),
+        'max_deviation': deviation.max(axis=(-2, -1)),
+        'mean_deviation': deviation.mean(axis=(-2, -1)),
+    }
+
+def calc_sac_report(sbox):
+    """
+    Laporan SAC lengkap.
+    :return: dict berisi 'matrix' (8x8), 'mean', 'min', 'max',
+             'max_deviation' dan 'mean_deviation' (jarak dari 0.5)
+    """
+    matrix = sac_matrix(sbox)
+    report = {key: float(value) for key, value in _sac_summary(matrix).items()}
+    report['matrix'] = matrix
+    return report
+
+def calc_sac_report_batch(sboxes):
+    """
+    Laporan SAC untuk banyak S-box sekaligus (lihat sac_matrix_batch).
+    :return: dict seperti calc_sac_report, tetapi setiap nilai berupa array sepanjang M
+             dan 'matrix' berbentuk (M, 8, 8)
+    """
+    matrix = sac_matrix_batch(sboxes)
+    report = _sac_summary(matrix)
+    report['matrix'] = matrix
+    return report
+
 def calc_sac_measure(sbox):
     """
     Menghitung Strict Avalanche Criterion (SAC).
     Idealnya nilainya mendekati 0.5.
+    Menerima list S-box atau SBoxProfile (vektor avalanche dipakai bersama BIC-SAC).
     """
-    n = 8
-    size = 256
-    
-    # Matriks SAC 8x8 (8 bit input x 8 bit output)
-    sac_matrix = [[0.0] * n for _ in range(n)]
-
-    # Iterasi untuk setiap bit input yang akan di-flip (i)
-    for i in range(n):
-        input_mask = 1 << i
-        
-        # Iterasi untuk setiap kemungkinan input x
-        for x in range(size):
-            y1 = sbox[x]                # Output asli
-            y2 = sbox[x ^ input_mask]   # Output setelah bit ke-i di-flip
-            
-            xor_diff = y1 ^ y2          # Perbedaan output
-            
-            # Iterasi untuk setiap bit output (j)
-            for j in range(n):
-                # Jika bit ke-j berubah (bernilai 1 di xor_diff), tambah counter
-                if (xor_diff >> j) & 1:
-                    sac_matrix[i][j] += 1
-
-    # Normalisasi nilai menjadi probabilitas (0.0 - 1.0)
-    total_sac = 0
-    for i in range(n):
-        for j in range(n):
-            sac_matrix[i][j] /= size # Bagi dengan total input (256)
-            total_sac += sac_matrix[i][j]
-
     # Mengembalikan rata-rata SAC (seharusnya ~0.5)
-    avg_sac = total_sac / (n * n)
-    return avg_sac
\ No newline at end of file
+    return calc_sac_report(sbox)['mean']
@@ -0,0 +1,76 @@
+# analytics/score.py
+
+# Bobot default skor keamanan gabungan
+DEFAULT_SCORE_WEIGHTS = {
+    'nl': 0.3,
+    'sac': 0.3,
+    'bic_nl': 0.2,
+    'bic_sac': 0.2,
+}
+
+
+def calculate_security_score(nl, sac, bic_nl, bic_sac, weights=None):
+    """
+    Menghitung skor keamanan gabungan.
+    Skor lebih tinggi = lebih baik.
+    :param weights: dict bobot untuk 'nl', 'sac', 'bic_nl', 'bic_sac' (default: DEFAULT_SCORE_WEIGHTS)
+    """
+    weights = DEFAULT_SCORE_WEIGHTS if weights is None else {**DEFAULT_SCORE_WEIGHTS, **weights}
+
+    # Normalisasi dan pembobotan
+    # NL ideal: 112, semakin tinggi semakin baik
+    nl_score = (nl / 112.0) * 100
+
+    # SAC ideal: 0.5, semakin dekat 0.5 semakin baik
+    sac_score = (1.0 - abs(sac - 0.5) * 2) * 100
+
+    # BIC-NL ideal: tinggi, semakin tinggi semakin baik
+    bic_nl_score = (bic_nl / 112.0) * 100
+
+    # BIC-SAC ideal: 0, semakin rendah semakin baik
+    bic_sac_score = max(0, (1.0 - bic_sac) * 100)
+
+    # Skor gabungan (weighted average)
+    total_score = (nl_score * weights['nl'] + sac_score * weights['sac']
+                   + bic_nl_score * weights['bic_nl'] + bic_sac_score * weights['bic_sac'])
+
+    return total_score
+
+
+def score_metrics(metrics, weights=None):
+    """Skor keamanan dari dict metrik (hasil evaluate_sbox atau baris evaluate_batch)."""
+    return calculate_security_score(
+        float(metrics['nl']), float(metrics['sac']), float(metrics['bic_nl']), float(metrics['bic_sac']),
+        weights=weights,
+    )
+
+
+# Skor 0-100 per metrik untuk objektif berbobot (lihat weighted_score)
+SCORE_TERMS = {
+    # Semakin tinggi semakin baik (ideal 112)
+    'nl': lambda value: (value / 112.0) * 100,
+    'bic_nl': lambda value: (value / 112.0) * 100,
+    # Ideal 0.5
+    'sac': lambda value: (1.0 - abs(value - 0.5) * 2) * 100,
+    # Ideal 0
+    'bic_sac': lambda value: max(0, (1.0 - value) * 100),
+    # Semakin rendah semakin baik; 100 = nilai terbaik yang diketahui untuk permutasi 8-bit (AES)
+    'du': lambda value: min(1.0, 4.0 / value) * 100,
+    'lap': lambda value: min(1.0, 0.0625 / value) * 100,
+    # TO (definisi Berta), AES = 3.26 dan permutasi acak ~3-4; skor 0 untuk TO >= 8
+    'to': lambda value: max(0, (1.0 - value / 8.0) * 100),
+}
+
+
+def weighted_score(metrics, weights=None):
+    """
+    Skor berbobot untuk metrik mana pun di SCORE_TERMS.
+    Dengan bobot default nilainya sama dengan calculate_security_score.
+    :param metrics: dict nama metrik -> nilai (cukup metrik yang bobotnya tidak nol)
+    :param weights: dict nama metrik -> bobot (default: DEFAULT_SCORE_WEIGHTS)
+    """
+    weights = DEFAULT_SCORE_WEIGHTS if weights is None else weights
+    unknown = set(weights) - set(SCORE_TERMS)
+    if unknown:
+        raise ValueError(f"Metrik skor tidak dikenal: {sorted(unknown)}")
+    return sum(SCORE_TERMS[name](metrics[name]) * weight for name, weight in weights.items() if weight)
@@ -0,0 +1,144 @@
+# analytics/screening.py
+"""
+Predikat ambang (early-exit) untuk menyaring kandidat S-box.
+Setiap predikat berhenti begitu ditemukan satu koefisien Walsh / entri DDT
+yang melanggar ambang, sehingga kandidat yang gagal tidak perlu dihitung penuh.
+"""
+
+import numpy as np
+
+from .ad import HW_TABLE, mobius_transform_batch
+from .nl import PARITY, fwht_batch
+
+_SIZE = 256
+_X = np.arange(_SIZE)
+# Jumlah baris DDT / mask output yang diperiksa per langkah (tetap tervektorisasi, tapi bisa berhenti cepat)
+_CHUNK = 16
+
+
+def _as_array(sbox):
+    return np.asarray([int(v) for v in sbox], dtype=np.int64)
+
+
+def _max_walsh(sbox, masks):
+    """Nilai |W| terbesar untuk fungsi komponen dengan mask output `masks`."""
+    signs = 1 - 2 * PARITY[np.asarray(masks)[:, None] & sbox[None, :]].astype(np.int64)
+    return int(np.abs(fwht_batch(signs, inplace=True)).max())
+
+
+def is_bijective(sbox):
+    """True jika S-box adalah permutasi 0-255."""
+    sbox = _as_array(sbox)
+    return sbox.shape == (_SIZE,) and bool((np.sort(sbox) == _X).all())
+
+
+def du_at_most(sbox, threshold):
+    """True jika DU <= threshold; berhenti pada baris DDT pertama yang melanggar."""
+    sbox = _as_array(sbox)
+    for start in range(1, _SIZE, _CHUNK):
+        delta_x = np.arange(start, min(start + _CHUNK, _SIZE))
+        delta_y = sbox[_X[None, :]] ^ sbox[_X[None, :] ^ delta_x[:, None]]
+        rows = np.arange(delta_x.size)[:, None] * _SIZE + delta_y
+        if np.bincount(rows.ravel(), minlength=delta_x.size * _SIZE).max() > threshold:
+            return False
+    return True
+
+
+def dap_at_most(sbox, threshold):
+    """True jika DAP (= DU / 256) <= threshold."""
+    return du_at_most(sbox, int(np.floor(threshold * _SIZE + 1e-9)))
+
+
+def nl_at_least(sbox, threshold):
+    """True jika NL (minimum 8 fungsi koordinat) >= threshold; berhenti pada koordinat pertama yang gagal."""
+    sbox = _as_array(sbox)
+    for bit in range(8):
+        if 128 - _max_walsh(sbox, [1 << bit]) // 2 < threshold:
+            return False
+    return True
+
+
+def bic_nl_at_least(sbox, threshold):
+    """True jika BIC-NL (minimum 28 pasangan bit output) >= threshold."""
+    sbox = _as_array(sbox)
+    for j in range(8):
+        for k in range(j + 1, 8):
+            if 128 - _max_walsh(sbox, [(1 << j) | (1 << k)]) // 2 < threshold:
+                return False
+    return True
+
+
+def lap_at_most(sbox, threshold):
+    """True jika LAP <= threshold; spektrum dihitung per kelompok mask output dan berhenti lebih awal."""
+    sbox = _as_array(sbox)
+    limit = threshold * _SIZE
+    for start in range(1, _SIZE, _CHUNK):
+        masks = np.arange(start, min(start + _CHUNK, _SIZE))
+        signs = 1 - 2 * PARITY[masks[:, None] & sbox[None, :]].astype(np.int64)
+        walsh = fwht_batch(signs, inplace=True)
+        if (np.abs(walsh[:, 1:]).max() // 2) > limit:
+            return False
+    return True
+
+
+def ad_at_least(sbox, degree):
+    """True jika AD >= degree; berhenti pada fungsi koordinat pertama yang mencapai derajat tersebut."""
+    sbox = _as_array(sbox)
+    for bit in range(8):
+        table = ((sbox >> bit) & 1).astype(np.uint8)
+        anf = mobius_transform_batch(table, inplace=True)
+        if int((anf * HW_TABLE).max()) >= degree:
+            return True
+    return False
+
+
+def sac_between(sbox, bounds):
+    """True jika rata-rata SAC berada di rentang [low, high] (inklusif)."""
+    low, high = bounds
+    sbox = _as_array(sbox)
+    flips = 1 << np.arange(8)
+    avalanche = (sbox[_X[None, :]] ^ sbox[_X[None, :] ^ flips[:, None]]).astype(np.uint8)
+    sac = np.unpackbits(avalanche).mean()
+    return bool(low <= sac <= high)
+
+
+# Nama kriteria -> predikat, diurutkan dari yang termurah
+SCREEN_ORDER = (
+    ('bijective', lambda sbox, required: is_bijective(sbox) or not required),
+    ('sac', sac_between),
+    ('du', du_at_most),
+    ('dap', dap_at_most),
+    ('nl', nl_at_least),
+    ('ad', ad_at_least),
+    ('bic_nl', bic_nl_at_least),
+    ('lap', lap_at_most),
+)
+
+
+def screen_sbox(sbox, criteria):
+    """
+    Menyaring S-box terhadap beberapa ambang sekaligus, dari kriteria termurah,
+    dan berhenti pada kegagalan pertama.
+
+    Contoh:
+        screen_sbox(sbox, {'bijective': True, 'du': 6, 'nl': 104, 'lap': 0.0625})
+
+    :param criteria: dict nama -> ambang; 'nl', 'bic_nl', 'ad' = batas bawah,
+                     'du', 'dap', 'lap' = batas atas, 'sac' = (low, high),
+                     'bijective' = True/False
+    :return: dict berisi 'passed' (bool), 'failed' (nama kriteria pertama yang gagal atau None)
+             dan 'checked' (kriteria yang sudah dievaluasi)
+    """
+    known = {name for name, _ in SCREEN_ORDER}
+    unknown = set(criteria) - known
+    if unknown:
+        raise ValueError(f"Kriteria tidak dikenal: {sorted(unknown)}")
+
+    checked = []
+    for name, predicate in SCREEN_ORDER:
+        if name not in criteria:
+            continue
+        checked.append(name)
+        if not predicate(sbox, criteria[name]):
+            return {'passed': False, 'failed': name, 'checked': checked}
+    return {'passed': True, 'failed': None, 'checked': checked}
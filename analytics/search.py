@@ -0,0 +1,222 @@
+# analytics/search.py
+"""
+Pencarian S-box heuristik dengan simulated annealing multi-pulau.
+
+Setiap pulau menjalankan simulated annealing atas permutasi 0-255: satu langkah
+menukar dua output (swap), sehingga S-box selalu bijective dan semua metrik dibaca
+secara inkremental dari MutableSBoxAnalysis (tanpa menghitung ulang tabel penuh).
+Pulau berjalan paralel di process pool; setelah setiap `migrate_every` epoch, kandidat
+terbaik tiap pulau bermigrasi ke pulau berikutnya (topologi cincin) jika lebih baik.
+Setiap pulau punya generator acak sendiri dari satu seed, sehingga hasil bisa diulang
+dan tidak bergantung pada jumlah worker.
+
+Pemakaian:
+    python -m analytics.search [--output PATH] [--islands N] [--epochs N] [--steps N]
+                               [--seed N] [--weights nl=0.3,sac=0.3,bic_nl=0.2,bic_sac=0.2]
+                               [--top N] [--workers N]
+"""
+
+import argparse
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Memastikan Python bisa menemukan folder analytics saat dijalankan sebagai script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics.incremental import MutableSBoxAnalysis
+from analytics.score import DEFAULT_SCORE_WEIGHTS, SCORE_TERMS, weighted_score
+from analytics.screening import is_bijective
+
+DEFAULT_ISLANDS = 4
+DEFAULT_OUTPUT = 'sbox_search.json'
+
+
+def _objective(analysis, weights):
+    """Skor berbobot dan nilai metrik yang dipakai (hanya metrik dengan bobot tidak nol)."""
+    metrics = {name: getattr(analysis, name) for name, weight in weights.items() if weight}
+    return weighted_score(metrics, weights), metrics
+
+
+def _temperature(step, total, t_start, t_end):
+    """Pendinginan geometrik dari t_start ke t_end sepanjang `total` langkah."""
+    return t_start * (t_end / t_start) ** (step / max(1, total - 1))
+
+
+def _run_island(state, weights, steps, first_step, total_steps, t_start, t_end):
+    """
+    Fungsi worker (level modul agar bisa di-pickle): menjalankan `steps` langkah annealing
+    untuk satu pulau dan mengembalikan state barunya.
+    """
+    rng = np.random.default_rng()
+    rng.bit_generator.state = state['rng']
+    analysis = MutableSBoxAnalysis(state['sbox'])
+    score, metrics = _objective(analysis, weights)
+    best = state['best'] or {'sbox': analysis.sbox, 'score': score, 'metrics': metrics}
+
+    accepted = 0
+    for step in range(first_step, first_step + steps):
+        temperature = _temperature(step, total_steps, t_start, t_end)
+        i = int(rng.integers(256))
+        j = (i + int(rng.integers(1, 256))) % 256
+        analysis.swap(i, j)
+
+        new_score, new_metrics = _objective(analysis, weights)
+        delta = new_score - score
+        if delta >= 0 or rng.random() < math.exp(delta / temperature):
+            score, metrics = new_score, new_metrics
+            accepted += 1
+            if score > best['score']:
+                best = {'sbox': analysis.sbox, 'score': score, 'metrics': metrics}
+        else:
+            analysis.undo()
+
+    return {
+        'sbox': analysis.sbox,
+        'score': score,
+        'best': best,
+        'rng': rng.bit_generator.state,
+        'accepted': state.get('accepted', 0) + accepted,
+    }
+
+
+def _migrate(states):
+    """Migrasi cincin: kandidat terbaik pulau k-1 menggantikan posisi pulau k jika lebih baik."""
+    bests = [state['best'] for state in states]
+    for k, state in enumerate(states):
+        incoming = bests[k - 1]
+        if incoming['score'] > state['score']:
+            state['sbox'] = list(incoming['sbox'])
+            state['score'] = incoming['score']
+
+
+def search_sboxes(weights=None, islands=DEFAULT_ISLANDS, epochs=10, steps=1000, seed=0,
+                  t_start=1.0, t_end=0.01, migrate_every=1, initial=None, workers=None, progress=None):
+    """
+    Mencari S-box bijective dengan skor objektif setinggi mungkin.
+
+    :param weights: bobot objektif per metrik (nl, du, lap, sac, bic_nl, bic_sac, to; lihat SCORE_TERMS),
+                    default = bobot calculate_security_score
+    :param islands: jumlah pulau annealing independen
+    :param epochs: jumlah epoch; migrasi terjadi di antara epoch
+    :param steps: jumlah swap per pulau per epoch
+    :param seed: seed utama (setiap pulau mendapat turunan SeedSequence sendiri)
+    :param t_start: temperatur awal (dalam satuan poin skor)
+    :param t_end: temperatur akhir
+    :param migrate_every: migrasi setiap N epoch (0 = tanpa migrasi)
+    :param initial: S-box awal semua pulau (default: permutasi acak per pulau)
+    :param workers: jumlah proses (default: min(jumlah pulau, jumlah core)); 1 = tanpa pool
+    :param progress: callback(epoch, epochs, best_score) opsional
+    :return: dict berisi 'best' (dict sbox, score, metrics), 'candidates' (terbaik tiap pulau,
+             urut skor, tanpa duplikat) dan 'history' (skor terbaik per epoch)
+    """
+    weights = dict(DEFAULT_SCORE_WEIGHTS if weights is None else weights)
+    unknown = set(weights) - set(SCORE_TERMS)
+    if unknown:
+        raise ValueError(f"Metrik objektif tidak dikenal: {sorted(unknown)}")
+    if not any(weights.values()):
+        raise ValueError("Minimal satu bobot objektif harus tidak nol.")
+    if islands < 1 or epochs < 1 or steps < 1:
+        raise ValueError("islands, epochs dan steps minimal 1.")
+    if not 0 < t_end <= t_start:
+        raise ValueError("Temperatur harus memenuhi 0 < t_end <= t_start.")
+    if initial is not None and not is_bijective(initial):
+        raise ValueError("S-box awal harus bijective (permutasi 0-255).")
+    workers = min(islands, workers or os.cpu_count() or 1)
+
+    states = []
+    for child in np.random.SeedSequence(seed).spawn(islands):
+        rng = np.random.default_rng(child)
+        sbox = [int(v) for v in initial] if initial is not None else rng.permutation(256).tolist()
+        states.append({'sbox': sbox, 'best': None, 'rng': rng.bit_generator.state})
+
+    total_steps = epochs * steps
+    history = []
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for epoch in range(epochs):
+            args = (weights, steps, epoch * steps, total_steps, t_start, t_end)
+            if pool is None:
+                states = [_run_island(state, *args) for state in states]
+            else:
+                futures = [pool.submit(_run_island, state, *args) for state in states]
+                states = [future.result() for future in futures]
+
+            if migrate_every and islands > 1 and (epoch + 1) % migrate_every == 0:
+                _migrate(states)
+
+            best_score = max(state['best']['score'] for state in states)
+            history.append(best_score)
+            if progress:
+                progress(epoch + 1, epochs, best_score)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    candidates = []
+    for candidate in sorted((state['best'] for state in states), key=lambda c: -c['score']):
+        if all(candidate['sbox'] != other['sbox'] for other in candidates):
+            candidates.append(candidate)
+    return {'best': candidates[0], 'candidates': candidates, 'history': history}
+
+
+def save_sbox_json(sbox, path, key='sbox44'):
+    """Menyimpan S-box dengan format assets/sbox44.json: {"sbox44": [...]}."""
+    with open(path, 'w') as f:
+        f.write('{\n    "%s": [%s]\n}\n' % (key, ','.join(str(int(v)) for v in sbox)))
+    return path
+
+
+def save_candidates(candidates, path, top=1):
+    """
+    Menyimpan kandidat terbaik: peringkat 1 ke `path`, peringkat 2..top ke <nama>_<peringkat>.json.
+    :return: list path yang ditulis
+    """
+    stem, ext = os.path.splitext(path)
+    saved = []
+    for rank, candidate in enumerate(candidates[:top], 1):
+        target = path if rank == 1 else f"{stem}_{rank}{ext or '.json'}"
+        saved.append(save_sbox_json(candidate['sbox'], target))
+    return saved
+
+
+def _parse_weights(text):
+    """'nl=0.4,du=0.2' -> {'nl': 0.4, 'du': 0.2}"""
+    if not text:
+        return None
+    weights = {}
+    for item in text.split(','):
+        name, _, value = item.partition('=')
+        weights[name.strip()] = float(value)
+    return weights
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pencarian S-box bijective dengan simulated annealing multi-pulau.")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help=f"file JSON S-box terbaik (default: {DEFAULT_OUTPUT})")
+    parser.add_argument('--islands', type=int, default=DEFAULT_ISLANDS, help="jumlah pulau annealing")
+    parser.add_argument('--epochs', type=int, default=10, help="jumlah epoch (migrasi di antara epoch)")
+    parser.add_argument('--steps', type=int, default=1000, help="jumlah swap per pulau per epoch")
+    parser.add_argument('--seed', type=int, default=0, help="seed utama (hasil bisa diulang)")
+    parser.add_argument('--weights', default=None,
+                        help="bobot objektif, contoh nl=0.3,du=0.2,lap=0.2,sac=0.1,bic_sac=0.1,to=0.1")
+    parser.add_argument('--top', type=int, default=1, help="jumlah kandidat terbaik yang disimpan")
+    parser.add_argument('--workers', type=int, default=None, help="jumlah proses (default: jumlah core)")
+    args = parser.parse_args(argv)
+
+    def progress(epoch, epochs, best_score):
+        print(f"epoch {epoch}/{epochs}: skor terbaik {best_score:.4f}", flush=True)
+
+    result = search_sboxes(weights=_parse_weights(args.weights), islands=args.islands, epochs=args.epochs,
+                           steps=args.steps, seed=args.seed, workers=args.workers, progress=progress)
+    for path in save_candidates(result['candidates'], args.output, top=args.top):
+        print(f"Disimpan: {path}")
+    best = result['best']
+    print(f"Skor terbaik {best['score']:.4f}: " + ', '.join(f"{name}={value}" for name, value in best['metrics'].items()))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,38 +2,68 @@
 
 import numpy as np
 
-def calc_to_measure(sbox):
+from .nl import fwht_batch
+from .profile import as_profile
+
+# Hamming weight 0–255
+HW = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.int64)
+
+TO_DEFINITIONS = ('berta', 'prouff')
+
+def calc_to_measure(sbox, definition='berta'):
     """
     Transparency Order (TO)
-    Implementasi berdasarkan definisi Berta et al., 2014.
     Input:
         sbox -> array/list 256 elemen, nilai 0–255 (8-bit)
+        (atau SBoxProfile)
+        definition -> 'berta' (default, definisi Berta et al., 2014 yang dipakai aplikasi)
+                      atau 'prouff' (definisi asli Prouff, 2005)
     Output:
         nilai Transparency Order (semakin kecil semakin baik)
     """
+    if definition not in TO_DEFINITIONS:
+        raise ValueError(f"definition harus salah satu dari {TO_DEFINITIONS}.")
+    profile = as_profile(sbox)
+    if definition == 'prouff':
+        return _prouff_to(profile)
+    return _berta_to(profile)
+
 
-    # pastikan array numpy
-    sbox = np.array(sbox, dtype=np.uint8)
+def _berta_to(profile):
+    """
+    max_{a != 0, b != 0} |sum_x (HW(S(x XOR a)) - HW(S(x))) * (HW(S(x)) XOR b)| / 256
+    Dihitung sebagai satu perkalian matriks (255 x 256) @ (256 x 255).
+    """
+    sbox = np.asarray(profile.sbox, dtype=np.int64)
+    x = np.arange(256)
+    masks = np.arange(1, 256)
 
-    # Precompute Hamming weight 0–255
-    HW = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+    hw_y = HW[sbox]                                   # HW(S(x))
+    # Per mask input a: vektor selisih HW untuk semua x
+    hw_diff = HW[sbox[x[None, :] ^ masks[:, None]]] - hw_y[None, :]
+    # Per mask output b: suku leakage HW(S(x)) XOR b
+    leak = hw_y[None, :] ^ masks[:, None]
 
-    max_val = 0.0
-    for a in range(1, 256):        # mask input ≠ 0
-        for b in range(1, 256):    # mask output ≠ 0
-            total = 0.0
-            for x in range(256):
-                x1 = x
-                x2 = x ^ a
+    total = hw_diff @ leak.T                          # total[a-1][b-1]
+    return float(np.abs(total).max() / 256.0)
 
-                y1 = sbox[x1]
-                y2 = sbox[x2]
 
-                # Hamming Weight leakage model
-                leak = HW[y1] ^ (b & 0xFF)  # XOR correlated leakage
-                total += ((HW[y2] - HW[y1]) * leak)
+def _prouff_to(profile):
+    """
+    TO(S) = max_beta ( |m - 2 HW(beta)|
+                       - 1/(2^2n - 2^n) * sum_{a != 0} |sum_j (-1)^beta_j * AC_j(a)| )
+    dengan AC_j(a) = sum_x (-1)^(S_j(x) XOR S_j(x XOR a)) autokorelasi fungsi koordinat j.
+    Autokorelasi diambil dari spektrum Walsh profil: AC_j = WHT(W_j^2) / 2^n.
+    """
+    n = m = 8
+    size = 256
+    coordinates = profile.walsh[[1 << j for j in range(m)]]
+    autocorrelation = fwht_batch(coordinates * coordinates, inplace=True) // size
 
-            val = abs(total) / 256.0
-            max_val = max(max_val, val)
+    betas = np.arange(size)
+    bits = (betas[:, None] >> np.arange(m)[None, :]) & 1
+    signs = 1 - 2 * bits                              # (-1)^beta_j, bentuk (256, 8)
 
-    return float(max_val)
\ No newline at end of file
+    correlation = np.abs(signs @ autocorrelation[:, 1:]).sum(axis=1)
+    to_values = np.abs(m - 2 * HW[betas]) - correlation / (2 ** (2 * n) - 2 ** n)
+    return float(to_values.max())
@@ -0,0 +1,41 @@
+# analytics/warmup.py
+
+import os
+import threading
+
+from .evaluate import evaluate_sbox
+
+# Set SBOX44_WARMUP=0 untuk mematikan warm-up saat startup (backend & Streamlit)
+WARMUP_ENV = 'SBOX44_WARMUP'
+
+
+def warmup_enabled():
+    """False jika warm-up dimatikan lewat environment variable SBOX44_WARMUP."""
+    return os.environ.get(WARMUP_ENV, '1').lower() not in ('0', 'false', 'no')
+
+
+def warm_up_metrics(sboxes, cache=None, store_tables=True, background=True):
+    """
+    Menghitung metrik (dan tabel DDT/LAT) beberapa S-box di muka ke cache metrik,
+    sehingga permintaan pertama untuk S-box tersebut cukup berupa lookup.
+    Permintaan yang datang saat warm-up masih berjalan menunggu hasil yang sama
+    (tidak menghitung ulang).
+
+    :param sboxes: iterable S-box (list 256 elemen); None dilewati
+    :param cache: MetricCache (None = cache bersama)
+    :param store_tables: True = ikut menyimpan DDT dan LAT
+    :param background: True = jalan di thread daemon dan langsung kembali
+    :return: thread warm-up (background=True) atau None
+    """
+    sboxes = [list(sbox) for sbox in sboxes if sbox is not None]
+
+    def run():
+        for sbox in sboxes:
+            evaluate_sbox(sbox, cache=cache, store_tables=store_tables)
+
+    if not background:
+        run()
+        return None
+    thread = threading.Thread(target=run, name="metric-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -16,9 +16,8 @@ from components.ui_sbox_modifier import (
     AES_AFFINE_CONSTANT
 )
 from analytics import (
-    calc_nl_measure, calc_sac_measure, calc_bic_nl_measure, calc_bic_sac_measure,
-    calc_lap_measure, calc_dap_measure, calc_to_measure, calc_du_measure, calc_ad_measure,
-    calc_ci_measure, check_sbox_basic_properties
+    check_sbox_basic_properties, evaluate_sbox, warm_up_metrics, warmup_enabled,
+    AffineSBox, verify_affine, calculate_security_score
 )
 from aes_engine.utils import SBOX
 from aes_engine.modes import AESModes
@@ -39,14 +38,8 @@ import numpy as np
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
 
-def calculate_security_score(nl, sac, bic_nl, bic_sac):
-    """Calculate security score from metrics (extracted to avoid duplication)"""
-    nl_score = (nl / 112.0) * 100
-    sac_score = (1.0 - abs(sac - 0.5) * 2) * 100
-    bic_nl_score = (bic_nl / 112.0) * 100
-    bic_sac_score = max(0, (1.0 - bic_sac) * 100)
-    total_score = (nl_score * 0.3 + sac_score * 0.3 + bic_nl_score * 0.2 + bic_sac_score * 0.2)
-    return total_score
+# Mode operasi yang didukung endpoint teks
+TEXT_MODES = ('ECB', 'CBC', 'CFB', 'OFB')
 
 @app.route('/api/health', methods=['GET'])
 def health():
@@ -115,48 +108,21 @@ def evaluate_security():
         if not sbox or len(sbox) != 256:
             return jsonify({'error': 'Valid S-box (256 elements) is required'}), 400
         
-        # 1. Basic Properties: Bijective & Balanced (Check first)
-        basic_props = check_sbox_basic_properties(sbox)
-        
-        # 2. Existing metrics
-        nl = calc_nl_measure(sbox)
-        sac = calc_sac_measure(sbox)
-        bic_nl = calc_bic_nl_measure(sbox)
-        bic_sac = calc_bic_sac_measure(sbox)
+        # Opsional: parameter konstruksi affine (matrix & constant dari /api/generate-sbox).
+        # Hanya dipakai jika terverifikasi cocok, lalu metrik invarian diambil dari peta invers GF(2^8).
+        matrix = data.get('matrix')
+        constant = data.get('constant')
+        if matrix is not None and constant is not None and verify_affine(sbox, matrix, constant):
+            sbox = AffineSBox(sbox, matrix, constant)
         
-        # 3. New metrics
-        lap = calc_lap_measure(sbox)
-        dap = calc_dap_measure(sbox)
-        du = calc_du_measure(sbox)
-        ad = calc_ad_measure(sbox)
-        to = calc_to_measure(sbox)
-        ci = calc_ci_measure(sbox)
+        # Properti dasar + semua metrik (dari cache jika S-box ini pernah dievaluasi,
+        # jika belum: dihitung langsung di proses ini dengan tabel bersama)
+        metrics = evaluate_sbox(sbox)
         
         # Hitung skor keamanan menggunakan fungsi terpusat
-        total_score = calculate_security_score(nl, sac, bic_nl, bic_sac)
+        total_score = calculate_security_score(metrics['nl'], metrics['sac'], metrics['bic_nl'], metrics['bic_sac'])
         
-        return jsonify({
-            # Basic Properties
-            'is_bijective': basic_props['is_bijective'],
-            'is_balanced': basic_props['is_balanced'],
-            'is_valid': basic_props['is_valid'],
-            'bijective_message': basic_props['bijective_message'],
-            'balanced_message': basic_props['balanced_message'],
-            # Existing metrics
-            'nl': nl,
-            'sac': sac,
-            'bic_nl': bic_nl,
-            'bic_sac': bic_sac,
-            # New metrics
-            'lap': lap,
-            'dap': dap,
-            'du': du,
-            'ad': ad,
-            'to': to,
-            'ci': ci,
-            # Score
-            'score': total_score
-        })
+        return jsonify(dict(metrics, score=total_score))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -170,48 +136,13 @@ def get_standard_sbox():
 @app.route('/api/standard-metrics', methods=['GET'])
 def get_standard_metrics():
     """Get standard AES S-box metrics"""
-    # 1. Basic Properties: Bijective & Balanced
-    basic_props = check_sbox_basic_properties(SBOX)
-    
-    # 2. Existing metrics
-    nl = calc_nl_measure(SBOX)
-    sac = calc_sac_measure(SBOX)
-    bic_nl = calc_bic_nl_measure(SBOX)
-    bic_sac = calc_bic_sac_measure(SBOX)
-    
-    # 3. New metrics
-    lap = calc_lap_measure(SBOX)
-    dap = calc_dap_measure(SBOX)
-    du = calc_du_measure(SBOX)
-    ad = calc_ad_measure(SBOX)
-    to = calc_to_measure(SBOX)
-    ci = calc_ci_measure(SBOX)
+    # Properti dasar + semua metrik (dari cache setelah panggilan pertama)
+    metrics = evaluate_sbox(SBOX)
     
     # Hitung skor keamanan menggunakan fungsi terpusat
-    total_score = calculate_security_score(nl, sac, bic_nl, bic_sac)
+    total_score = calculate_security_score(metrics['nl'], metrics['sac'], metrics['bic_nl'], metrics['bic_sac'])
     
-    return jsonify({
-        # Basic Properties
-        'is_bijective': basic_props['is_bijective'],
-        'is_balanced': basic_props['is_balanced'],
-        'is_valid': basic_props['is_valid'],
-        'bijective_message': basic_props['bijective_message'],
-        'balanced_message': basic_props['balanced_message'],
-        # Existing metrics
-        'nl': nl,
-        'sac': sac,
-        'bic_nl': bic_nl,
-        'bic_sac': bic_sac,
-        # New metrics
-        'lap': lap,
-        'dap': dap,
-        'du': du,
-        'ad': ad,
-        'to': to,
-        'ci': ci,
-        # Score
-        'score': total_score
-    })
+    return jsonify(dict(metrics, score=total_score))
 
 @app.route('/api/default-matrix', methods=['GET'])
 def get_default_matrix():
@@ -371,14 +302,20 @@ def encrypt_text():
             return jsonify({'error': 'Plaintext is required'}), 400
         if not key or len(key) != 16:
             return jsonify({'error': 'Key must be exactly 16 characters'}), 400
-        if mode == 'CBC' and (not iv or len(iv) != 16):
-            return jsonify({'error': 'IV must be exactly 16 characters for CBC mode'}), 400
+        if mode not in TEXT_MODES:
+            return jsonify({'error': f'Mode must be one of {", ".join(TEXT_MODES)}'}), 400
+        if mode != 'ECB' and (not iv or len(iv) != 16):
+            return jsonify({'error': f'IV must be exactly 16 characters for {mode} mode'}), 400
         
         cipher = AESModes(key, use_sbox44=use_sbox44)
         if mode == 'ECB':
             ciphertext_bytes = cipher.encrypt_ecb(plaintext)
-        else:
+        elif mode == 'CBC':
             ciphertext_bytes = cipher.encrypt_cbc(plaintext, iv)
+        elif mode == 'CFB':
+            ciphertext_bytes = cipher.encrypt_cfb(plaintext, iv)
+        else:
+            ciphertext_bytes = cipher.encrypt_ofb(plaintext, iv)
         
         return jsonify({
             'ciphertext_hex': ciphertext_bytes.hex(),
@@ -403,16 +340,22 @@ def decrypt_text():
             return jsonify({'error': 'Ciphertext is required'}), 400
         if not key or len(key) != 16:
             return jsonify({'error': 'Key must be exactly 16 characters'}), 400
-        if mode == 'CBC' and (not iv or len(iv) != 16):
-            return jsonify({'error': 'IV must be exactly 16 characters for CBC mode'}), 400
+        if mode not in TEXT_MODES:
+            return jsonify({'error': f'Mode must be one of {", ".join(TEXT_MODES)}'}), 400
+        if mode != 'ECB' and (not iv or len(iv) != 16):
+            return jsonify({'error': f'IV must be exactly 16 characters for {mode} mode'}), 400
         
         ciphertext_bytes = bytes.fromhex(ciphertext_hex)
         cipher = AESModes(key, use_sbox44=use_sbox44)
         
         if mode == 'ECB':
             decrypted = cipher.decrypt_ecb(ciphertext_bytes)
-        else:
+        elif mode == 'CBC':
             decrypted = cipher.decrypt_cbc(ciphertext_bytes, iv)
+        elif mode == 'CFB':
+            decrypted = cipher.decrypt_cfb(ciphertext_bytes, iv)
+        else:
+            decrypted = cipher.decrypt_ofb(ciphertext_bytes, iv)
         
         return jsonify({
             'plaintext': decrypted.decode('utf-8', errors='ignore')
@@ -673,43 +616,41 @@ def compare_metrics():
             return jsonify({'error': 'S-box not found'}), 404
         
         start_time = time.time()
-        # Basic Properties
-        basic_props = check_sbox_basic_properties(sbox)
-        # Existing metrics
-        nl_val = calc_nl_measure(sbox)
-        sac_val = calc_sac_measure(sbox)
-        bic_nl_val = calc_bic_nl_measure(sbox)
-        bic_sac_val = calc_bic_sac_measure(sbox)
-        # New metrics
-        lap_val = calc_lap_measure(sbox)
-        dap_val = calc_dap_measure(sbox)
-        to_val = calc_to_measure(sbox)
-        du_val = calc_du_measure(sbox)
-        ad_val = calc_ad_measure(sbox)
-        ci_val = calc_ci_measure(sbox)
+        # Properti dasar + semua metrik (dari cache setelah panggilan pertama)
+        metrics = evaluate_sbox(sbox)
         elapsed_time = int((time.time() - start_time) * 1000)
         
         return jsonify({
             # Basic Properties
-            'is_bijective': basic_props['is_bijective'],
-            'is_balanced': basic_props['is_balanced'],
+            'is_bijective': metrics['is_bijective'],
+            'is_balanced': metrics['is_balanced'],
             # Existing metrics
-            'nl': nl_val,
-            'sac': sac_val,
-            'bic_nl': bic_nl_val,
-            'bic_sac': bic_sac_val,
+            'nl': metrics['nl'],
+            'sac': metrics['sac'],
+            'bic_nl': metrics['bic_nl'],
+            'bic_sac': metrics['bic_sac'],
             # New metrics
-            'lap': lap_val,
-            'dap': dap_val,
-            'to': to_val,
-            'du': du_val,
-            'ad': ad_val,
-            'ci': ci_val,
+            'lap': metrics['lap'],
+            'dap': metrics['dap'],
+            'to': metrics['to'],
+            'du': metrics['du'],
+            'ad': metrics['ad'],
+            'ci': metrics['ci'],
             'time_ms': elapsed_time
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 if __name__ == '__main__':
+    # Mode debug menjalankan script ini dua kali (proses pemantau reloader + proses server).
+    # Pekerjaan startup hanya dijalankan di proses server (WERKZEUG_RUN_MAIN=true).
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        # Opsional: autotune engine AES saat startup (hasil disimpan ke file tuning)
+        if os.environ.get('SBOX44_AUTOTUNE', '').lower() in ('1', 'true', 'yes'):
+            from aes_engine.autotune import autotune
+            autotune(quick=True)
+        # Warm-up metrik S-box bawaan (AES & S-box44) di latar belakang, kecuali SBOX44_WARMUP=0
+        if warmup_enabled():
+            warm_up_metrics([SBOX, load_sbox44()])
     app.run(debug=True, port=5000)
 
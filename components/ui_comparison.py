@@ -3,11 +3,8 @@ import pandas as pd
 import numpy as np
 import time
 from aes_engine.modes import AESModes
-from analytics import (
-    calc_nl_measure, calc_sac_measure, calc_bic_nl_measure,
-    calc_bic_sac_measure, calc_lap_measure, calc_dap_measure, 
-    calc_to_measure, calc_du_measure, calc_ad_measure
-)
+import threading
+from analytics import evaluate_sbox, warm_up_metrics, warmup_enabled
 from aes_engine.utils import SBOX
 import json
 import os
@@ -27,6 +24,21 @@ def load_sbox44():
     except:
         return None
 
+_warmup_started = False
+_warmup_lock = threading.Lock()
+
+def start_metric_warmup():
+    """
+    Hitung metrik S-box bawaan di latar belakang (sekali per proses) agar perbandingan
+    pertama tidak menunggu analisis penuh. Dimatikan dengan SBOX44_WARMUP=0.
+    """
+    global _warmup_started
+    with _warmup_lock:
+        if _warmup_started or not warmup_enabled():
+            return
+        _warmup_started = True
+    warm_up_metrics([SBOX, load_sbox44()])
+
 def encrypt_data(data_type, data, key, is_sbox44, output_format):
     cipher = AESModes(key, use_sbox44=is_sbox44)
     
@@ -52,21 +64,16 @@ def get_metrics(is_sbox44):
         return [0, 0.0, 0, 0]
     
     start_time = time.time()
-    nl_val = calc_nl_measure(sbox)
-    sac_val = calc_sac_measure(sbox)
-    bic_nl_val = calc_bic_nl_measure(sbox)
-    bic_sac_val = calc_bic_sac_measure(sbox)
-    lap_val = calc_lap_measure(sbox)
-    dap_val = calc_dap_measure(sbox)
-    to_val = calc_to_measure(sbox)
-    du_val = calc_du_measure(sbox)
-    ad_val = calc_ad_measure(sbox)
+    # Semua metrik sekaligus, dari cache jika S-box ini pernah dievaluasi
+    metrics = evaluate_sbox(sbox)
     elapsed_time = (time.time() - start_time) * 1000  # dalam ms
     
-    return [nl_val, sac_val, bic_nl_val, bic_sac_val, lap_val, dap_val, to_val, du_val, ad_val, int(elapsed_time)]
+    return [metrics['nl'], metrics['sac'], metrics['bic_nl'], metrics['bic_sac'], metrics['lap'],
+            metrics['dap'], metrics['to'], metrics['du'], metrics['ad'], int(elapsed_time)]
 
 
 def render_comparison_ui():
+    start_metric_warmup()
     st.title("⚖️ Performance Comparison")
     st.markdown("Perbandingan langsung antara **AES Standard** dan **AES S-Box44** berdasarkan data input.")
 
@@ -5,9 +5,9 @@ import json
 from aes_engine.utils import SBOX
 from analytics import (
     calc_nl_measure, calc_sac_measure, calc_bic_nl_measure, calc_bic_sac_measure,
-    calc_lap_measure, calc_dap_measure, calc_to_measure, calc_du_measure, calc_ad_measure,
-    calc_ci_measure, check_sbox_basic_properties
+    evaluate_sbox, get_metric_executor, AffineSBox, calculate_security_score
 )
+from analytics.gf2 import pack_matrix, gf2_apply, is_invertible
 
 # Matriks affine standar AES (8x8)
 AES_AFFINE_MATRIX = [
@@ -64,36 +64,28 @@ def _gf2_multiply(a, b):
 
 def matrix_determinant_mod2(matrix):
     """
-    Menghitung determinan matriks 8x8 dalam GF(2) (mod 2).
-    Menggunakan eliminasi Gauss.
+    Menghitung determinan matriks persegi dalam GF(2) (mod 2).
+    Matriks 8x8 di-pack menjadi 8 byte lalu dieliminasi dengan XOR (lihat analytics.gf2);
+    ukuran lain memakai eliminasi XOR yang sama per baris bitmask.
+    Matriks yang tidak persegi atau berisi selain 0/1 dianggap determinan 0.
     """
-    mat = [row[:] for row in matrix]
-    n = len(mat)
-    det = 1
-    
-    for i in range(n):
-        # Cari baris dengan 1 di kolom i
-        pivot = -1
-        for j in range(i, n):
-            if mat[j][i] == 1:
-                pivot = j
-                break
-        
-        if pivot == -1:
-            return 0  # Determinant = 0
-        
-        # Swap rows
-        if pivot != i:
-            mat[i], mat[pivot] = mat[pivot], mat[i]
-            det = (det + 1) % 2  # Toggle sign (tapi di GF(2), -1 = 1)
-        
-        # Eliminasi
-        for j in range(i + 1, n):
-            if mat[j][i] == 1:
-                for k in range(i, n):
-                    mat[j][k] = (mat[j][k] + mat[i][k]) % 2
-    
-    return det
+    n = len(matrix)
+    if any(len(row) != n for row in matrix) or any(bit not in (0, 1) for row in matrix for bit in row):
+        return 0
+    if n == 8:
+        return 1 if is_invertible(pack_matrix(matrix)) else 0
+
+    rows = [sum(int(bit) << j for j, bit in enumerate(row)) for row in matrix]
+    for col in range(n):
+        bit = 1 << col
+        pivot = next((r for r in range(col, n) if rows[r] & bit), None)
+        if pivot is None:
+            return 0
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        for r in range(col + 1, n):
+            if rows[r] & bit:
+                rows[r] ^= rows[col]
+    return 1
 
 def is_matrix_balanced(matrix):
     """
@@ -214,28 +206,11 @@ def apply_affine_transformation(x, matrix, constant):
     """
     Menerapkan transformasi affine: y = matrix * x + constant
     x: input byte (0-255)
-    matrix: 8x8 binary matrix
+    matrix: 8x8 binary matrix (list of list) atau matriks packed 64-bit
     constant: 8-bit constant
     """
-    # Konversi x ke vektor biner 8-bit
-    x_vec = [(x >> i) & 1 for i in range(8)]
-    
-    # Perkalian matriks: matrix * x_vec
-    y_vec = [0] * 8
-    for i in range(8):
-        for j in range(8):
-            y_vec[i] ^= matrix[i][j] * x_vec[j]
-    
-    # Tambahkan konstanta (XOR dalam GF(2))
-    const_vec = [(constant >> i) & 1 for i in range(8)]
-    y_vec = [y_vec[i] ^ const_vec[i] for i in range(8)]
-    
-    # Konversi kembali ke byte
-    y = 0
-    for i in range(8):
-        y |= (y_vec[i] << i)
-    
-    return y
+    packed = matrix if isinstance(matrix, int) else pack_matrix(matrix)
+    return gf2_apply(packed, x) ^ constant
 
 def generate_sbox_from_affine(matrix, constant):
     """
@@ -243,41 +218,25 @@ def generate_sbox_from_affine(matrix, constant):
     1. Hitung invers perkalian GF(2^8) untuk setiap input
     2. Terapkan transformasi affine
     3. Tambahkan konstanta
+
+    Hasilnya berupa AffineSBox (list yang membawa matrix & constant), sehingga
+    analytics bisa memakai invarian peta invers GF(2^8) tanpa menghitung ulang DDT/LAT.
     """
     sbox = [0] * 256
+    packed = pack_matrix(matrix)
     
     for x in range(256):
         # Langkah 1: Hitung invers perkalian GF(2^8)
         inv_x = gmul_inverse(x)
         
         # Langkah 2 & 3: Terapkan transformasi affine + konstanta
-        sbox[x] = apply_affine_transformation(inv_x, matrix, constant)
+        sbox[x] = apply_affine_transformation(inv_x, packed, constant)
     
+    # Tandai hanya jika matriks invertible (S-box affine-ekuivalen dengan peta invers)
+    if is_invertible(packed):
+        return AffineSBox(sbox, matrix, constant)
     return sbox
 
-def calculate_security_score(nl, sac, bic_nl, bic_sac):
-    """
-    Menghitung skor keamanan gabungan.
-    Skor lebih tinggi = lebih baik.
-    """
-    # Normalisasi dan pembobotan
-    # NL ideal: 112, semakin tinggi semakin baik
-    nl_score = (nl / 112.0) * 100
-    
-    # SAC ideal: 0.5, semakin dekat 0.5 semakin baik
-    sac_score = (1.0 - abs(sac - 0.5) * 2) * 100
-    
-    # BIC-NL ideal: tinggi, semakin tinggi semakin baik
-    bic_nl_score = (bic_nl / 112.0) * 100
-    
-    # BIC-SAC ideal: 0, semakin rendah semakin baik
-    bic_sac_score = max(0, (1.0 - bic_sac) * 100)
-    
-    # Skor gabungan (weighted average)
-    total_score = (nl_score * 0.3 + sac_score * 0.3 + bic_nl_score * 0.2 + bic_sac_score * 0.2)
-    
-    return total_score
-
 def render_sbox_modifier_ui():
     st.title("🔧 AES S-Box Modifier")
     st.markdown("Modul untuk membangun dan mengevaluasi kandidat S-box baru menggunakan matriks affine kustom.")
@@ -500,33 +459,34 @@ def render_sbox_modifier_ui():
         
         if st.button("🧪 Jalankan Pengujian Keamanan", type="primary"):
             with st.spinner("Menghitung metrik keamanan..."):
-                # 1. Basic Properties: Bijective & Balanced
-                basic_props_candidate = check_sbox_basic_properties(candidate_sbox)
-                basic_props_standard = check_sbox_basic_properties(SBOX)
+                # 1. Kandidat: properti dasar + semua metrik beserta waktu per metrik
+                candidate_metrics, candidate_timings = get_metric_executor().evaluate(candidate_sbox)
+                # 2. AES standar: dari cache metrik (sudah dihitung sebelumnya)
+                standard_metrics = evaluate_sbox(SBOX)
+                basic_props_candidate = candidate_metrics
+                basic_props_standard = standard_metrics
                 
-                # 2. Hitung metrik untuk kandidat
-                nl_candidate = calc_nl_measure(candidate_sbox)
-                sac_candidate = calc_sac_measure(candidate_sbox)
-                bic_nl_candidate = calc_bic_nl_measure(candidate_sbox)
-                bic_sac_candidate = calc_bic_sac_measure(candidate_sbox)
-                lap_candidate = calc_lap_measure(candidate_sbox)
-                dap_candidate = calc_dap_measure(candidate_sbox)
-                du_candidate = calc_du_measure(candidate_sbox)
-                ad_candidate = calc_ad_measure(candidate_sbox)
-                to_candidate = calc_to_measure(candidate_sbox)
-                ci_candidate = calc_ci_measure(candidate_sbox)
+                nl_candidate = candidate_metrics['nl']
+                sac_candidate = candidate_metrics['sac']
+                bic_nl_candidate = candidate_metrics['bic_nl']
+                bic_sac_candidate = candidate_metrics['bic_sac']
+                lap_candidate = candidate_metrics['lap']
+                dap_candidate = candidate_metrics['dap']
+                du_candidate = candidate_metrics['du']
+                ad_candidate = candidate_metrics['ad']
+                to_candidate = candidate_metrics['to']
+                ci_candidate = candidate_metrics['ci']
                 
-                # 3. Hitung metrik untuk AES standar
-                nl_standard = calc_nl_measure(SBOX)
-                sac_standard = calc_sac_measure(SBOX)
-                bic_nl_standard = calc_bic_nl_measure(SBOX)
-                bic_sac_standard = calc_bic_sac_measure(SBOX)
-                lap_standard = calc_lap_measure(SBOX)
-                dap_standard = calc_dap_measure(SBOX)
-                du_standard = calc_du_measure(SBOX)
-                ad_standard = calc_ad_measure(SBOX)
-                to_standard = calc_to_measure(SBOX)
-                ci_standard = calc_ci_measure(SBOX)
+                nl_standard = standard_metrics['nl']
+                sac_standard = standard_metrics['sac']
+                bic_nl_standard = standard_metrics['bic_nl']
+                bic_sac_standard = standard_metrics['bic_sac']
+                lap_standard = standard_metrics['lap']
+                dap_standard = standard_metrics['dap']
+                du_standard = standard_metrics['du']
+                ad_standard = standard_metrics['ad']
+                to_standard = standard_metrics['to']
+                ci_standard = standard_metrics['ci']
                 
                 # Hitung skor keamanan
                 score_candidate = calculate_security_score(nl_candidate, sac_candidate, bic_nl_candidate, bic_sac_candidate)
@@ -593,6 +553,9 @@ def render_sbox_modifier_ui():
                 
                 df_metrics = pd.DataFrame(metrics_data)
                 st.dataframe(df_metrics, use_container_width=True)
+                st.caption("⏱️ Waktu per metrik kandidat (ms): " + ", ".join(
+                    f"{name.upper()} {ms:.1f}" for name, ms in candidate_timings.items() if name != 'total'
+                ) + f" | total {candidate_timings['total']:.1f} ms")
                 
                 # Visualisasi perbandingan
                 st.markdown("#### 📊 Grafik Perbandingan")
@@ -241,11 +241,18 @@ const SBoxModifier = () => {
     }
   }
 
-  const evaluateSecurity = async (sbox) => {
+  const evaluateSecurity = async (candidate) => {
     setLoading(true)
     setError(null)
     try {
-      const response = await axios.post(`${API_BASE_URL}/evaluate-security`, { sbox })
+      // matrix & constant (dari /generate-sbox) membuat backend memakai jalur affine yang lebih cepat;
+      // kandidat hasil upload Excel tidak punya keduanya sehingga cukup dikirim sbox
+      const payload = { sbox: candidate.sbox }
+      if (candidate.matrix && candidate.constant !== null && candidate.constant !== undefined) {
+        payload.matrix = candidate.matrix
+        payload.constant = candidate.constant
+      }
+      const response = await axios.post(`${API_BASE_URL}/evaluate-security`, payload)
       return response.data
     } catch (error) {
       const errorMsg = error.response?.data?.error || error.message || 'Terjadi kesalahan saat mengevaluasi keamanan'
@@ -262,7 +269,7 @@ const SBoxModifier = () => {
       return
     }
 
-    const metricsData = await evaluateSecurity(selectedCandidate.sbox)
+    const metricsData = await evaluateSecurity(selectedCandidate)
     if (metricsData) {
       setMetrics(metricsData)
       // Update candidate with metrics using functional update
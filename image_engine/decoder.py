@@ -5,7 +5,7 @@ import numpy as np
 from aes_engine.modes import AESModes
 
 
-def decrypt_image(encrypted_image, key, use_sbox44=False, mode='ECB', iv=None):
+def decrypt_image(encrypted_image, key, use_sbox44=False, mode='ECB', iv=None, engine_mode='auto'):
     """
     Mendekripsi gambar yang terenkripsi menggunakan AES.
     
@@ -14,39 +14,35 @@ def decrypt_image(encrypted_image, key, use_sbox44=False, mode='ECB', iv=None):
     :param use_sbox44: Boolean, True jika menggunakan S-box44
     :param mode: 'ECB' atau 'CBC'
     :param iv: Initialization Vector untuk CBC mode (16 karakter)
+    :param engine_mode: engine AESModes ('auto', 'scalar', 'batch', 'thread', 'process');
+                        default 'auto' memilih engine sesuai ukuran gambar
     :return: PIL Image object yang didekripsi
     """
-    # Konversi gambar ke numpy array
-    img_array = np.array(encrypted_image)
+    # Konversi gambar ke numpy array (contiguous agar bisa dibaca sebagai buffer)
+    img_array = np.ascontiguousarray(np.array(encrypted_image))
     original_shape = img_array.shape
     
-    # Flatten array menjadi 1D
-    flat_array = img_array.flatten()
-    
-    # Konversi ke bytes
-    img_bytes = flat_array.tobytes()
+    # Flatten array menjadi 1D (view, tanpa salinan)
+    flat_array = img_array.reshape(-1)
     
     # Inisialisasi cipher
-    cipher = AESModes(key, use_sbox44=use_sbox44)
+    cipher = AESModes(key, use_sbox44=use_sbox44, engine_mode=engine_mode)
+    
+    # Buffer output seukuran input; dekripsi ditulis langsung ke sini
+    decrypted_buffer = np.empty(flat_array.nbytes, dtype=np.uint8)
     
     # Dekripsi
     if mode == 'ECB':
-        decrypted_bytes = cipher.decrypt_ecb(img_bytes)
+        cipher.decrypt_ecb_into(flat_array, decrypted_buffer)
     elif mode == 'CBC':
         if iv is None:
             raise ValueError("IV diperlukan untuk mode CBC")
-        decrypted_bytes = cipher.decrypt_cbc(img_bytes, iv)
+        cipher.decrypt_cbc_into(flat_array, decrypted_buffer, iv)
     else:
         raise ValueError(f"Mode {mode} tidak didukung")
     
-    # Pastikan panjang decrypted_bytes sesuai dengan yang diharapkan
-    expected_size = len(img_bytes)
-    if len(decrypted_bytes) > expected_size:
-        # Ambil hanya bytes yang sesuai dengan ukuran asli
-        decrypted_bytes = decrypted_bytes[:expected_size]
-    
-    # Konversi kembali ke numpy array
-    decrypted_array = np.frombuffer(decrypted_bytes, dtype=img_array.dtype)
+    # Konversi kembali ke numpy array dengan dtype asli
+    decrypted_array = decrypted_buffer.view(img_array.dtype)
     
     # Reshape ke bentuk asli
     decrypted_array = decrypted_array.reshape(original_shape)
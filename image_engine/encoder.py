@@ -5,7 +5,7 @@ import numpy as np
 from aes_engine.modes import AESModes
 
 
-def encrypt_image(image, key, use_sbox44=False, mode='ECB', iv=None):
+def encrypt_image(image, key, use_sbox44=False, mode='ECB', iv=None, engine_mode='auto'):
     """
     Mengenkripsi gambar menggunakan AES.
     
@@ -14,40 +14,36 @@ def encrypt_image(image, key, use_sbox44=False, mode='ECB', iv=None):
     :param use_sbox44: Boolean, True untuk menggunakan S-box44
     :param mode: 'ECB' atau 'CBC'
     :param iv: Initialization Vector untuk CBC mode (16 karakter)
+    :param engine_mode: engine AESModes ('auto', 'scalar', 'batch', 'thread', 'process');
+                        default 'auto' memilih engine sesuai ukuran gambar
     :return: PIL Image object yang terenkripsi
     """
-    # Konversi gambar ke numpy array
-    img_array = np.array(image)
+    # Konversi gambar ke numpy array (contiguous agar bisa dibaca sebagai buffer)
+    img_array = np.ascontiguousarray(np.array(image))
     original_shape = img_array.shape
     
-    # Flatten array menjadi 1D
-    flat_array = img_array.flatten()
-    
-    # Konversi ke bytes
-    img_bytes = flat_array.tobytes()
+    # Flatten array menjadi 1D (view, tanpa salinan)
+    flat_array = img_array.reshape(-1)
+    expected_size = flat_array.nbytes
     
     # Inisialisasi cipher
-    cipher = AESModes(key, use_sbox44=use_sbox44)
+    cipher = AESModes(key, use_sbox44=use_sbox44, engine_mode=engine_mode)
+    
+    # Buffer output dialokasikan sekali, termasuk ruang untuk blok padding
+    encrypted_buffer = np.empty(cipher.padded_length(expected_size), dtype=np.uint8)
     
-    # Enkripsi
+    # Enkripsi langsung ke buffer output
     if mode == 'ECB':
-        encrypted_bytes = cipher.encrypt_ecb(img_bytes)
+        cipher.encrypt_ecb_into(flat_array, encrypted_buffer)
     elif mode == 'CBC':
         if iv is None:
             raise ValueError("IV diperlukan untuk mode CBC")
-        encrypted_bytes = cipher.encrypt_cbc(img_bytes, iv)
+        cipher.encrypt_cbc_into(flat_array, encrypted_buffer, iv)
     else:
         raise ValueError(f"Mode {mode} tidak didukung")
     
-    # Pastikan panjang encrypted_bytes sesuai dengan yang diharapkan
-    # Jika lebih panjang karena padding, potong sesuai ukuran asli
-    expected_size = len(img_bytes)
-    if len(encrypted_bytes) > expected_size:
-        # Ambil hanya bytes yang sesuai dengan ukuran asli
-        encrypted_bytes = encrypted_bytes[:expected_size]
-    
-    # Konversi kembali ke numpy array
-    encrypted_array = np.frombuffer(encrypted_bytes, dtype=img_array.dtype)
+    # Ambil hanya bytes yang sesuai dengan ukuran asli (blok padding dibuang)
+    encrypted_array = encrypted_buffer[:expected_size].view(img_array.dtype)
     
     # Reshape ke bentuk asli
     encrypted_array = encrypted_array.reshape(original_shape)
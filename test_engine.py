@@ -61,6 +61,91 @@ def test_encryption_flow():
         print(f" ❌ ERROR pada S-box44: {e}")
         print("    (Pastikan file assets/sbox44.json sudah ada dan formatnya benar)")
 
+def test_buffer_into_flow():
+    print("\n" + "="*50)
+    print("🧩 MULAI TEST API WRITE-INTO-BUFFER")
+    print("="*50)
+
+    key = "kuncirahasia1234"
+    iv = "vektorinisial123"
+    plaintext = b"Buffer milik pemanggil, tanpa salinan tambahan!"
+
+    for use_sbox44 in (False, True):
+        cipher = AESModes(key, use_sbox44=use_sbox44)
+
+        out = bytearray(cipher.padded_length(len(plaintext)))
+        written = cipher.encrypt_ecb_into(memoryview(plaintext), out)
+        assert written == len(out)
+        assert bytes(out) == cipher.encrypt_ecb(plaintext)
+
+        # Dekripsi in-place: buffer input sekaligus buffer output
+        length = cipher.decrypt_ecb_into(out, out)
+        assert bytes(out[:length]) == plaintext
+
+        out = bytearray(cipher.padded_length(len(plaintext)))
+        cipher.encrypt_cbc_into(plaintext, out, iv)
+        assert bytes(out) == cipher.encrypt_cbc(plaintext, iv)
+        length = cipher.decrypt_cbc_into(out, out, iv)
+        assert bytes(out[:length]) == plaintext
+
+    # Engine batch & thread pool harus menghasilkan ciphertext yang identik dengan skalar
+    data = bytes(range(256)) * 40 + b"ekor"
+    reference = AESModes(key).encrypt_ecb(data)
+    for engine_mode in ("batch", "thread"):
+        cipher = AESModes(key, engine_mode=engine_mode, workers=4)
+        assert cipher.encrypt_ecb(data) == reference
+        assert cipher.decrypt_cbc(cipher.encrypt_cbc(data, iv), iv) == data
+
+    print(" ✅ SUCCESS: encrypt_*_into / decrypt_*_into konsisten dengan API lama!")
+
+def test_stream_modes_flow():
+    print("\n" + "="*50)
+    print("🌊 MULAI TEST MODE CFB & OFB")
+    print("="*50)
+
+    key = "kuncirahasia1234"
+    iv = "vektorinisial123"
+    plaintext = b"Stream tanpa padding: panjang ciphertext = panjang plaintext."
+
+    for use_sbox44 in (False, True):
+        cipher = AESModes(key, use_sbox44=use_sbox44)
+
+        encrypted = cipher.encrypt_cfb(plaintext, iv)
+        assert len(encrypted) == len(plaintext)
+        assert cipher.decrypt_cfb(encrypted, iv) == plaintext
+
+        encrypted = cipher.encrypt_ofb(plaintext, iv)
+        assert cipher.decrypt_ofb(encrypted, iv) == plaintext
+
+        # Keystream yang di-prefetch ke ring buffer, dipakai per potongan data
+        with cipher.ofb_keystream(iv, buffer_blocks=2) as keystream:
+            chunks = [keystream.xor(plaintext[i : i+7]) for i in range(0, len(plaintext), 7)]
+        assert b"".join(chunks) == encrypted
+
+    print(" ✅ SUCCESS: CFB/OFB round-trip dan keystream prefetch konsisten!")
+
+def test_xts_flow():
+    print("\n" + "="*50)
+    print("💽 MULAI TEST MODE XTS (SEKTOR)")
+    print("="*50)
+
+    # IEEE 1619 XTS-AES-128, vektor #4 (S-box standar)
+    key1 = bytes.fromhex("27182818284590452353602874713526")
+    key2 = bytes.fromhex("31415926535897932384626433832795")
+    plaintext = bytes(range(256)) * 2
+    ciphertext = AESModes(key1).encrypt_xts(plaintext, key2, 0)
+    assert ciphertext.hex().startswith("27a7479befa1d476489f308cd4cfa6e2a96e4bbe3208ff25287dd3819616e89c")
+
+    # S-box44: setiap sektor bisa didekripsi secara acak tanpa IV tersimpan
+    cipher = AESModes("kuncirahasia1234", use_sbox44=True)
+    tweak_key = "kuncitweak123456"
+    data = bytes(range(256)) * 8
+    encrypted = cipher.encrypt_xts_sectors(data, tweak_key, sector_size=512, first_sector=100)
+    assert cipher.decrypt_xts(encrypted[1024:1536], tweak_key, 102) == data[1024:1536]
+    assert cipher.decrypt_xts_sectors(encrypted, tweak_key, 512, first_sector=100) == data
+
+    print(" ✅ SUCCESS: XTS cocok dengan vektor IEEE 1619 dan bisa diakses per sektor!")
+
 def test_analytics():
     print("\n" + "="*50)
     print("📊 MULAI TEST ANALYTICS (Kalkulasi S-box Standar)")
@@ -96,6 +181,239 @@ def test_analytics():
     except Exception as e:
         print(f"\n ❌ ERROR pada Analytics: {e}")
 
+def test_incremental_swap_undo():
+    print("\n" + "="*50)
+    print("🔁 MULAI TEST ANALISIS INKREMENTAL (SWAP/UNDO)")
+    print("="*50)
+
+    import numpy as np
+    from analytics import MutableSBoxAnalysis, SBoxProfile
+
+    rng = np.random.default_rng(45)
+    analysis = MutableSBoxAnalysis(rng.permutation(256).tolist())
+    for step in range(40):
+        if analysis.history and rng.random() < 0.3:
+            analysis.undo()
+        else:
+            i, j = rng.choice(256, 2, replace=False)
+            analysis.swap(i, j)
+
+        profile = SBoxProfile(analysis.sbox)
+        assert np.array_equal(analysis.ddt, profile.ddt)
+        assert np.array_equal(analysis.lat, profile.lat)
+        assert analysis.nl == calc_nl_measure(profile)
+
+    print(" ✅ SUCCESS: DDT, LAT dan NL inkremental sama dengan perhitungan ulang!")
+
+def test_affine_profile_tables():
+    print("\n" + "="*50)
+    print("🧮 MULAI TEST PROFIL AFFINE (TABEL TURUNAN)")
+    print("="*50)
+
+    import numpy as np
+    from analytics import AffineProfile, AffineSBox, SBoxProfile
+    from analytics.affine import inverse_sbox, linear_map_table
+    from analytics.evaluate import METRIC_FUNCTIONS
+    from analytics.gf2 import random_invertible_matrices, unpack_matrix
+
+    rng = np.random.default_rng(47)
+    for packed in random_invertible_matrices(4, rng=rng):
+        matrix = unpack_matrix(packed)
+        constant = int(rng.integers(256))
+        values = (linear_map_table(matrix)[np.array(inverse_sbox())] ^ constant).tolist()
+
+        derived = AffineProfile(AffineSBox(values, matrix, constant))
+        fresh = SBoxProfile(values)
+        for table in ('ddt', 'walsh', 'lat', 'anf'):
+            assert np.array_equal(getattr(derived, table), getattr(fresh, table)), table
+        for name, function in METRIC_FUNCTIONS.items():
+            assert function(derived) == function(fresh), name
+        for name, value in derived.invariant_metrics.items():
+            assert value == METRIC_FUNCTIONS[name](fresh), name
+
+    print(" ✅ SUCCESS: Tabel & metrik AffineProfile sama dengan SBoxProfile!")
+
+def test_gf2_batch_matches_scalar():
+    print("\n" + "="*50)
+    print("🔢 MULAI TEST MATRIKS GF(2) BIT-PACKED (BATCH VS SKALAR)")
+    print("="*50)
+
+    import numpy as np
+    from analytics.gf2 import (
+        IDENTITY, gf2_inverse, gf2_inverse_batch, gf2_multiply, gf2_multiply_batch,
+        gf2_rank, gf2_rank_batch, is_invertible_batch, random_invertible_matrices,
+    )
+
+    rng = np.random.default_rng(49)
+    packed = rng.integers(0, 1 << 64, size=300, dtype=np.uint64)
+    # Tambahkan matriks singular yang pasti: nol, baris kembar, dan rank rendah
+    singular = np.array([0, 0x0101010101010101, 0x00000000000000FF, 0x0000000000000301], dtype=np.uint64)
+    packed = np.concatenate([packed, singular, np.array([IDENTITY], dtype=np.uint64)])
+
+    ranks = gf2_rank_batch(packed)
+    assert ranks.tolist() == [gf2_rank(int(p)) for p in packed]
+    assert (ranks[-len(singular) - 1 : -1] < 8).all()
+
+    inverse, valid = gf2_inverse_batch(packed)
+    assert valid.tolist() == (ranks == 8).tolist()
+    for p, inv, ok in zip(packed, inverse, valid):
+        if ok:
+            assert int(inv) == gf2_inverse(int(p))
+        else:
+            try:
+                gf2_inverse(int(p))
+                assert False, "matriks singular harus ditolak"
+            except ValueError:
+                pass
+
+    other = rng.permutation(packed)
+    product = gf2_multiply_batch(packed, other)
+    assert [int(v) for v in product] == [gf2_multiply(int(a), int(b)) for a, b in zip(packed, other)]
+
+    sampled = random_invertible_matrices(500, rng=rng)
+    assert sampled.shape == (500,) and is_invertible_batch(sampled).all()
+    assert all(gf2_multiply(int(p), gf2_inverse(int(p))) == IDENTITY for p in sampled[:50])
+
+    print(" ✅ SUCCESS: rank, invers, perkalian batch sama dengan versi skalar!")
+
+def test_evaluate_batch_matches_single():
+    print("\n" + "="*50)
+    print("📦 MULAI TEST EVALUASI BATCH")
+    print("="*50)
+
+    import json
+    import numpy as np
+    from analytics import evaluate_batch
+    from analytics.batch import BATCH_DTYPE
+    from analytics.evaluate import compute_metrics
+
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'sbox44.json')) as f:
+        sbox44 = json.load(f)['sbox44']
+    rng = np.random.default_rng(44)
+    sboxes = [list(SBOX), sbox44] + [rng.permutation(256).tolist() for _ in range(3)]
+
+    results = evaluate_batch(sboxes, sub_batch=2)
+    for sbox, row in zip(sboxes, results):
+        expected, _ = compute_metrics(sbox)
+        for name in BATCH_DTYPE.names:
+            if isinstance(expected[name], float):
+                assert abs(row[name] - expected[name]) < 1e-12, name
+            else:
+                assert row[name] == expected[name], name
+
+    print(" ✅ SUCCESS: evaluate_batch sama dengan evaluasi per S-box!")
+
+def test_screening_predicates():
+    print("\n" + "="*50)
+    print("🚦 MULAI TEST PREDIKAT SCREENING (EARLY-EXIT)")
+    print("="*50)
+
+    import numpy as np
+    from analytics import (
+        SBoxProfile, ad_at_least, bic_nl_at_least, dap_at_most, du_at_most, is_bijective,
+        lap_at_most, nl_at_least, sac_between, screen_sbox,
+    )
+    from analytics.evaluate import METRIC_FUNCTIONS
+
+    rng = np.random.default_rng(46)
+    sboxes = [list(SBOX), rng.permutation(256).tolist(), rng.integers(0, 256, 256).tolist()]
+    for sbox in sboxes:
+        profile = SBoxProfile(sbox)
+        exact = {name: METRIC_FUNCTIONS[name](profile) for name in ('nl', 'bic_nl', 'du', 'dap', 'lap', 'ad', 'sac')}
+        assert is_bijective(sbox) == (sorted(sbox) == list(range(256)))
+
+        # Ambang tepat di nilai metrik dan satu langkah di kedua sisinya
+        for delta in (-2, -1, 0, 1, 2):
+            assert nl_at_least(sbox, exact['nl'] + delta) == (exact['nl'] >= exact['nl'] + delta)
+            assert bic_nl_at_least(sbox, exact['bic_nl'] + delta) == (exact['bic_nl'] >= exact['bic_nl'] + delta)
+            assert du_at_most(sbox, exact['du'] + delta) == (exact['du'] <= exact['du'] + delta)
+            assert ad_at_least(sbox, exact['ad'] + delta) == (exact['ad'] >= exact['ad'] + delta)
+            dap = exact['dap'] + delta / 256
+            assert dap_at_most(sbox, dap) == (exact['dap'] <= dap)
+            lap = exact['lap'] + delta / 256
+            assert lap_at_most(sbox, lap) == (exact['lap'] <= lap)
+            low = exact['sac'] + delta / 1024
+            assert sac_between(sbox, (low, 1.0)) == (low <= exact['sac'])
+            assert sac_between(sbox, (0.0, low)) == (exact['sac'] <= low)
+
+        result = screen_sbox(sbox, {'bijective': True, 'du': exact['du'], 'nl': exact['nl'] + 1})
+        assert result['passed'] is False
+        assert result['failed'] == ('bijective' if not is_bijective(sbox) else 'nl')
+
+    print(" ✅ SUCCESS: predikat early-exit sama dengan perbandingan metrik eksak!")
+
+def test_search_reproducible():
+    print("\n" + "="*50)
+    print("🧬 MULAI TEST PENCARIAN S-BOX (SEED TETAP)")
+    print("="*50)
+
+    from analytics import SBoxProfile, calc_du_measure, calc_to_measure, weighted_score
+    from analytics.search import search_sboxes
+
+    weights = {'nl': 0.3, 'sac': 0.2, 'bic_nl': 0.1, 'bic_sac': 0.1, 'du': 0.1, 'lap': 0.1, 'to': 0.1}
+    serial = search_sboxes(weights=weights, islands=2, epochs=2, steps=40, seed=50, workers=1)
+    parallel = search_sboxes(weights=weights, islands=2, epochs=2, steps=40, seed=50, workers=2)
+
+    best = serial['best']
+    assert sorted(best['sbox']) == list(range(256))
+
+    profile = SBoxProfile(best['sbox'])
+    fresh = {
+        'nl': calc_nl_measure(profile), 'sac': calc_sac_measure(profile),
+        'bic_nl': calc_bic_nl_measure(profile), 'bic_sac': calc_bic_sac_measure(profile),
+        'du': calc_du_measure(profile), 'lap': calc_lap_measure(profile), 'to': calc_to_measure(profile),
+    }
+    assert best['metrics'] == fresh
+    assert best['score'] == weighted_score(fresh, weights)
+
+    assert parallel['best'] == best
+    assert parallel['history'] == serial['history']
+
+    print(" ✅ SUCCESS: hasil pencarian bijective, skor konsisten dan tidak bergantung jumlah worker!")
+
+def test_autotune_quick_keeps_thresholds():
+    print("\n" + "="*50)
+    print("⏱️ MULAI TEST AUTOTUNE QUICK (THRESHOLD)")
+    print("="*50)
+
+    import tempfile
+    from aes_engine.autotune import autotune
+    from aes_engine.modes import DEFAULT_ENGINE_THRESHOLDS
+    from aes_engine.tuning import _cache, load_tuning, save_tuning
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Tanpa tuning sebelumnya: threshold yang tidak diukur tidak ditulis (default tetap berlaku)
+        fresh = os.path.join(tmp, 'fresh.json')
+        autotune(path=fresh, quick=True, verbose=False)
+        _cache.clear()
+        thresholds = load_tuning(fresh)['thresholds']
+        assert 'process_min_bytes' not in thresholds
+        if load_tuning(fresh)['workers'] == 1:
+            # Crossover thread tidak diukur jika hanya 1 worker yang sepadan
+            assert 'thread_min_bytes' not in thresholds
+        merged = dict(DEFAULT_ENGINE_THRESHOLDS, **thresholds)
+        assert merged['process_min_bytes'] == DEFAULT_ENGINE_THRESHOLDS['process_min_bytes']
+
+        # Hasil autotune lengkap sebelumnya dipertahankan oleh autotune quick
+        measured = os.path.join(tmp, 'measured.json')
+        save_tuning({'thresholds': {'process_min_bytes': 8 * 1024 * 1024}}, measured)
+        autotune(path=measured, quick=True, verbose=False)
+        _cache.clear()
+        assert load_tuning(measured)['thresholds']['process_min_bytes'] == 8 * 1024 * 1024
+    _cache.clear()
+
+    print(" ✅ SUCCESS: autotune quick tidak menimpa threshold yang tidak diukur!")
+
 if __name__ == "__main__":
     test_encryption_flow()
-    test_analytics()
\ No newline at end of file
+    test_buffer_into_flow()
+    test_stream_modes_flow()
+    test_xts_flow()
+    test_analytics()
+    test_incremental_swap_undo()
+    test_affine_profile_tables()
+    test_gf2_batch_matches_scalar()
+    test_evaluate_batch_matches_single()
+    test_screening_predicates()
+    test_search_reproducible()
+    test_autotune_quick_keeps_thresholds()